@@ -0,0 +1,38 @@
+import argparse
+from simulation.benchmark import SCALES, run_suite, compare, save, load
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time World.update and World.draw at several population sizes")
+    parser.add_argument('--scales', type=int, nargs='+', default=list(SCALES), help="Creature counts to run")
+    parser.add_argument('--bushes', type=int, default=None, help="Bush count for every scale (default: per scale)")
+    parser.add_argument('--engine', choices=['objects', 'vector'], default='objects')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--ticks', type=int, default=200, help="Timed updates per scale")
+    parser.add_argument('--draws', type=int, default=20, help="Timed draws per scale (0 to skip)")
+    parser.add_argument('--max-seconds', type=float, default=10.0, help="Time budget per scale for updates and for draws")
+    parser.add_argument('--no-memory', action='store_true', help="Skip the tracemalloc peak memory pass")
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--compare', default=None, help="Earlier results file to compare ticks/sec against")
+    args = parser.parse_args()
+
+    scales = {n: args.bushes or SCALES.get(n, 4) for n in args.scales}
+    report = run_suite(scales, seed=args.seed, engine=args.engine, ticks=args.ticks, draws=args.draws,
+                       max_seconds=args.max_seconds, memory_ticks=None if args.no_memory else 5)
+    save(report, args.output)
+
+    print(f"{'creatures':>9} {'ticks/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'draw p50':>9} {'peak MiB':>9}")
+    for r in report['results']:
+        draw = f"{r['draw']['p50_ms']:9.2f}" if r['draw'] else f"{'-':>9}"
+        memory = f"{r['peak_memory_bytes'] / 2 ** 20:9.1f}" if r['peak_memory_bytes'] is not None else f"{'-':>9}"
+        print(f"{r['creatures']:>9} {r['ticks_per_sec']:9.1f} {r['update']['p50_ms']:8.2f} {r['update']['p99_ms']:8.2f} {draw} {memory}")
+
+    if args.compare:
+        print(f"\nCompared with {args.compare}:")
+        for creatures, engine, old, new, ratio in compare(load(args.compare), report):
+            print(f"{creatures:>9} {engine}: {old:.1f} -> {new:.1f} ticks/s ({ratio:.2f}x)")
+    print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 SIMULATION_SPEED = 12  # Speed multiplier for the game loop
+TARGET_FPS = 60  # Rendered frames per second in the viewer
 REPRODUCTION_COOLDOWN = 300  # Frames between allowed reproductions
 REST_ENERGY_GAIN = 1  # Energy gained per frame while resting (not moving)
 ENERGY_MAX = 150  # Maximum energy a creature can have
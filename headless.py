@@ -0,0 +1,123 @@
+import argparse
+import json
+import os
+from config import LOG_INTERVAL, CREATURE_COUNT
+from simulation.checkpoint import Checkpointer, branch_directory, list_checkpoints, resume_world
+from simulation.profiler import PhaseProfiler
+from simulation.recorder import HistoryRecorder
+from simulation.runner import run_headless, survivor_data
+from simulation.writer import BackgroundWriter, write_json
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the simulation without a display")
+    parser.add_argument('--frames', type=int, default=None, help="Stop after this many frames (default: until extinction)")
+    parser.add_argument('--render-every', type=int, default=0, help="Open a window and draw every K frames (objects engine only)")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--engine', choices=['objects', 'vector'], default='objects')
+    parser.add_argument('--creatures', type=int, default=None, help="Initial population")
+    parser.add_argument('--survivors', default=None, help="Seed the population from a best_survivor.json file")
+    parser.add_argument('--save-survivors', default=None, help="Write the oldest survivors to this file")
+    parser.add_argument('--record', default=None, help="Stream history to this directory instead of keeping it in memory")
+    parser.add_argument('--log-interval', type=int, default=LOG_INTERVAL, help="Frames between history rows")
+    parser.add_argument('--checkpoint-dir', default=None, help="Write periodic world checkpoints here")
+    parser.add_argument('--checkpoint-every', type=int, default=10000, help="Frames between checkpoints")
+    parser.add_argument('--resume', default=None, help="Continue from this checkpoint file")
+    parser.add_argument('--profile', action='store_true', help="Time each phase of World.update and print a breakdown")
+    parser.add_argument('--branch-seed', type=int, default=None, help="Reseed a resumed world to branch the run")
+    args = parser.parse_args()
+    if args.render_every and args.engine == 'vector' and not args.resume:
+        parser.error("--render-every is only supported by the objects engine")
+    # History chunks, checkpoints and the survivor dump all go through one
+    # background writer so the tick loop never waits on the disk
+    writer = BackgroundWriter()
+
+    creature_count = args.creatures if args.creatures is not None else CREATURE_COUNT
+    if args.resume:
+        world = resume_world(args.resume, seed=args.branch_seed)
+        # Continue the recording from the rows it had at the checkpoint
+        recorder = HistoryRecorder(args.record, writer=writer, resume_rows=world.recorded_rows) if args.record else None
+        world.recorder = recorder
+        if args.render_every and not hasattr(world, 'bushes'):
+            parser.error("--render-every is only supported by the objects engine, and this checkpoint is a vector world")
+        render = make_renderer() if args.render_every else None
+    elif args.engine == 'vector':
+        recorder = HistoryRecorder(args.record, writer=writer) if args.record else None
+        from simulation.vectorized import VectorWorld
+        world = VectorWorld(creature_count=creature_count, seed=args.seed, recorder=recorder,
+                            log_interval=args.log_interval)
+        render = None
+    else:
+        recorder = HistoryRecorder(args.record, writer=writer) if args.record else None
+        from simulation.world import World
+        best_survivors_data = None
+        if args.survivors and os.path.exists(args.survivors):
+            with open(args.survivors, 'r') as f:
+                best_survivors_data = json.load(f)
+        world = World(best_survivors_data=best_survivors_data, seed=args.seed, recorder=recorder,
+                      log_interval=args.log_interval, creature_count=creature_count)
+        render = make_renderer() if args.render_every else None
+
+    checkpointer = None
+    if args.checkpoint_dir:
+        directory, start = args.checkpoint_dir, None
+        if args.resume:
+            start = world.frame_count
+            # A branch, or a resume behind the directory's newest checkpoint,
+            # gets its own directory instead of overwriting another run's files
+            if args.branch_seed is not None or any(frame > start for frame, _ in list_checkpoints(directory)):
+                directory = branch_directory(directory, start, args.branch_seed)
+                print(f"Checkpoints for this run go to {directory}")
+        checkpointer = Checkpointer(directory, every=args.checkpoint_every, writer=writer, start_frame=start)
+
+    if args.profile:
+        if hasattr(world, 'profiler'):
+            world.profiler = PhaseProfiler()
+        else:
+            print("--profile is only supported by the objects engine")
+
+    try:
+        result = run_headless(world, max_frames=args.frames, render_every=args.render_every, render=render,
+                              checkpointer=checkpointer)
+    finally:
+        if recorder is not None:
+            recorder.flush()
+    print(f"Frames: {result['frames']} in {result['elapsed']:.2f}s ({result['ticks_per_sec']:.0f} ticks/sec)")
+    print(f"Population: {result['population']}")
+    print("Death Cause Totals:")
+    for cause, count in result['death_causes'].items():
+        print(f"{cause.title()}: {count}")
+    if recorder is not None:
+        print(f"History: {len(recorder)} rows in {args.record}")
+    if 'profile' in result:
+        print("Profile:")
+        for line in world.profiler.lines():
+            print(f"  {line}")
+
+    if args.save_survivors:
+        writer.submit(write_json, args.save_survivors, survivor_data(world))
+    # Everything queued is on disk once this returns
+    writer.close()
+
+
+def make_renderer():
+    import pygame
+    from config import SCREEN_WIDTH, SCREEN_HEIGHT
+    from simulation.render import Renderer
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Evolution Simulation (headless)")
+    renderer = Renderer(screen)
+
+    def render(world):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+        renderer.draw(world)
+        renderer.present()
+        return True
+    return render
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,11 @@
 import pygame
 import matplotlib.pyplot as plt
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, SIMULATION_SPEED
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, SIMULATION_SPEED, TARGET_FPS
 from simulation.world import World
+from simulation.render import Renderer
+from simulation.scheduler import TickScheduler
+from simulation.runner import survivor_data
+from simulation.profiler import PhaseProfiler
 import os, json
 
 def main():
@@ -20,12 +24,18 @@ def main():
     running = True
     selected_creature = None
     font = pygame.font.SysFont(None, 24)
+    renderer = Renderer(screen)
+    # Start at SIMULATION_SPEED ticks per frame, then let simulation fill
+    # about three quarters of each frame's time
+    scheduler = TickScheduler(ticks_per_frame=SIMULATION_SPEED, budget=0.75 / TARGET_FPS)
+    caption = None
     while running:
-        screen.fill((0, 255, 0))
-
         for event in pygame.event.get():
             if event.type == pygame.QUIT or world.creatures == []:
                 running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_p:
+                # Toggle the per-phase profile overlay
+                world.profiler = None if world.profiler else PhaseProfiler()
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 mx, my = event.pos
                 # Check if a creature was clicked (topmost first)
@@ -37,15 +47,15 @@ def main():
                     # If no creature was clicked, clear selection
                     selected_creature = None
 
-        world.update()
-        world.draw(screen)
+        scheduler.step(world)
+        renderer.draw(world)
 
         # Highlight selected creature
         if selected_creature in world.creatures:
-            pygame.draw.rect(
+            renderer.mark_dirty(pygame.draw.rect(
                 screen, (255, 255, 0),
                 (selected_creature.x, selected_creature.y, 40, 40), 3
-            )
+            ))
             info_lines = [
                 f"Sex: {getattr(selected_creature, 'sex', '?')}",
                 f"Energy: {selected_creature.energy:.1f}",
@@ -59,7 +69,7 @@ def main():
             ]
             box_width = 200
             box_height = 20 * len(info_lines) + 10
-            pygame.draw.rect(screen, (240, 240, 240), (5, 5, box_width, box_height))
+            renderer.mark_dirty(pygame.draw.rect(screen, (240, 240, 240), (5, 5, box_width, box_height)))
             pygame.draw.rect(screen, (0, 0, 0), (5, 5, box_width, box_height), 2)
             for i, line in enumerate(info_lines):
                 text = font.render(line, True, (0, 0, 0))
@@ -67,8 +77,24 @@ def main():
         else:
             selected_creature = None
 
-        pygame.display.flip()
-        clock.tick(SIMULATION_SPEED * 60)
+        if world.profiler is not None:
+            lines = world.profiler.lines()
+            box_height = 20 * len(lines) + 10
+            box = (5, SCREEN_HEIGHT - box_height - 5, 260, box_height)
+            renderer.mark_dirty(pygame.draw.rect(screen, (240, 240, 240), box))
+            pygame.draw.rect(screen, (0, 0, 0), box, 2)
+            for i, line in enumerate(lines):
+                screen.blit(font.render(line, True, (0, 0, 0)), (15, box[1] + 5 + i * 20))
+            # Keep the numbers about the last second rather than the whole run
+            if world.profiler.ticks >= max(1, scheduler.ticks_per_sec):
+                world.profiler.reset()
+
+        renderer.present()
+        new_caption = f"Evolution Simulation - {scheduler.ticks_per_sec:.0f} ticks/s, {scheduler.frames_per_sec:.0f} fps"
+        if new_caption != caption:
+            caption = new_caption
+            pygame.display.set_caption(caption)
+        clock.tick(TARGET_FPS)
 
     plot_data(world)
     pygame.quit()
@@ -132,19 +158,8 @@ def plot_data(world):
 
     # Save top 2 survivors
     if world.history and world.creatures == []:
-        if hasattr(world, 'last_population') and world.last_population:
-            sorted_survivors = sorted(world.last_population, key=lambda c: getattr(c, 'age', 0), reverse=True)
-            top2 = sorted_survivors[:2]
-            data = []
-            for best in top2:
-                data.append({
-                    'genes': best.genes,
-                    'brain': {
-                        'input_weights': best.brain['input_weights'].tolist(),
-                        'hidden_weights': best.brain['hidden_weights'].tolist()
-                    },
-                    'sex': best.sex
-                })
+        data = survivor_data(world)
+        if data:
             with open('best_survivor.json', 'w') as f:
                 json.dump(data, f)
 
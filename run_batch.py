@@ -0,0 +1,33 @@
+import argparse
+import json
+from simulation.batch import run_batch
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run many headless worlds in parallel")
+    parser.add_argument('--runs', type=int, default=8)
+    parser.add_argument('--seed', type=int, default=0, help="Seed of the first run; run i uses seed + i "
+                             "(lockstep seeds the whole batch with it instead)")
+    parser.add_argument('--frames', type=int, default=None, help="Frame limit per run (default: until extinction)")
+    parser.add_argument('--processes', type=int, default=None, help="Worker processes (default: one per core)")
+    parser.add_argument('--engine', choices=['objects', 'vector', 'lockstep'], default='objects',
+                        help="lockstep steps every run together in this process as one batch seeded by --seed; "
+                             "runs are then identified by batch_seed and world (ignores --processes)")
+    parser.add_argument('--creatures', type=int, default=None, help="Initial population")
+    parser.add_argument('--output', default='batch_results.json')
+    args = parser.parse_args()
+
+    seeds = range(args.seed, args.seed + args.runs)
+    result = run_batch(seeds, max_frames=args.frames, processes=args.processes,
+                       engine=args.engine, creature_count=args.creatures)
+    with open(args.output, 'w') as f:
+        json.dump(result, f)
+
+    print(f"Runs: {len(result['runs'])}, extinct: {result['extinct']}, mean frames: {result['mean_frames']:.0f}")
+    print("Death Cause Totals:")
+    for cause, count in result['death_causes'].items():
+        print(f"{cause.title()}: {count}")
+
+
+if __name__ == "__main__":
+    main()
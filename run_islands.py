@@ -0,0 +1,32 @@
+import argparse
+from simulation.islands import run_islands
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evolve several island worlds over many generations")
+    parser.add_argument('--islands', type=int, default=4)
+    parser.add_argument('--generations', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--frames', type=int, default=None, help="Frame limit per generation (default: until extinction)")
+    parser.add_argument('--creatures', type=int, default=None, help="Population each generation starts with")
+    parser.add_argument('--survivors', type=int, default=2, help="Survivors carried into the next generation")
+    parser.add_argument('--migrate-every', type=int, default=5, help="Generations between migrations (0 to never migrate)")
+    parser.add_argument('--migrants', type=int, default=1, help="Survivors each island sends to the next one")
+    parser.add_argument('--processes', type=int, default=None, help="Worker processes (default: one per core)")
+    parser.add_argument('--output', default='islands.jsonl', help="Per-generation summaries, one JSON object per line (replaced unless --resume)")
+    parser.add_argument('--resume', action='store_true', help="Continue from the last generation in --output")
+    args = parser.parse_args()
+
+    def report(summary):
+        print(f"Generation {summary['generation']}: best island {summary['best_island']} "
+              f"({summary['best_fitness'][0]} frames), mean {summary['mean_frames']:.0f} frames"
+              + (" [migration]" if summary['migrants'] else ""))
+
+    run_islands(islands=args.islands, generations=args.generations, seed=args.seed, max_frames=args.frames,
+                creature_count=args.creatures, survivor_count=args.survivors, migrate_every=args.migrate_every,
+                migrants=args.migrants, processes=args.processes, output=args.output, resume=args.resume,
+                on_generation=report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import argparse
+import json
+from simulation.settings import SimulationConfig
+from simulation.sweep import grid, random_points, run_sweep
+
+
+def parse_param(text):
+    # name=v1,v2,v3 for a grid or a random choice; name=low:high for a random range
+    name, _, values = text.partition('=')
+    name = name.strip().lower()
+    try:
+        if ':' in values:
+            low, high = values.split(':')
+            return name, (SimulationConfig.cast(name, low), SimulationConfig.cast(name, high))
+        return name, [SimulationConfig.cast(name, v) for v in values.split(',')]
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the simulation over a grid or random sample of settings")
+    parser.add_argument('--param', action='append', default=[], type=parse_param,
+                        help="Setting to vary, e.g. mutation_rate=0.05,0.15,0.3 or hunger_threshold=150:250")
+    parser.add_argument('--random', type=int, default=0, help="Sample this many random points instead of the full grid")
+    parser.add_argument('--seeds', type=int, default=1, help="Seeds per point")
+    parser.add_argument('--seed', type=int, default=0, help="First seed (and the random sampling seed)")
+    parser.add_argument('--frames', type=int, default=None, help="Frame limit per run (default: until extinction)")
+    parser.add_argument('--processes', type=int, default=None, help="Worker processes (default: one per core)")
+    parser.add_argument('--cache-dir', default='.sweep_cache', help="Reuse results stored here ('' to disable)")
+    parser.add_argument('--output', default='sweep_results.json')
+    args = parser.parse_args()
+
+    space = dict(args.param)
+    if args.random:
+        points = random_points(space, args.random, seed=args.seed)
+    else:
+        if any(isinstance(v, tuple) for v in space.values()):
+            parser.error("low:high ranges need --random")
+        points = grid(space)
+    seeds = range(args.seed, args.seed + args.seeds)
+    rows = run_sweep(points, seeds=seeds, max_frames=args.frames, processes=args.processes,
+                     cache_dir=args.cache_dir or None)
+    with open(args.output, 'w') as f:
+        json.dump(rows, f)
+
+    print(f"Runs: {len(rows)} ({sum(row['cached'] for row in rows)} from cache)")
+    for row in rows:
+        result = row['result']
+        print(f"{row['overrides']} seed {row['seed']}: {result['frames']} frames, population {result['population']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import os
+from collections import OrderedDict
+from functools import lru_cache
+
+# Sprites are only needed for drawing, so pygame and the image files are
+# loaded on first use instead of when the simulation modules are imported.
+ASSET_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets')
+
+
+@lru_cache(maxsize=None)
+def get_sprite(name, size):
+    import pygame
+    return pygame.transform.scale(pygame.image.load(os.path.join(ASSET_DIR, name)), size)
+
+
+class TintCache:
+    # Bounded LRU of creature sprites tinted by color gene. Channels are
+    # snapped to multiples of `quantize` so near-identical colors share a surface.
+    def __init__(self, name='creature.png', size=(40, 40), maxsize=512, quantize=4):
+        self.name = name
+        self.size = size
+        self.maxsize = maxsize
+        self.quantize = quantize
+        self.sprites = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, r, g, b):
+        q = self.quantize
+        return tuple(min(255, int(c) // q * q) for c in (r, g, b))
+
+    def get(self, r, g, b):
+        key = self.key(r, g, b)
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            self.sprites.move_to_end(key)
+            return sprite
+        self.misses += 1
+        sprite = self._tint(key)
+        self.sprites[key] = sprite
+        if len(self.sprites) > self.maxsize:
+            self.sprites.popitem(last=False)
+        return sprite
+
+    def _tint(self, color):
+        import pygame
+        # Multiply the base sprite by the color, keeping its alpha
+        sprite = get_sprite(self.name, self.size).copy()
+        tint = pygame.Surface(sprite.get_size(), pygame.SRCALPHA)
+        tint.fill((*color, 255))
+        sprite.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        return sprite
+
+    def clear(self):
+        self.sprites.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Shared by every creature's draw()
+CREATURE_SPRITES = TintCache()
@@ -0,0 +1,69 @@
+from multiprocessing import Pool
+from simulation.runner import run_headless, survivor_data
+from config import CREATURE_COUNT
+
+
+def make_world(seed, engine='objects', creature_count=None, best_survivors_data=None, bush_count=4):
+    creature_count = creature_count if creature_count is not None else CREATURE_COUNT
+    if engine == 'vector':
+        from simulation.vectorized import VectorWorld
+        return VectorWorld(creature_count=creature_count, bush_count=bush_count, seed=seed)
+    from simulation.world import World
+    return World(best_survivors_data=best_survivors_data, seed=seed, creature_count=creature_count,
+                 bush_count=bush_count)
+
+
+def run_trial(spec):
+    # One headless run; spec is a plain dict so it can be sent to a worker process
+    world = make_world(spec['seed'], spec.get('engine', 'objects'), spec.get('creature_count'),
+                       spec.get('best_survivors_data'), spec.get('bush_count', 4))
+    result = run_headless(world, max_frames=spec.get('max_frames'))
+    result['seed'] = spec['seed']
+    result['history'] = list(world.history)
+    result['survivors'] = survivor_data(world, spec.get('survivor_count', 2))
+    return result
+
+
+def run_lockstep(seeds, max_frames=None, creature_count=None, survivor_count=2, bush_count=4):
+    # Every run as one world of a single LockstepWorlds batch in this process.
+    # The batch is seeded with the first seed, so runs are reproducible as a
+    # batch rather than one by one.
+    from simulation.lockstep import LockstepWorlds
+    seeds = list(seeds)
+    worlds = LockstepWorlds(len(seeds), creature_count=creature_count if creature_count is not None else CREATURE_COUNT,
+                            bush_count=bush_count, seed=seeds[0] if seeds else None)
+    elapsed = worlds.run(max_frames)
+    runs = worlds.results(survivor_count)
+    for run in runs:
+        run['batch_seed'] = seeds[0] if seeds else None
+        run['elapsed'] = elapsed
+    return runs
+
+
+def run_batch(seeds, max_frames=None, processes=None, **spec):
+    # Run one trial per seed across a process pool and aggregate the results
+    if spec.get('engine') == 'lockstep':
+        return aggregate(run_lockstep(seeds, max_frames, spec.get('creature_count'), spec.get('survivor_count', 2),
+                                      spec.get('bush_count', 4)))
+    specs = [dict(spec, seed=seed, max_frames=max_frames) for seed in seeds]
+    if processes == 1:
+        runs = [run_trial(s) for s in specs]
+    else:
+        with Pool(processes) as pool:
+            runs = pool.map(run_trial, specs)
+    return aggregate(runs)
+
+
+def aggregate(runs):
+    death_causes = {}
+    for run in runs:
+        for cause, count in run['death_causes'].items():
+            death_causes[cause] = death_causes.get(cause, 0) + count
+    frames = [run['frames'] for run in runs]
+    return {
+        'runs': runs,
+        'death_causes': death_causes,
+        'extinct': sum(1 for run in runs if run['population'] == 0),
+        'mean_frames': sum(frames) / len(frames) if frames else 0,
+        'survivors': [s for run in runs for s in run['survivors']],
+    }
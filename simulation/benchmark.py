@@ -0,0 +1,130 @@
+import gc
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+from simulation.batch import make_world
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# (creatures, bushes) per scale; bush placement tops out well below 64 on the default map
+SCALES = {
+    20: 4,
+    500: 8,
+    5000: 16,
+    50000: 32,
+}
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+def timings(samples):
+    total = sum(samples)
+    return {
+        'count': len(samples),
+        'per_sec': len(samples) / total if total > 0 else 0.0,
+        'mean_ms': 1000 * total / len(samples) if samples else 0.0,
+        'p50_ms': 1000 * percentile(samples, 50),
+        'p99_ms': 1000 * percentile(samples, 99),
+    }
+
+
+def time_calls(fn, count, max_seconds):
+    # Call fn up to `count` times, stopping early once max_seconds have passed
+    samples = []
+    deadline = time.perf_counter() + max_seconds
+    while len(samples) < count:
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+        if time.perf_counter() > deadline:
+            break
+    return samples
+
+
+def peak_memory(creatures, bushes, seed, engine, ticks):
+    # Separate pass: tracemalloc slows everything down, so it never overlaps the timings
+    gc.collect()
+    tracemalloc.start()
+    try:
+        world = make_world(seed, engine, creatures, bush_count=bushes)
+        for _ in range(ticks):
+            world.update()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_scale(creatures, bushes=4, seed=0, engine='objects', ticks=200, warmup=10, draws=20,
+                max_seconds=10.0, memory_ticks=5):
+    start = time.perf_counter()
+    world = make_world(seed, engine, creatures, bush_count=bushes)
+    build = time.perf_counter() - start
+    for _ in range(warmup):
+        world.update()
+    result = {
+        'creatures': creatures,
+        'bushes': len(world.bushes) if hasattr(world, 'bushes') else bushes,
+        'engine': engine,
+        'seed': seed,
+        'build_sec': build,
+        'update': timings(time_calls(world.update, ticks, max_seconds)),
+        'population_after': world.population,
+    }
+    result['ticks_per_sec'] = result['update']['per_sec']
+
+    # Draw onto an offscreen surface; VectorWorld has no draw()
+    result['draw'] = None
+    if draws and hasattr(world, 'draw'):
+        import pygame
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        result['draw'] = timings(time_calls(lambda: world.draw(surface), draws, max_seconds))
+
+    result['peak_memory_bytes'] = peak_memory(creatures, bushes, seed, engine, memory_ticks) if memory_ticks is not None else None
+    return result
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(scales=SCALES, **options):
+    return {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': [bench_scale(creatures, bushes, **options) for creatures, bushes in scales.items()],
+    }
+
+
+def compare(old, new):
+    # [(creatures, engine, old ticks/sec, new ticks/sec, ratio)] for scales present in both runs
+    before = {(r['creatures'], r['engine']): r for r in old['results']}
+    rows = []
+    for r in new['results']:
+        prev = before.get((r['creatures'], r['engine']))
+        if prev is not None:
+            ratio = r['ticks_per_sec'] / prev['ticks_per_sec'] if prev['ticks_per_sec'] else float('inf')
+            rows.append((r['creatures'], r['engine'], prev['ticks_per_sec'], r['ticks_per_sec'], ratio))
+    return rows
+
+
+def save(report, path):
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
@@ -1,35 +1,46 @@
-import pygame
 import random
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, LAKE_X, LAKE_Y, LAKE_WIDTH, LAKE_HEIGHT
+from simulation.assets import get_sprite
+from simulation.terrain import DEFAULT_TERRAIN
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, FOOD_SPAWN_INTERVAL
 
 class Bush:
-    BUSH_SPRITE = pygame.transform.scale(pygame.image.load('assets/bush.png'), (64, 64))
-
-    def __init__(self, x=None, y=None):
+    def __init__(self, x=None, y=None, rng=None, terrain=None, regrow_interval=FOOD_SPAWN_INTERVAL):
+        self.rng = rng if rng is not None else random
+        self.regrow_interval = regrow_interval  # frames between growth attempts
+        terrain = terrain if terrain is not None else DEFAULT_TERRAIN
         # Try random positions until not in lake
         while True:
-            self.x = x if x is not None else random.randint(0, SCREEN_WIDTH - 64)
-            self.y = y if y is not None else random.randint(0, SCREEN_HEIGHT - 64)
+            self.x = x if x is not None else self.rng.randint(0, SCREEN_WIDTH - 64)
+            self.y = y if y is not None else self.rng.randint(0, SCREEN_HEIGHT - 64)
             # Check if bush is outside the lake
-            bush_rect = pygame.Rect(self.x, self.y, 64, 64)
-            lake_rect = pygame.Rect(LAKE_X, LAKE_Y, LAKE_WIDTH, LAKE_HEIGHT)
-            if not bush_rect.colliderect(lake_rect):
+            if not terrain.rect_touches_lake(self.x, self.y, 64, 64):
                 break
         self.food = []  # List of Food objects growing on this bush
+        self.food_grid = None  # World's FoodRegistry (or any SpatialGrid), kept in sync as food grows/is eaten
 
     def grow_food(self, FoodClass, max_food=3):
         # Only grow food if less than max_food on bush
         if len(self.food) < max_food:
             # Place food at bush center (or random offset for variety)
-            fx = self.x + 24 + random.randint(-16, 16)
-            fy = self.y + 24 + random.randint(-16, 16)
-            self.food.append(FoodClass(fx, fy))
+            fx = self.x + 24 + self.rng.randint(-16, 16)
+            fy = self.y + 24 + self.rng.randint(-16, 16)
+            food = FoodClass(fx, fy)
+            food.bush = self
+            self.food.append(food)
+            if self.food_grid is not None:
+                self.food_grid.insert(food)
 
     def remove_food(self, food_obj):
+        # At most max_food items, so the list scan stays constant time
         if food_obj in self.food:
             self.food.remove(food_obj)
+            if self.food_grid is not None:
+                self.food_grid.remove(food_obj)
+
+    def draw_base(self, screen):
+        return screen.blit(get_sprite('bush.png', (64, 64)), (self.x, self.y))
 
     def draw(self, screen):
-        screen.blit(self.BUSH_SPRITE, (self.x, self.y))
+        self.draw_base(screen)
         for food in self.food:
             food.draw(screen)
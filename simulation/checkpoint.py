@@ -0,0 +1,130 @@
+import os
+import pickle
+import random
+import zlib
+from simulation.writer import BackgroundWriter, write_bytes
+
+# Checkpoint file: magic header, then a zlib-compressed pickle of the whole
+# world (creatures, bushes, food, RNG state, counters, history, death causes).
+# Checkpoints are pickles, so only load files you wrote yourself.
+MAGIC = b'EVOSNAP1'
+
+
+def snapshot(world):
+    # Freeze the world into bytes. This is the only part that has to run on
+    # the simulation thread; compressing and writing can happen elsewhere.
+    return pickle.dumps(world, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def write_snapshot(payload, path, level=1):
+    # Written through a temp file so a crash mid-write never leaves a torn checkpoint
+    write_bytes(path, MAGIC + zlib.compress(payload, level))
+
+
+def save_checkpoint(world, path):
+    write_snapshot(snapshot(world), path)
+
+
+def load_checkpoint(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    if not data.startswith(MAGIC):
+        raise ValueError(f"{path} is not a world checkpoint")
+    return pickle.loads(zlib.decompress(data[len(MAGIC):]))
+
+
+def resume_world(path, seed=None, recorder=None):
+    # Load a checkpoint to continue the run. A new seed branches it from that
+    # state instead of replaying it.
+    world = load_checkpoint(path)
+    if seed is not None:
+        world.seed = seed
+        if isinstance(world.rng, random.Random):
+            world.rng.seed(seed)  # same object the creatures and bushes hold
+        else:
+            import numpy as np
+            world.rng = np.random.default_rng(seed)
+    world.recorder = recorder
+    return world
+
+
+def list_checkpoints(directory):
+    # (frame, path) for the checkpoints in a directory, oldest first
+    if not os.path.isdir(directory):
+        return []
+    return sorted((int(name[len('checkpoint_'):-len('.ckpt')]), os.path.join(directory, name))
+                  for name in os.listdir(directory) if name.startswith('checkpoint_') and name.endswith('.ckpt'))
+
+
+def branch_directory(directory, frame, seed=None):
+    # Sibling directory for a run continued from `frame` (and reseeded with
+    # `seed`), so it never touches the checkpoints of the run it came from
+    suffix = f"-from{frame}" + (f"-seed{seed}" if seed is not None else "")
+    return directory.rstrip(os.sep) + suffix
+
+
+class Checkpointer:
+    # Saves a checkpoint every `every` frames into `directory`, keeping the
+    # newest `keep` files. The world is pickled on the calling thread; the
+    # compress + write goes to a BackgroundWriter (a shared one if given,
+    # otherwise a private one that holds a single pending save).
+    # A resumed run passes the frame it starts from as start_frame: existing
+    # checkpoints up to that frame are its own history and count towards
+    # `keep`, later ones belong to another continuation and are never pruned
+    # or overwritten. Without start_frame the run owns everything there.
+    def __init__(self, directory, every=10000, keep=3, writer=None, start_frame=None):
+        self.directory = directory
+        self.every = every
+        self.keep = keep
+        self.owns_writer = writer is None
+        self.writer = writer if writer is not None else BackgroundWriter(maxsize=1, name='checkpoint-writer')
+        os.makedirs(directory, exist_ok=True)
+        existing = list_checkpoints(directory)
+        # Oldest first
+        self.saved = [path for frame, path in existing if start_frame is None or frame <= start_frame]
+        self.foreign = {path for frame, path in existing if start_frame is not None and frame > start_frame}
+
+    def path_for(self, frame):
+        return os.path.join(self.directory, f"checkpoint_{frame:010d}.ckpt")
+
+    def step(self, world):
+        if self.every and world.frame_count % self.every == 0:
+            self.save(world)
+
+    def save(self, world):
+        # Bookkeeping stays on this thread; the writer only writes the new
+        # checkpoint and then deletes the ones it replaces
+        path = self.path_for(world.frame_count)
+        if path in self.foreign:
+            raise FileExistsError(f"{path} was written by another run; checkpoint this one into a new directory")
+        # History up to this frame reaches the disk before (or, on a shared
+        # writer, in order with) the checkpoint that counts it
+        recorder = getattr(world, 'recorder', None)
+        if recorder is not None:
+            recorder.flush()
+        if path in self.saved:
+            self.saved.remove(path)
+        self.saved.append(path)
+        stale = self.saved[:-max(self.keep, 1)]
+        del self.saved[:len(stale)]
+        self.writer.submit(self._write, snapshot(world), path, stale)
+        return path
+
+    def _write(self, payload, path, stale):
+        write_snapshot(payload, path)
+        for old in stale:
+            if os.path.exists(old):
+                os.remove(old)
+
+    def wait(self):
+        self.writer.flush()
+
+    def close(self):
+        if self.owns_writer:
+            self.writer.close()
+        else:
+            self.writer.flush()
+
+    def latest(self):
+        # Path of the newest checkpoint; call wait() first to be sure it is on disk
+        return self.saved[-1] if self.saved else None
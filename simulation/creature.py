@@ -1,112 +1,107 @@
 import random
-import random
-import pygame
 import math
+from simulation.assets import CREATURE_SPRITES
 from simulation.utils import clamp, sign
-from config import MUTATION_RATE, ENERGY_MAX, ENERGY_COST_PER_UNIT, VISION_MIN, VISION_MAX, SPEED_MIN, SPEED_MAX, HUNGER_MAX, HUNGER_THRESHOLD
-from config import LAKE_X, LAKE_Y, LAKE_WIDTH, LAKE_HEIGHT, THIRST_MAX, THIRST_THRESHOLD, REST_ENERGY_GAIN
-
-# Load and scale the creature sprite once (as a class variable)
-CREATURE_SPRITE = pygame.transform.scale(
-    pygame.image.load('assets/creature.png'), (40, 40)
-)
+from simulation.genes import Genes, crossover, mutate
+from simulation.terrain import DEFAULT_TERRAIN
+from simulation.settings import DEFAULT_CONFIG
+from config import LAKE_X, LAKE_Y, LAKE_WIDTH, LAKE_HEIGHT
 
 class Creature:
-    def __init__(self, x, y, genes = None, sex=None):
-        # Prevent spawning with center in the lake ellipse
-        while True:
-            cx = x + 20
-            cy = y + 20
-            lx = LAKE_X + LAKE_WIDTH / 2
-            ly = LAKE_Y + LAKE_HEIGHT / 2
-            rx = LAKE_WIDTH / 2
-            ry = LAKE_HEIGHT / 2
-            in_lake = ((cx - lx) / rx) ** 2 + ((cy - ly) / ry) ** 2 <= 1
-            if not in_lake:
-                break
-            x = random.randint(0, 800 - 40)
-            y = random.randint(0, 600 - 40)
+    # Slots instead of a per-instance __dict__; death_cause is only set on death
+    __slots__ = (
+        'rng', 'terrain', 'x', 'y', 'target', 'energy', 'age', 'hunger', 'thirst', 'genes', 'sex',
+        'wander_direction', 'wander_timer', 'cooling_down', 'resting', 'death_cause', 'config',
+    )
+
+    def __init__(self, x, y, genes = None, sex=None, rng=None, terrain=None, config=None):
+        # Random stream for this creature's choices; World passes its own seeded one
+        self.rng = rng if rng is not None else random
+        # World's SimulationConfig; without one the config.py defaults are used
+        self.config = cfg = config if config is not None else DEFAULT_CONFIG
+        self.terrain = terrain if terrain is not None else DEFAULT_TERRAIN
+        # Prevent spawning with center in the lake
+        while self.terrain.is_water(x + 20, y + 20):
+            x = self.rng.randint(0, 800 - 40)
+            y = self.rng.randint(0, 600 - 40)
         self.x = x
         self.y = y
         self.target = None
-        self.energy = ENERGY_MAX
+        self.energy = cfg.energy_max
         self.age = 0
         self.hunger = 0  # Hunger starts at 0 (not hungry)
         self.thirst = 0  # Thirst starts at 0 (not thirsty)
 
-        self.genes = genes if genes is not None else self.generate_random_genes()
-        self.genes['color'] = self.genes.get('color', {
-            'R': 128,
-            'G': 128,
-            'B': 128
-        })
-        self.sex = sex if sex is not None else random.choice(["male", "female"])
+        # Plain dicts (survivor JSON) are converted to the compact gene vector
+        self.genes = Genes.coerce(genes) if genes is not None else self.generate_random_genes(cfg)
+        self.sex = sex if sex is not None else self.rng.choice(["male", "female"])
         self.wander_direction = (0, 0)
         self.wander_timer = 0
-        self.reproduction_cooldown = 0
+        # Set while the World's reproduction cooldown runs; World.cooldowns_left() has the time left
+        self.cooling_down = False
         self.resting = False
 
     @staticmethod
     def create_child(mother, father):
-        # Average genes
-        child_genes = {}
-        for key in mother.genes:
-            if key == 'color':
-                child_genes['color'] = {
-                    'R': int((mother.genes['color']['R'] + father.genes['color']['R']) / 2),
-                    'G': int((mother.genes['color']['G'] + father.genes['color']['G']) / 2),
-                    'B': int((mother.genes['color']['B'] + father.genes['color']['B']) / 2)
-                }
-            else:
-                child_genes[key] = (mother.genes[key] + father.genes[key]) / 2
-        # Create child, then mutate its genes
-        child = Creature(mother.x, mother.y, genes=child_genes)
+        # Average genes, then mutate the child's copy
+        child = Creature(mother.x, mother.y, genes=crossover(mother.genes, father.genes), rng=mother.rng,
+                         terrain=mother.terrain, config=mother.config)
         child.genes = child.mutate_genes()
         return child
     
-    def update(self, food_list, world_bounds, creatures):
+    def update(self, food_list, world_bounds, creatures, food_grid=None, claims=None):
+        cfg = self.config
         self.age += 1
         self.hunger += .5  # Increase hunger every update
         self.thirst += .5  # Increase thirst every update
-        if self.reproduction_cooldown > 0:
-            self.reproduction_cooldown -= 1
-        if self.hunger > HUNGER_MAX:
+        # cooling_down is cleared by the World's event queue when the cooldown runs out
+        if self.hunger > cfg.hunger_max:
             self.energy = 0
             self.death_cause = 'starvation'
             return
-        if self.thirst > THIRST_MAX:
+        if self.thirst > cfg.thirst_max:
             self.energy = 0
             self.death_cause = 'dehydration'
             return
-        direction = self.think(food_list, creatures)
+        direction = self.think(food_list, creatures, food_grid, claims, cfg)
         # If standing still, regain energy (resting)
         if direction == (0, 0):
-            self.energy = min(ENERGY_MAX, self.energy + REST_ENERGY_GAIN)
+            self.energy = min(cfg.energy_max, self.energy + cfg.rest_energy_gain)
         self.move(direction, world_bounds)
         self.try_drink()
         # Check for exhaustion (energy depleted)
         if self.energy <= 0 and not hasattr(self, 'death_cause'):
             self.death_cause = 'exhaustion'
     
-    def think(self, food_list, creatures):
+    def think(self, food_list, creatures, food_grid=None, claims=None, cfg=None):
+        cfg = cfg if cfg is not None else self.config
         # Simple rule-based logic
         # If currently resting, continue to rest unless energy is full or hunger/thirst crosses threshold
         if self.resting:
-            if self.hunger >= HUNGER_THRESHOLD or self.thirst >= THIRST_THRESHOLD or self.energy >= ENERGY_MAX * 0.8:
+            if self.hunger >= cfg.hunger_threshold or self.thirst >= cfg.thirst_threshold or self.energy >= cfg.energy_max * 0.8:
                 self.resting = False
             else:
                 return (0, 0)
 
         # Seek food if hungry
-        if self.hunger >= HUNGER_THRESHOLD:
-            target = self.find_nearest_food(food_list, creatures)
+        if self.hunger >= cfg.hunger_threshold:
+            target = self.find_nearest_food(food_list, creatures, food_grid, claims)
+            if claims is not None:
+                claims.claim(self, target)
             if target:
                 dx = target.x - self.x
                 dy = target.y - self.y
                 return (sign(dx), sign(dy))
+        elif claims is not None and self.target is not None:
+            # No longer hungry, so give the food back to the others
+            claims.release(self)
 
-        # Seek water if thirsty
-        if self.thirst >= THIRST_THRESHOLD:
+        # Seek water if thirsty, following the terrain's precomputed flow field
+        if self.thirst >= cfg.thirst_threshold:
+            step = self.terrain.flow_field().direction(self.x, self.y)
+            if step is not None:
+                return step
+            # No reachable shore: head for the default lake as before
             lake_cx = LAKE_X + LAKE_WIDTH // 2
             lake_cy = LAKE_Y + LAKE_HEIGHT // 2
             dx = lake_cx - (self.x + 20)
@@ -127,61 +122,56 @@ class Creature:
             self.thirst = 0
 
     def _in_lake(self):
-        # Check if the center or any corner of the creature is inside the lake ellipse
-        points = [
-            (self.x + 20, self.y + 20),  # center
-            (self.x, self.y),            # top-left
-            (self.x + 39, self.y),       # top-right
-            (self.x, self.y + 39),       # bottom-left
-            (self.x + 39, self.y + 39)   # bottom-right
-        ]
-        lx = LAKE_X + LAKE_WIDTH / 2
-        ly = LAKE_Y + LAKE_HEIGHT / 2
-        rx = LAKE_WIDTH / 2
-        ry = LAKE_HEIGHT / 2
-        for px, py in points:
-            if ((px - lx) / rx) ** 2 + ((py - ly) / ry) ** 2 <= 1:
-                return True
-        return False
+        # Check if the center or any corner of the creature is in the water
+        x, y = self.x, self.y
+        terrain = self.terrain
+        w = terrain.width
+        if 0 <= x and x + 39 < w and 0 <= y and y + 39 < terrain.height:
+            # Whole sprite is on the map: index the raster directly
+            water = terrain.water
+            top = int(y) * w + int(x)
+            bottom = top + 39 * w
+            return (water[top + 20 * w + 20] == 1      # center
+                    or water[top] == 1                 # top-left
+                    or water[top + 39] == 1            # top-right
+                    or water[bottom] == 1              # bottom-left
+                    or water[bottom + 39] == 1)        # bottom-right
+        is_water = terrain.is_water
+        return (is_water(x + 20, y + 20) or is_water(x, y) or is_water(x + 39, y)
+                or is_water(x, y + 39) or is_water(x + 39, y + 39))
 
     def _wander(self):
         # If timer expired, pick a new direction and duration
         if self.wander_timer <= 0:
             # 20% chance to stand still, 80% to move in a direction
             directions = [(0, 0)] * 1 + [(1, 0), (0, 1), (-1, 0), (0, -1)] * 2
-            self.wander_direction = random.choice(directions)
-            self.wander_timer = random.randint(30, 60)
+            self.wander_direction = self.rng.choice(directions)
+            self.wander_timer = self.rng.randint(30, 60)
         self.wander_timer -= 1
         return self.wander_direction
 
     def move(self, direction, world_bounds):
         dx, dy = direction
         distance = math.sqrt(dx ** 2 + dy ** 2)
-        self.energy -= distance * self.genes.get('metabolism', 0.2)  # Use metabolism gene for energy cost
-        # Try to move, but block if would enter the lake (ellipse)
+        self.energy -= distance * self.genes.metabolism  # Use metabolism gene for energy cost
+        # Try to move, but block if the center would end up in the lake
         new_x = clamp(self.x + dx, 0, world_bounds[0] - 40)
         new_y = clamp(self.y + dy, 0, world_bounds[1] - 40)
-        # Check if center would be in the lake ellipse
-        cx = new_x + 20
-        cy = new_y + 20
-        lx = LAKE_X + LAKE_WIDTH / 2
-        ly = LAKE_Y + LAKE_HEIGHT / 2
-        rx = LAKE_WIDTH / 2
-        ry = LAKE_HEIGHT / 2
-        in_lake = ((cx - lx) / rx) ** 2 + ((cy - ly) / ry) ** 2 <= 1
-        if not in_lake:
+        if not self.terrain.is_water(new_x + 20, new_y + 20):
             self.x = new_x
             self.y = new_y
     
     def distance_to(self, other):
         return math.hypot(other.x - self.x, other.y - self.y)
     
-    def generate_random_genes(self):
-        return {
-            'vision': random.uniform(VISION_MIN, VISION_MAX),
-            'speed': random.uniform(SPEED_MIN, SPEED_MAX),
-            'metabolism': random.uniform(0.02, 0.2),
-        }
+    def generate_random_genes(self, cfg=None):
+        cfg = cfg if cfg is not None else self.config
+        return Genes((
+            self.rng.uniform(cfg.vision_min, cfg.vision_max),
+            self.rng.uniform(cfg.speed_min, cfg.speed_max),
+            self.rng.uniform(0.02, 0.2),
+            128, 128, 128,
+        ))
 
     def collides_with(self, food):
         dx = self.x - food.x
@@ -193,40 +183,15 @@ class Creature:
         return False
     
     def mutate_genes(self):
-        new_genes = self.genes.copy()
-        for key in list(new_genes.keys()):
-            if key == 'color':
-                # Mutate each color channel independently
-                new_color = new_genes['color'].copy()
-                for channel in ['R', 'G', 'B']:
-                    if random.random() < MUTATION_RATE * 2:
-                        # Mutate by up to +/- 20, clamp to 0-255
-                        delta = random.randint(-20, 20)
-                        new_color[channel] = max(0, min(255, new_color[channel] + delta))
-                new_genes['color'] = new_color
-            else:
-                if random.random() < MUTATION_RATE:
-                    # Multiplicative mutation: scale by 0.9 to 1.1
-                    new_genes[key] *= random.uniform(0.9, 1.1)
-                    # Prevent negative or zero values
-                    if key == 'metabolism':
-                        new_genes[key] = max(0.001, new_genes[key])
-                    else:
-                        new_genes[key] = max(0.1, new_genes[key])
-        return new_genes
+        return mutate(Genes.coerce(self.genes), self.rng, self.config.mutation_rate)
     
     def reproduce(self):
-        return Creature(self.x, self.y, genes=self.mutate_genes())
+        return Creature(self.x, self.y, genes=self.mutate_genes(), rng=self.rng, terrain=self.terrain, config=self.config)
     
     def draw(self, screen):
-        # Optionally tint the sprite to the creature's color gene
-        color = self.genes.get('color', {'R':128, 'G':128, 'B':128})
-        sprite = CREATURE_SPRITE.copy()
-        # Tinting: fill with color, using BLEND_RGBA_MULT for simple tint
-        tint = pygame.Surface(sprite.get_size(), pygame.SRCALPHA)
-        tint.fill((color['R'], color['G'], color['B'], 255))
-        sprite.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-        screen.blit(sprite, (self.x, self.y))
+        # Tint the sprite to the creature's color gene (shared, cached surfaces)
+        sprite = CREATURE_SPRITES.get(*self.genes.color)
+        rect = screen.blit(sprite, (self.x, self.y))
         # Draw filled transparent gray vision circle (optional, can uncomment)
         # vision_surface = pygame.Surface((self.genes['vision']*2, self.genes['vision']*2), pygame.SRCALPHA)
         # pygame.draw.circle(
@@ -239,26 +204,37 @@ class Creature:
         # center_x = int(self.x + 20 - self.genes['vision'])
         # center_y = int(self.y + 20 - self.genes['vision'])
         # screen.blit(vision_surface, (center_x, center_y))
+        return rect
 
-    def find_nearest_food(self, food_list, other_creatures):
-        visible_food = [f for f in food_list if self.distance_to(f) <= self.genes['vision']]
-        
-        # Get positions of food being targeted by other creatures
-        targeted_food = {
-            (c.target.x, c.target.y) for c in other_creatures
-            if c.target is not self and c.target is not None
-        }
-        
-        # Filter out food that's already assigned
-        untargeted_food = [
-            f for f in visible_food
-            if (f.x, f.y) not in targeted_food
-        ]
-        
-        # Use untargeted food if available, otherwise fall back to any visible food
-        candidate_food = untargeted_food if untargeted_food else visible_food
-        
-        if not candidate_food:
-            return None
+    def find_nearest_food(self, food_list, other_creatures, food_grid=None, claims=None):
+        vision = self.genes.vision
+        if food_grid is not None:
+            # Only look at food in grid cells within vision range
+            food_list = food_grid.query(self.x, self.y, vision)
+
+        if claims is None:
+            # No registry: get positions of food being targeted by other creatures
+            targeted_food = {
+                (c.target.x, c.target.y) for c in other_creatures
+                if c.target is not self and c.target is not None
+            }
 
-        return min(candidate_food, key=lambda f: self.distance_to(f))
\ No newline at end of file
+        # Single pass: track the nearest visible food overall and the nearest
+        # one nobody else has claimed
+        nearest, nearest_dist = None, None
+        untargeted, untargeted_dist = None, None
+        for f in food_list:
+            dist = self.distance_to(f)
+            if dist > vision:
+                continue
+            if nearest is None or dist < nearest_dist:
+                nearest, nearest_dist = f, dist
+            if claims is not None:
+                taken = f.targeted_by is not None and f.targeted_by is not self
+            else:
+                taken = (f.x, f.y) in targeted_food
+            if not taken and (untargeted is None or dist < untargeted_dist):
+                untargeted, untargeted_dist = f, dist
+
+        # Use untargeted food if available, otherwise fall back to any visible food
+        return untargeted if untargeted is not None else nearest
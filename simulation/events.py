@@ -0,0 +1,54 @@
+import heapq
+
+
+class Event:
+    __slots__ = ('due', 'seq', 'fn', 'args', 'cancelled')
+
+    def __init__(self, due, seq, fn, args):
+        self.due = due
+        self.seq = seq
+        self.fn = fn
+        self.args = args
+        self.cancelled = False
+
+    def __lt__(self, other):
+        return (self.due, self.seq) < (other.due, other.seq)
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class EventQueue:
+    # Priority queue of callbacks keyed by the frame they are due on, so timers
+    # cost nothing until they fire. Events due on the same frame run in the
+    # order they were scheduled. Callbacks should be plain functions or bound
+    # methods (not lambdas) so a world holding the queue can be checkpointed.
+    def __init__(self):
+        self.heap = []
+        self.seq = 0
+
+    def schedule(self, due, fn, *args):
+        event = Event(due, self.seq, fn, args)
+        self.seq += 1
+        heapq.heappush(self.heap, event)
+        return event
+
+    def run_due(self, now):
+        # Fire everything due at or before `now`; returns how many ran.
+        # Callbacks may schedule more events, including ones due right away.
+        ran = 0
+        heap = self.heap
+        while heap and heap[0].due <= now:
+            event = heapq.heappop(heap)
+            if not event.cancelled:
+                event.fn(*event.args)
+                ran += 1
+        return ran
+
+    def next_due(self):
+        while self.heap and self.heap[0].cancelled:
+            heapq.heappop(self.heap)
+        return self.heap[0].due if self.heap else None
+
+    def __len__(self):
+        return sum(1 for event in self.heap if not event.cancelled)
@@ -1,10 +1,7 @@
 from config import SCREEN_WIDTH, SCREEN_HEIGHT
-import pygame
+from simulation.assets import get_sprite
 
 class Food:
-    FOOD_SPRITE = pygame.transform.scale(
-        pygame.image.load('assets/food.png'), (20, 20)
-    )
     def __init__(self, x, y, energy=200):
         self.radius = 4 # Size for drawing
         # Clamp so food is always fully visible
@@ -12,6 +9,8 @@ class Food:
         self.y = min(max(y, self.radius), SCREEN_HEIGHT - self.radius)
         self.energy = energy
         self.targeted_by = None
+        self.id = None    # assigned by the world's FoodRegistry
+        self.bush = None  # bush it grew on
     
     def draw(self, screen):
-        screen.blit(self.FOOD_SPRITE, (int(self.x), int(self.y)))
\ No newline at end of file
+        return screen.blit(get_sprite('food.png', (20, 20)), (int(self.x), int(self.y)))
\ No newline at end of file
@@ -0,0 +1,112 @@
+from array import array
+
+# Fixed gene layout: one float per slot
+GENE_NAMES = ('vision', 'speed', 'metabolism', 'R', 'G', 'B')
+VISION, SPEED, METABOLISM, RED, GREEN, BLUE = range(len(GENE_NAMES))
+TRAITS = (VISION, SPEED, METABOLISM)  # multiplicative genes
+COLOR = (RED, GREEN, BLUE)            # 0-255 channels
+GENE_INDEX = {name: i for i, name in enumerate(GENE_NAMES)}
+DEFAULTS = (0.0, 0.0, 0.2, 128, 128, 128)
+
+
+class Genes:
+    # Compact gene vector with named accessors. It also supports the old
+    # dict-style access (genes['vision'], genes['color']['R'], genes.get(...))
+    # so the info panel and survivor JSON keep working.
+    __slots__ = ('values',)
+
+    def __init__(self, values=DEFAULTS):
+        self.values = array('d', values)
+
+    @classmethod
+    def from_dict(cls, genes):
+        color = genes.get('color') or {}
+        return cls((
+            genes.get('vision', DEFAULTS[VISION]),
+            genes.get('speed', DEFAULTS[SPEED]),
+            genes.get('metabolism', DEFAULTS[METABOLISM]),
+            color.get('R', DEFAULTS[RED]),
+            color.get('G', DEFAULTS[GREEN]),
+            color.get('B', DEFAULTS[BLUE]),
+        ))
+
+    @classmethod
+    def coerce(cls, genes):
+        return genes if isinstance(genes, Genes) else cls.from_dict(genes)
+
+    def to_dict(self):
+        v = self.values
+        return {
+            'vision': v[VISION],
+            'speed': v[SPEED],
+            'metabolism': v[METABOLISM],
+            'color': {'R': int(v[RED]), 'G': int(v[GREEN]), 'B': int(v[BLUE])},
+        }
+
+    def copy(self):
+        return Genes(self.values)
+
+    @property
+    def vision(self):
+        return self.values[VISION]
+
+    @property
+    def speed(self):
+        return self.values[SPEED]
+
+    @property
+    def metabolism(self):
+        return self.values[METABOLISM]
+
+    @property
+    def color(self):
+        v = self.values
+        return (int(v[RED]), int(v[GREEN]), int(v[BLUE]))
+
+    def __getitem__(self, key):
+        if key == 'color':
+            v = self.values
+            return {'R': int(v[RED]), 'G': int(v[GREEN]), 'B': int(v[BLUE])}
+        return self.values[GENE_INDEX[key]]
+
+    def __setitem__(self, key, value):
+        if key == 'color':
+            for channel in ('R', 'G', 'B'):
+                self.values[GENE_INDEX[channel]] = value[channel]
+        else:
+            self.values[GENE_INDEX[key]] = value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def __contains__(self, key):
+        return key == 'color' or key in GENE_INDEX
+
+    def __eq__(self, other):
+        if isinstance(other, dict):
+            other = Genes.from_dict(other)
+        return isinstance(other, Genes) and self.values == other.values
+
+    def __repr__(self):
+        return f"Genes({self.to_dict()})"
+
+
+def crossover(mother, father):
+    # Average the parents; color channels are truncated to ints like before
+    m, f = mother.values, father.values
+    values = [(m[i] + f[i]) / 2 for i in TRAITS] + [int((m[i] + f[i]) / 2) for i in COLOR]
+    return Genes(values)
+
+
+def mutate(genes, rng, rate):
+    values = array('d', genes.values)
+    for i in TRAITS:
+        if rng.random() < rate:
+            # Multiplicative mutation: scale by 0.9 to 1.1, prevent negative or zero values
+            values[i] *= rng.uniform(0.9, 1.1)
+            values[i] = max(0.001 if i == METABOLISM else 0.1, values[i])
+    for i in COLOR:
+        if rng.random() < rate * 2:
+            # Mutate by up to +/- 20, clamp to 0-255
+            values[i] = max(0, min(255, values[i] + rng.randint(-20, 20)))
+    return Genes(values)
@@ -0,0 +1,118 @@
+import json
+import os
+from multiprocessing import Pool
+from simulation.batch import make_world
+from simulation.runner import run_headless, survivor_data
+
+
+def island_seed(seed, generation, island, islands):
+    # Distinct, reproducible seed for every (generation, island)
+    return seed + generation * islands + island
+
+
+def run_island(spec):
+    # One generation on one island; spec is a plain dict so it can go to a worker process
+    world = make_world(spec['seed'], 'objects', spec.get('creature_count'), spec.get('survivors') or None)
+    result = run_headless(world, max_frames=spec.get('max_frames'))
+    survivors = survivor_data(world, spec.get('survivor_count', 2))
+    genes = [s['genes'] for s in survivors]
+    return {
+        'island': spec['island'],
+        'seed': spec['seed'],
+        'frames': result['frames'],
+        'population': result['population'],
+        'death_causes': result['death_causes'],
+        # Longer-lived worlds are fitter; the final population breaks ties
+        'fitness': [result['frames'], result['population']],
+        'mean_genes': {
+            name: sum(g[name] for g in genes) / len(genes) if genes else 0
+            for name in ('vision', 'speed', 'metabolism')
+        },
+        'survivors': survivors,
+    }
+
+
+def migrate(pools, migrants):
+    # Ring migration: every island also receives the first `migrants` survivors
+    # (the oldest) of the island before it
+    if migrants <= 0 or len(pools) < 2:
+        return [list(pool) for pool in pools]
+    return [list(pool) + list(pools[i - 1][:migrants]) for i, pool in enumerate(pools)]
+
+
+def load_progress(path):
+    # (next generation, survivor pools) from the last line of a summaries file
+    last = None
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                last = line
+    if last is None:
+        return 0, None
+    summary = json.loads(last)
+    pools = migrate([island['survivors'] for island in summary['islands']], summary['migrants'])
+    return summary['generation'] + 1, pools
+
+
+def read_summaries(path):
+    # Generation summaries from a summaries file, one at a time
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def run_islands(islands=4, generations=10, seed=0, max_frames=None, creature_count=None, survivor_count=2,
+                migrate_every=5, migrants=1, processes=None, output=None, resume=False, on_generation=None):
+    # Evolve `islands` independent worlds for `generations` generations. Each
+    # generation reseeds an island from its own previous survivors (plus
+    # migrants every `migrate_every` generations). One JSON summary line per
+    # generation is written to `output`, replacing what was there unless
+    # resume=True, in which case the run continues from its last generation.
+    # Only the last summary is kept in memory and returned; the rest are in
+    # `output` (see read_summaries) or were passed to on_generation.
+    start, pools = 0, None
+    if resume and output and os.path.exists(output):
+        start, pools = load_progress(output)
+    elif output:
+        # A fresh run replaces any earlier run's summaries
+        open(output, 'w').close()
+    if pools is None:
+        pools = [None] * islands
+
+    summary = None
+    pool = Pool(processes) if processes != 1 else None
+    try:
+        for generation in range(start, start + generations):
+            specs = [{
+                'island': i,
+                'seed': island_seed(seed, generation, i, islands),
+                'survivors': pools[i],
+                'max_frames': max_frames,
+                'creature_count': creature_count,
+                'survivor_count': survivor_count,
+            } for i in range(islands)]
+            results = pool.map(run_island, specs) if pool is not None else [run_island(s) for s in specs]
+
+            migrated = migrate_every > 0 and (generation + 1) % migrate_every == 0
+            pools = migrate([r['survivors'] for r in results], migrants if migrated else 0)
+
+            best = max(results, key=lambda r: r['fitness'])
+            summary = {
+                'generation': generation,
+                'best_island': best['island'],
+                'best_fitness': best['fitness'],
+                'mean_frames': sum(r['frames'] for r in results) / len(results),
+                'migrants': migrants if migrated else 0,
+                'islands': results,
+            }
+            if output:
+                with open(output, 'a') as f:
+                    f.write(json.dumps(summary) + '\n')
+            if on_generation is not None:
+                on_generation(summary)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return summary
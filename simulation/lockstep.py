@@ -0,0 +1,507 @@
+import time
+import numpy as np
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, LAKE_X, LAKE_Y, LAKE_WIDTH, LAKE_HEIGHT
+from simulation.settings import DEFAULT_CONFIG
+from simulation.terrain import DEFAULT_TERRAIN
+from simulation.vectorized import ALIVE, STARVATION, DEHYDRATION, EXHAUSTION, CAUSE_NAMES
+from simulation.vectorized import CREATURE_SIZE, BUSH_SIZE, FOOD_PER_BUSH, FOOD_RADIUS, MAX_PAIRWISE, WANDER_DIRECTIONS
+from simulation.vectorized import DEFAULT_WATER, flow_waypoints, in_lake, rects_overlap, water_mask
+
+# Many independent VectorWorlds stepped together. Every array has a leading
+# world axis: creatures are (worlds, slots) with an `alive` mask, since each
+# world's population changes on its own, and food is (worlds, bushes, 3).
+# Dead creatures leave a free slot that the next child born in that world
+# takes, and the slot axis grows when a world runs out. The rules are
+# VectorWorld's; eating and mating are resolved in slot order within each
+# world. One random stream feeds the whole batch, so a run is reproducible
+# from its seed and world count, not per world.
+
+# Per-creature arrays, grown together along the slot axis
+CREATURE_FIELDS = (
+    'x', 'y', 'energy', 'age', 'hunger', 'thirst', 'cooldown', 'resting',
+    'wander_dx', 'wander_dy', 'wander_timer', 'target',
+    'vision', 'speed', 'metabolism', 'color', 'male', 'alive', 'final',
+)
+
+
+def ranks(groups):
+    # Position of each entry within its run of equal values in a sorted array
+    return np.arange(groups.size) - np.searchsorted(groups, groups)
+
+
+class LockstepWorlds:
+    def __init__(self, worlds, creature_count=None, bush_count=4, seed=None, terrain=None, log_interval=None,
+                 config=None):
+        self.config = config if config is not None else DEFAULT_CONFIG
+        creature_count = self.config.creature_count if creature_count is None else creature_count
+        self.worlds = worlds
+        self.rng = np.random.default_rng(seed)
+        self.terrain = terrain if terrain is not None else DEFAULT_TERRAIN
+        self.water = DEFAULT_WATER if self.terrain is DEFAULT_TERRAIN else water_mask(self.terrain)
+        self.flow = self.terrain.flow_field(CREATURE_SIZE)
+        self.flow_x, self.flow_y = flow_waypoints(self.flow)
+        self.log_interval = log_interval if log_interval is not None else self.config.log_interval
+        self.frame_count = 0
+        # Ticks each world ran before it went extinct
+        self.frames = np.zeros(worlds, dtype=np.int64)
+        self.causes = np.zeros((worlds, len(CAUSE_NAMES)), dtype=np.int64)
+        self.births = np.zeros(worlds, dtype=np.int64)
+        # One (worlds, 6) array per log frame, and which worlds were still running then
+        self.rows = []
+        self.row_mask = []
+
+        self._allocate(creature_count)
+        cfg = self.config
+        shape = (worlds, creature_count)
+        x, y = self._spawn_positions(shape)
+        self._place(
+            np.repeat(np.arange(worlds), creature_count), np.tile(np.arange(creature_count), worlds),
+            x.ravel(), y.ravel(),
+            vision=self.rng.uniform(cfg.vision_min, cfg.vision_max, shape).ravel(),
+            speed=self.rng.uniform(cfg.speed_min, cfg.speed_max, shape).ravel(),
+            metabolism=self.rng.uniform(0.02, 0.2, shape).ravel(),
+            color=np.full((worlds * creature_count, 3), 128, dtype=np.int64),
+            male=self.rng.random(worlds * creature_count) < 0.5,
+        )
+
+        self.bush_x, self.bush_y, self.bush_ok = self._spawn_bushes(bush_count)
+        shape = (worlds, bush_count, FOOD_PER_BUSH)
+        self.food_x = np.zeros(shape)
+        self.food_y = np.zeros(shape)
+        self.food_alive = np.zeros(shape, dtype=bool)
+        start = self.rng.integers(1, 4, (worlds, bush_count))
+        for grown in range(FOOD_PER_BUSH):
+            self._grow_food(start > grown)
+
+    def _allocate(self, slots):
+        shape = (self.worlds, slots)
+        self.x = np.zeros(shape, dtype=np.int64)
+        self.y = np.zeros(shape, dtype=np.int64)
+        self.energy = np.zeros(shape)
+        self.age = np.zeros(shape, dtype=np.int64)
+        self.hunger = np.zeros(shape)
+        self.thirst = np.zeros(shape)
+        self.cooldown = np.zeros(shape, dtype=np.int64)
+        self.resting = np.zeros(shape, dtype=bool)
+        self.wander_dx = np.zeros(shape, dtype=np.int64)
+        self.wander_dy = np.zeros(shape, dtype=np.int64)
+        self.wander_timer = np.zeros(shape, dtype=np.int64)
+        self.target = np.full(shape, -1, dtype=np.int64)  # flat food slot index within the world, -1 for none
+        self.vision = np.zeros(shape)
+        self.speed = np.zeros(shape)
+        self.metabolism = np.zeros(shape)
+        self.color = np.zeros(shape + (3,), dtype=np.int64)
+        self.male = np.zeros(shape, dtype=bool)
+        self.alive = np.zeros(shape, dtype=bool)
+        # The population a world had on the tick it went extinct, for survivor export
+        self.final = np.zeros(shape, dtype=bool)
+
+    def _grow_slots(self, extra):
+        for name in CREATURE_FIELDS:
+            values = getattr(self, name)
+            pad = np.zeros((self.worlds, extra) + values.shape[2:], dtype=values.dtype)
+            setattr(self, name, np.concatenate([values, pad], axis=1))
+
+    def _place(self, worlds, slots, x, y, vision, speed, metabolism, color, male):
+        # New creatures in the given (world, slot) pairs
+        at = (worlds, slots)
+        self.x[at] = x
+        self.y[at] = y
+        self.energy[at] = self.config.energy_max
+        self.age[at] = 0
+        self.hunger[at] = 0
+        self.thirst[at] = 0
+        self.cooldown[at] = 0
+        self.resting[at] = False
+        self.wander_dx[at] = 0
+        self.wander_dy[at] = 0
+        self.wander_timer[at] = 0
+        self.target[at] = -1
+        self.vision[at] = vision
+        self.speed[at] = speed
+        self.metabolism[at] = metabolism
+        self.color[at] = color
+        self.male[at] = male
+        self.alive[at] = True
+
+    def _spawn_positions(self, shape):
+        # Rejection-sample top-left corners whose center is outside the lake
+        x = np.empty(shape, dtype=np.int64)
+        y = np.empty(shape, dtype=np.int64)
+        todo = np.ones(shape, dtype=bool)
+        while todo.any():
+            count = int(todo.sum())
+            x[todo] = self.rng.integers(0, SCREEN_WIDTH - CREATURE_SIZE + 1, count)
+            y[todo] = self.rng.integers(0, SCREEN_HEIGHT - CREATURE_SIZE + 1, count)
+            todo &= in_lake(x + CREATURE_SIZE // 2, y + CREATURE_SIZE // 2, self.water)
+        return x, y
+
+    def _spawn_bushes(self, count, max_attempts=1000):
+        # Placed world by world, as VectorWorld does; a world that runs out of
+        # attempts leaves its remaining bushes switched off
+        bx = np.zeros((self.worlds, count), dtype=np.int64)
+        by = np.zeros((self.worlds, count), dtype=np.int64)
+        ok = np.zeros((self.worlds, count), dtype=bool)
+        for world in range(self.worlds):
+            placed = attempts = 0
+            while placed < count and attempts < max_attempts:
+                attempts += 1
+                x = int(self.rng.integers(0, SCREEN_WIDTH - BUSH_SIZE + 1))
+                y = int(self.rng.integers(0, SCREEN_HEIGHT - BUSH_SIZE + 1))
+                if self.terrain.rect_touches_lake(x, y, BUSH_SIZE, BUSH_SIZE):
+                    continue
+                if any(abs(x - ox) < BUSH_SIZE and abs(y - oy) < BUSH_SIZE
+                       for ox, oy in zip(bx[world, :placed], by[world, :placed])):
+                    continue
+                bx[world, placed] = x
+                by[world, placed] = y
+                ok[world, placed] = True
+                placed += 1
+        return bx, by, ok
+
+    @property
+    def population(self):
+        # Live creatures per world
+        return self.alive.sum(axis=1)
+
+    @property
+    def food_count(self):
+        return self.food_alive.sum(axis=(1, 2))
+
+    def update(self):
+        cfg = self.config
+        self.frame_count += 1
+        running = self.alive.any(axis=1)
+        total_food = self.food_count
+        alive = self.alive
+
+        self.age += alive
+        self.hunger += .5 * alive
+        self.thirst += .5 * alive
+        np.maximum(self.cooldown - 1, 0, out=self.cooldown)
+
+        cause = np.zeros(alive.shape, dtype=np.int8)
+        cause[alive & (self.hunger > cfg.hunger_max)] = STARVATION
+        cause[alive & (cause == ALIVE) & (self.thirst > cfg.thirst_max)] = DEHYDRATION
+        self.energy[cause != ALIVE] = 0
+        active = alive & (cause == ALIVE)
+
+        dx, dy = self._think(active)
+        # Standing still regains energy
+        still = active & (dx == 0) & (dy == 0)
+        self.energy[still] = np.minimum(cfg.energy_max, self.energy[still] + cfg.rest_energy_gain)
+        self._move(active, dx, dy)
+        self._drink(active)
+        cause[active & (self.energy <= 0)] = EXHAUSTION
+        self._eat()
+
+        # Remove dead creatures and count causes per world
+        dead = alive & (self.energy <= 0)
+        if dead.any():
+            for code in CAUSE_NAMES:
+                self.causes[:, code - 1] += np.count_nonzero(dead & (cause == code), axis=1)
+            extinct = running & ~(alive & ~dead).any(axis=1)
+            self.final[extinct] = alive[extinct]
+            self.alive &= ~dead
+
+        self._reproduce()
+
+        if self.frame_count % cfg.food_spawn_interval == 0:
+            self._grow_food(np.ones(self.bush_ok.shape, dtype=bool))
+
+        if self.frame_count % self.log_interval == 0:
+            self.rows.append(self.stats_rows(total_food))
+            self.row_mask.append(running)
+        self.frames += running
+
+    def stats_rows(self, total_food=None):
+        # (frame, avg vision, avg speed, avg metabolism, food, population) for every world
+        total_food = self.food_count if total_food is None else total_food
+        population = self.population
+        count = np.maximum(population, 1)
+        return np.column_stack([
+            np.full(self.worlds, self.frame_count),
+            (self.vision * self.alive).sum(axis=1) / count,
+            (self.speed * self.alive).sum(axis=1) / count,
+            (self.metabolism * self.alive).sum(axis=1) / count,
+            total_food,
+            population,
+        ])
+
+    def _think(self, active):
+        cfg = self.config
+        dx = np.zeros(active.shape, dtype=np.int64)
+        dy = np.zeros(active.shape, dtype=np.int64)
+
+        # Resting creatures keep resting until energy is high or needs kick in
+        resting = active & self.resting
+        wake = resting & ((self.hunger >= cfg.hunger_threshold) | (self.thirst >= cfg.thirst_threshold)
+                          | (self.energy >= cfg.energy_max * 0.8))
+        self.resting[wake] = False
+        deciding = active & ~(resting & ~wake)
+
+        # Seek food if hungry; drop claims once no longer hungry
+        hungry = deciding & (self.hunger >= cfg.hunger_threshold)
+        self.target[deciding & ~hungry] = -1
+        seeking = np.zeros(active.shape, dtype=bool)
+        worlds, slots = np.nonzero(hungry)
+        if worlds.size:
+            target = self._find_food(worlds, slots)
+            self.target[worlds, slots] = target
+            found = target >= 0
+            worlds, slots, target = worlds[found], slots[found], target[found]
+            fx = self.food_x.reshape(self.worlds, -1)[worlds, target]
+            fy = self.food_y.reshape(self.worlds, -1)[worlds, target]
+            dx[worlds, slots] = np.sign(fx - self.x[worlds, slots])
+            dy[worlds, slots] = np.sign(fy - self.y[worlds, slots])
+            seeking[worlds, slots] = True
+
+        # Seek water if thirsty, following the terrain's flow field
+        thirsty = deciding & ~seeking & (self.thirst >= cfg.thirst_threshold)
+        if thirsty.any():
+            flow = self.flow
+            cx = np.clip(self.x[thirsty] // flow.cell, 0, flow.cols - 1)
+            cy = np.clip(self.y[thirsty] // flow.cell, 0, flow.rows - 1)
+            wx = self.flow_x[cy * flow.cols + cx]
+            wy = self.flow_y[cy * flow.cols + cx]
+            # No reachable shore: head for the default lake
+            lost = wx < 0
+            wx = np.where(lost, LAKE_X + LAKE_WIDTH // 2 - CREATURE_SIZE // 2, wx)
+            wy = np.where(lost, LAKE_Y + LAKE_HEIGHT // 2 - CREATURE_SIZE // 2, wy)
+            dx[thirsty] = np.sign(wx - self.x[thirsty])
+            dy[thirsty] = np.sign(wy - self.y[thirsty])
+
+        # Rest if energy is low
+        tired = deciding & ~seeking & ~thirsty & (self.energy < 40)
+        self.resting[tired] = True
+
+        # Otherwise wander
+        wander = deciding & ~seeking & ~thirsty & ~tired
+        expired = wander & (self.wander_timer <= 0)
+        count = int(expired.sum())
+        if count:
+            picks = WANDER_DIRECTIONS[self.rng.integers(0, len(WANDER_DIRECTIONS), count)]
+            self.wander_dx[expired] = picks[:, 0]
+            self.wander_dy[expired] = picks[:, 1]
+            self.wander_timer[expired] = self.rng.integers(30, 61, count)
+        self.wander_timer[wander] -= 1
+        dx[wander] = self.wander_dx[wander]
+        dy[wander] = self.wander_dy[wander]
+        return dx, dy
+
+    def _find_food(self, worlds, slots):
+        # Nearest visible food per creature in its own world, preferring food no other creature targets
+        fx = self.food_x.reshape(self.worlds, -1)
+        fy = self.food_y.reshape(self.worlds, -1)
+        alive = self.food_alive.reshape(self.worlds, -1)
+        food = np.arange(fx.shape[1])
+        claims = np.zeros(fx.shape, dtype=np.int64)
+        claimed = self.alive & (self.target >= 0)
+        np.add.at(claims, (np.nonzero(claimed)[0], self.target[claimed]), 1)
+        result = np.full(worlds.size, -1, dtype=np.int64)
+        if not fx.shape[1]:
+            return result
+        chunk = max(1, MAX_PAIRWISE // fx.shape[1])
+        for start in range(0, worlds.size, chunk):
+            w = worlds[start:start + chunk]
+            s = slots[start:start + chunk]
+            dist = np.hypot(fx[w] - self.x[w, s, None], fy[w] - self.y[w, s, None])
+            visible = alive[w] & (dist <= self.vision[w, s, None])
+            mine = self.target[w, s, None] == food[None, :]
+            untargeted = visible & (claims[w] - mine <= 0)
+            best_any = np.where(visible, dist, np.inf).argmin(axis=1)
+            best_free = np.where(untargeted, dist, np.inf).argmin(axis=1)
+            pick = np.where(untargeted.any(axis=1), best_free, np.where(visible.any(axis=1), best_any, -1))
+            result[start:start + chunk] = pick
+        return result
+
+    def _move(self, active, dx, dy):
+        self.energy[active] -= np.sqrt(dx[active] ** 2 + dy[active] ** 2) * self.metabolism[active]
+        new_x = np.clip(self.x + dx, 0, SCREEN_WIDTH - CREATURE_SIZE)
+        new_y = np.clip(self.y + dy, 0, SCREEN_HEIGHT - CREATURE_SIZE)
+        # Block moves that would put the center in the lake
+        ok = active & ~in_lake(new_x + CREATURE_SIZE // 2, new_y + CREATURE_SIZE // 2, self.water)
+        self.x[ok] = new_x[ok]
+        self.y[ok] = new_y[ok]
+
+    def _drink(self, active):
+        # Center or any corner in the lake resets thirst
+        x, y = self.x, self.y
+        water = self.water
+        edge = CREATURE_SIZE - 1
+        wet = (water[y + CREATURE_SIZE // 2, x + CREATURE_SIZE // 2] | water[y, x] | water[y, x + edge]
+               | water[y + edge, x] | water[y + edge, x + edge])
+        self.thirst[active & wet] = 0
+
+    def _eat(self):
+        fx = self.food_x.reshape(self.worlds, -1)
+        fy = self.food_y.reshape(self.worlds, -1)
+        alive = self.food_alive.reshape(self.worlds, -1)
+        if not alive.any():
+            return
+        worlds, slots = np.nonzero(self.alive)
+        chunk = max(1, MAX_PAIRWISE // fx.shape[1])
+        hit_worlds, hit_slots, hits = [], [], []
+        for start in range(0, worlds.size, chunk):
+            w = worlds[start:start + chunk]
+            s = slots[start:start + chunk]
+            hit = alive[w] & ((self.x[w, s, None] - fx[w]) ** 2 + (self.y[w, s, None] - fy[w]) ** 2 < 100)
+            touching = hit.any(axis=1)
+            hit_worlds.append(w[touching])
+            hit_slots.append(s[touching])
+            hits.append(hit[touching])
+        worlds = np.concatenate(hit_worlds)
+        if not worlds.size:
+            return
+        slots = np.concatenate(hit_slots)
+        hits = np.concatenate(hits)
+        eaten = alive.copy()
+
+        # Creatures touching food take turns in slot order, one per world per
+        # round, so different worlds never compete and a world only needs as
+        # many rounds as it has creatures touching food
+        turn = ranks(worlds)
+        for r in range(int(turn.max()) + 1):
+            now = turn == r
+            w = worlds[now]
+            choices = hits[now] & alive[w]
+            has = choices.any(axis=1)
+            w = w[has]
+            food = choices[has].argmax(axis=1)
+            self.hunger[w, slots[now][has]] = 0
+            alive[w, food] = False
+
+        # Claims on eaten food are dropped
+        eaten &= ~alive
+        claimed = self.target >= 0
+        stale = np.zeros(self.target.shape, dtype=bool)
+        stale[claimed] = eaten[np.nonzero(claimed)[0], self.target[claimed]]
+        self.target[stale] = -1
+
+    def _reproduce(self):
+        cfg = self.config
+        eligible = (self.alive & (self.energy > 80) & (self.hunger < cfg.hunger_threshold)
+                    & (self.thirst < cfg.thirst_threshold) & (self.age > 600) & (self.cooldown == 0))
+        females = eligible & ~self.male
+        males = eligible & self.male
+        pairing = np.flatnonzero(females.any(axis=1) & males.any(axis=1))
+        if not pairing.size:
+            return
+        x, y = self.x[pairing], self.y[pairing]
+        touching = (females[pairing, :, None] & males[pairing, None, :]
+                    & rects_overlap(x[:, :, None], y[:, :, None], x[:, None, :], y[:, None, :], CREATURE_SIZE))
+
+        # Each female pairs with the first free male she touches, females
+        # taking turns in slot order within each world
+        rows, mothers = np.nonzero(touching.any(axis=2))
+        if not rows.size:
+            return
+        used = np.zeros((pairing.size, self.x.shape[1]), dtype=bool)
+        turn = ranks(rows)
+        kids = []
+        for r in range(int(turn.max()) + 1):
+            now = turn == r
+            row, mother = rows[now], mothers[now]
+            free = touching[row, mother] & ~used[row]
+            has = free.any(axis=1)
+            row, mother = row[has], mother[has]
+            father = free[has].argmax(axis=1)
+            used[row, father] = True
+            kids.append((pairing[row], mother, father))
+        worlds = np.concatenate([k[0] for k in kids])
+        mothers = np.concatenate([k[1] for k in kids])
+        fathers = np.concatenate([k[2] for k in kids])
+        order = np.argsort(worlds, kind='stable')
+        worlds, mothers, fathers = worlds[order], mothers[order], fathers[order]
+
+        for parents in (mothers, fathers):
+            self.energy[worlds, parents] /= 2
+            self.cooldown[worlds, parents] = cfg.reproduction_cooldown
+        self._add_children(worlds, mothers, fathers)
+
+    def _add_children(self, worlds, mothers, fathers):
+        # worlds must be sorted; each child takes the next free slot in its world
+        cfg = self.config
+        k = worlds.size
+        genes = []
+        for name, floor in (('vision', 0.1), ('speed', 0.1), ('metabolism', 0.001)):
+            values = getattr(self, name)
+            values = (values[worlds, mothers] + values[worlds, fathers]) / 2
+            mutate = self.rng.random(k) < cfg.mutation_rate
+            values[mutate] *= self.rng.uniform(0.9, 1.1, mutate.sum())
+            values[mutate] = np.maximum(floor, values[mutate])
+            genes.append(values)
+        color = ((self.color[worlds, mothers] + self.color[worlds, fathers]) / 2).astype(np.int64)
+        mutate = self.rng.random((k, 3)) < cfg.mutation_rate * 2
+        color[mutate] = np.clip(color[mutate] + self.rng.integers(-20, 21, mutate.sum()), 0, 255)
+        male = self.rng.random(k) < 0.5
+
+        births = np.bincount(worlds, minlength=self.worlds)
+        self.births += births
+        short = births - (~self.alive).sum(axis=1)
+        if short.max() > 0:
+            # Double the slot axis (or more) so growth is rare
+            self._grow_slots(max(int(short.max()), self.x.shape[1]))
+        free_worlds, free_slots = np.nonzero(~self.alive)
+        slots = free_slots[np.searchsorted(free_worlds, worlds) + ranks(worlds)]
+        self._place(worlds, slots, self.x[worlds, mothers], self.y[worlds, mothers], *genes, color, male)
+
+    def _grow_food(self, bushes):
+        # Each chosen bush below capacity grows one food item in its first free slot
+        bushes = bushes & self.bush_ok & (self.food_alive.sum(axis=2) < FOOD_PER_BUSH)
+        worlds, index = np.nonzero(bushes)
+        if not worlds.size:
+            return
+        slots = np.argmin(self.food_alive[worlds, index], axis=1)
+        fx = self.bush_x[worlds, index] + 24 + self.rng.integers(-16, 17, worlds.size)
+        fy = self.bush_y[worlds, index] + 24 + self.rng.integers(-16, 17, worlds.size)
+        self.food_x[worlds, index, slots] = np.clip(fx, FOOD_RADIUS, SCREEN_WIDTH - FOOD_RADIUS)
+        self.food_y[worlds, index, slots] = np.clip(fy, FOOD_RADIUS, SCREEN_HEIGHT - FOOD_RADIUS)
+        self.food_alive[worlds, index, slots] = True
+
+    def history(self, world):
+        # Logged rows for one world, as tuples like World.history
+        return [(int(row[0]), float(row[1]), float(row[2]), float(row[3]), int(row[4]), int(row[5]))
+                for row, mask in zip((r[world] for r in self.rows), (m[world] for m in self.row_mask)) if mask]
+
+    def death_causes(self, world):
+        return {name: int(self.causes[world, code - 1]) for code, name in CAUSE_NAMES.items()}
+
+    def survivor_data(self, world, count=2):
+        # Oldest creatures of one world, in best_survivor.json format
+        pop = self.alive[world] if self.alive[world].any() else self.final[world]
+        slots = np.flatnonzero(pop)
+        data = []
+        for i in slots[np.argsort(-self.age[world, slots], kind='stable')[:count]]:
+            data.append({
+                'genes': {
+                    'vision': float(self.vision[world, i]),
+                    'speed': float(self.speed[world, i]),
+                    'metabolism': float(self.metabolism[world, i]),
+                    'color': dict(zip('RGB', (int(v) for v in self.color[world, i]))),
+                },
+                'sex': 'male' if self.male[world, i] else 'female',
+            })
+        return data
+
+    def run(self, max_frames=None):
+        # Step every world until all are extinct or max_frames; worlds that die
+        # out early stop counting frames and logging history
+        frames = 0
+        start = time.perf_counter()
+        while self.alive.any() and (max_frames is None or frames < max_frames):
+            self.update()
+            frames += 1
+        return time.perf_counter() - start
+
+    def results(self, survivor_count=2):
+        # One run_headless-style result per world
+        population = self.population
+        return [{
+            'world': world,
+            'frames': int(self.frames[world]),
+            'population': int(population[world]),
+            'death_causes': self.death_causes(world),
+            'history': self.history(world),
+            'survivors': self.survivor_data(world, survivor_count),
+        } for world in range(self.worlds)]
@@ -0,0 +1,77 @@
+import time
+
+
+class PhaseProfiler:
+    # Opt-in per-phase timing for World.update. The world calls begin() at the
+    # start of a tick and lap(phase) after each phase, which charges the time
+    # since the previous lap to that phase. Counters hold work done (distance
+    # checks, food candidates, ...). A world without a profiler pays only an
+    # `is not None` test per hook.
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.reset()
+
+    def reset(self):
+        self.times = {}
+        self.calls = {}
+        self.counters = {}
+        self.ticks = 0
+        self._last = None
+
+    def begin(self):
+        self.ticks += 1
+        self._last = self.clock()
+
+    def lap(self, phase):
+        now = self.clock()
+        self.times[phase] = self.times.get(phase, 0.0) + (now - self._last)
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+        self._last = now
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    @property
+    def total(self):
+        return sum(self.times.values())
+
+    def report(self):
+        total = self.total
+        ticks = self.ticks or 1
+        return {
+            'ticks': self.ticks,
+            'phases': {
+                phase: {
+                    'seconds': seconds,
+                    'calls': self.calls[phase],
+                    'ms_per_tick': 1000 * seconds / ticks,
+                    'share': seconds / total if total else 0.0,
+                }
+                for phase, seconds in sorted(self.times.items(), key=lambda item: -item[1])
+            },
+            'counters': {name: {'total': n, 'per_tick': n / ticks} for name, n in self.counters.items()},
+        }
+
+    def lines(self):
+        # Short text lines for the overlay and the headless summary
+        report = self.report()
+        lines = [f"{phase}: {p['ms_per_tick']:.2f} ms/tick ({p['share']:.0%})" for phase, p in report['phases'].items()]
+        lines += [f"{name}: {c['per_tick']:.0f}/tick" for name, c in report['counters'].items()]
+        return lines
+
+
+class CountingGrid:
+    # Stands in for the food grid while profiling so that the food searches
+    # inside Creature.think are counted without touching creature code
+    def __init__(self, grid, profiler):
+        self.grid = grid
+        self.profiler = profiler
+
+    def query(self, x, y, radius):
+        counters = self.profiler.counters
+        counters['food_queries'] = counters.get('food_queries', 0) + 1
+        scanned = 0
+        for item in self.grid.query(x, y, radius):
+            scanned += 1
+            yield item
+        counters['food_candidates'] = counters.get('food_candidates', 0) + scanned
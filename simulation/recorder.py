@@ -0,0 +1,116 @@
+import json
+import os
+import sys
+from array import array
+from simulation.writer import write_json
+
+# Same order as the World.history tuples
+COLUMNS = ('frame', 'avg_vision', 'avg_speed', 'avg_metabolism', 'total_food', 'total_population')
+META_FILE = 'meta.json'
+
+
+class HistoryRecorder:
+    # Streams history rows to disk as one raw float64 file per column.
+    # Rows are buffered in array('d') columns and appended to the files every
+    # `chunk_rows` rows, so memory stays bounded however long the run is.
+    # load_history() maps the files back without reading them into memory.
+    # With a BackgroundWriter, full chunks are handed off as bytes and written
+    # on its thread. resume_rows continues an earlier recording: the files
+    # are cut back to that many rows (the count saved with a checkpoint) and
+    # appended to.
+    def __init__(self, path, columns=COLUMNS, chunk_rows=4096, writer=None, resume_rows=None):
+        self.path = path
+        self.columns = tuple(columns)
+        self.chunk_rows = chunk_rows
+        self.writer = writer
+        self.buffers = [array('d') for _ in self.columns]
+        self.rows = 0  # rows flushed (written, or queued on the writer)
+        os.makedirs(path, exist_ok=True)
+        if resume_rows is None:
+            for name in self.columns:
+                # Start from empty files so a reused directory doesn't mix runs
+                open(self._column_path(name), 'wb').close()
+        else:
+            size = resume_rows * 8
+            for name in self.columns:
+                with open(self._column_path(name), 'ab') as f:
+                    if f.tell() < size:
+                        raise ValueError(f"{path} has fewer than the {resume_rows} rows this run had recorded")
+                    f.truncate(size)
+            self.rows = resume_rows
+        self._write_meta(self._meta())
+
+    def _column_path(self, name):
+        return os.path.join(self.path, name + '.f64')
+
+    def _meta(self):
+        return {
+            'columns': list(self.columns),
+            'dtype': ('<' if sys.byteorder == 'little' else '>') + 'f8',
+            'rows': self.rows,
+        }
+
+    def _write_meta(self, meta):
+        write_json(os.path.join(self.path, META_FILE), meta)
+
+    def _write_chunks(self, chunks, meta):
+        for name, chunk in zip(self.columns, chunks):
+            with open(self._column_path(name), 'ab') as f:
+                f.write(chunk)
+        self._write_meta(meta)
+
+    def append(self, row):
+        for buffer, value in zip(self.buffers, row):
+            buffer.append(value)
+        if len(self.buffers[0]) >= self.chunk_rows:
+            self.flush()
+
+    def flush(self):
+        pending = len(self.buffers[0])
+        if not pending:
+            return
+        chunks = [buffer.tobytes() for buffer in self.buffers]
+        for buffer in self.buffers:
+            del buffer[:]
+        self.rows += pending
+        if self.writer is not None:
+            self.writer.submit(self._write_chunks, chunks, self._meta())
+        else:
+            self._write_chunks(chunks, self._meta())
+
+    def close(self):
+        self.flush()
+        if self.writer is not None:
+            self.writer.flush()
+
+    def __len__(self):
+        return self.rows + len(self.buffers[0])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_history(path, mmap=True):
+    # {column: array} for a recorder directory; memory-mapped by default.
+    # The row count comes from the file sizes, so a run that died between
+    # flushes still loads everything that reached the disk.
+    import numpy as np
+    with open(os.path.join(path, META_FILE)) as f:
+        meta = json.load(f)
+    dtype = np.dtype(meta['dtype'])
+    columns = {}
+    for name in meta['columns']:
+        column_path = os.path.join(path, name + '.f64')
+        rows = os.path.getsize(column_path) // dtype.itemsize
+        if rows == 0:
+            columns[name] = np.zeros(0, dtype=dtype)
+        elif mmap:
+            columns[name] = np.memmap(column_path, dtype=dtype, mode='r', shape=(rows,))
+        else:
+            columns[name] = np.fromfile(column_path, dtype=dtype, count=rows)
+    # Columns are written together; trim to the shortest in case of a partial flush
+    rows = min((len(c) for c in columns.values()), default=0)
+    return {name: c[:rows] for name, c in columns.items()}
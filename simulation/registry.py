@@ -0,0 +1,48 @@
+from simulation.spatial import SpatialGrid
+
+
+class FoodRegistry:
+    # Every food item in the world under a stable integer id, plus a spatial
+    # index over their positions. Adding and removing are O(1) and contact
+    # queries only look at food in nearby grid cells, so the world never has
+    # to rebuild a food list or scan every bush. Iterates in id (growth) order.
+    # Bushes keep it in sync through the same insert/remove calls as a SpatialGrid.
+    def __init__(self, cell_size=64):
+        self.items = {}  # id -> food
+        self.grid = SpatialGrid(cell_size)
+        self.next_id = 0
+
+    def insert(self, food):
+        food.id = self.next_id
+        self.next_id += 1
+        self.items[food.id] = food
+        self.grid.insert(food)
+        return food.id
+
+    def remove(self, food):
+        if self.items.get(getattr(food, 'id', None)) is food:
+            del self.items[food.id]
+            self.grid.remove(food)
+
+    def get(self, food_id):
+        return self.items.get(food_id)
+
+    def __contains__(self, food):
+        return self.items.get(getattr(food, 'id', None)) is food
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items.values())
+
+    def query(self, x, y, radius):
+        # Broad-phase candidates, as SpatialGrid.query
+        return self.grid.query(x, y, radius)
+
+    def contacts(self, x, y, radius):
+        # Food strictly within `radius` of (x, y), in id order
+        r2 = radius * radius
+        found = [f for f in self.grid.query(x, y, radius) if (f.x - x) ** 2 + (f.y - y) ** 2 < r2]
+        found.sort(key=lambda f: f.id)
+        return found
@@ -0,0 +1,57 @@
+import pygame
+
+GRASS_COLOR = (0, 255, 0)
+LAKE_COLOR = (0, 100, 200)
+
+
+class Renderer:
+    # Draws a World on top of a cached background (grass, lakes, bushes) and
+    # tracks which rectangles changed so only those are pushed to the display.
+    def __init__(self, screen, max_rects=300):
+        self.screen = screen
+        self.max_rects = max_rects  # above this many rects a full flip is cheaper
+        self.background = None
+        self.background_key = None
+        self.dirty = []    # rects drawn this frame, restored from background next frame
+        self.updated = []  # rects restored this frame
+
+    def _refresh_background(self, world):
+        key = (world.terrain.lakes, tuple((bush.x, bush.y) for bush in world.bushes))
+        if self.background is not None and key == self.background_key:
+            return False
+        background = self.screen.copy()
+        background.fill(GRASS_COLOR)
+        for lake in world.terrain.lakes:
+            pygame.draw.ellipse(background, LAKE_COLOR, lake)
+        for bush in world.bushes:
+            bush.draw_base(background)
+        self.background = background
+        self.background_key = key
+        return True
+
+    def draw(self, world):
+        screen = self.screen
+        if self._refresh_background(world):
+            screen.blit(self.background, (0, 0))
+            self.updated = [screen.get_rect()]
+        else:
+            for rect in self.dirty:
+                screen.blit(self.background, rect, rect)
+            self.updated = self.dirty
+        self.dirty = []
+        for bush in world.bushes:
+            for food in bush.food:
+                self.dirty.append(food.draw(screen))
+        for creature in world.creatures:
+            self.dirty.append(creature.draw(screen))
+
+    def mark_dirty(self, rect):
+        # Overlays drawn after draw() (selection box, info panel)
+        self.dirty.append(pygame.Rect(rect))
+
+    def present(self):
+        rects = self.updated + self.dirty
+        if len(rects) > self.max_rects:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
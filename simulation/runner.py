@@ -0,0 +1,37 @@
+import time
+
+
+def run_headless(world, max_frames=None, render_every=None, render=None, checkpointer=None):
+    # Step the world as fast as possible until max_frames or extinction.
+    # render(world) is only called every render_every frames.
+    frames = 0
+    start = time.perf_counter()
+    while world.population and (max_frames is None or frames < max_frames):
+        world.update()
+        frames += 1
+        if checkpointer is not None:
+            checkpointer.step(world)
+        if render is not None and render_every and frames % render_every == 0:
+            if render(world) is False:
+                break
+    elapsed = time.perf_counter() - start
+    result = {
+        'frames': frames,
+        'elapsed': elapsed,
+        'ticks_per_sec': frames / elapsed if elapsed > 0 else 0.0,
+        'population': world.population,
+        'death_causes': dict(world.death_causes),
+    }
+    profiler = getattr(world, 'profiler', None)
+    if profiler is not None:
+        result['profile'] = profiler.report()
+    return result
+
+
+def survivor_data(world, count=2):
+    # Oldest creatures of the last population, in best_survivor.json format
+    if hasattr(world, 'survivor_data'):
+        return world.survivor_data(count)
+    population = world.creatures or world.last_population
+    best = sorted(population, key=lambda c: getattr(c, 'age', 0), reverse=True)[:count]
+    return [{'genes': c.genes.to_dict(), 'sex': c.sex} for c in best]
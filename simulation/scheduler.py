@@ -0,0 +1,59 @@
+import time
+
+
+class TickScheduler:
+    # Decouples simulation ticks from rendered frames: each frame runs
+    # ticks_per_frame World.update() calls, and when adaptive the count is
+    # tuned so the ticks take about `budget` seconds of wall-clock time.
+    def __init__(self, ticks_per_frame=1, budget=1 / 80, adaptive=True,
+                 min_ticks=1, max_ticks=10000, window=1.0, clock=time.perf_counter):
+        self.ticks_per_frame = ticks_per_frame
+        self.budget = budget
+        self.adaptive = adaptive
+        self.min_ticks = min_ticks
+        self.max_ticks = max_ticks
+        self.window = window
+        self.clock = clock
+        self.total_ticks = 0
+        self.total_frames = 0
+        self.ticks_per_sec = 0.0
+        self.frames_per_sec = 0.0
+        self._window_start = clock()
+        self._window_ticks = 0
+        self._window_frames = 0
+
+    def step(self, world):
+        # Run this frame's ticks; stops early if the population dies out
+        start = self.clock()
+        ticks = 0
+        while ticks < self.ticks_per_frame and world.population:
+            world.update()
+            ticks += 1
+        elapsed = self.clock() - start
+        if self.adaptive and ticks:
+            self._adapt(elapsed / ticks)
+        self.total_ticks += ticks
+        self._window_ticks += ticks
+        self._frame_done()
+        return ticks
+
+    def _adapt(self, tick_time):
+        if tick_time <= 0:
+            wanted = self.max_ticks
+        else:
+            wanted = self.budget / tick_time
+        # Move halfway towards the target to avoid oscillating on noisy frames
+        ticks = round((self.ticks_per_frame + wanted) / 2)
+        self.ticks_per_frame = max(self.min_ticks, min(self.max_ticks, ticks))
+
+    def _frame_done(self):
+        self.total_frames += 1
+        self._window_frames += 1
+        now = self.clock()
+        span = now - self._window_start
+        if span >= self.window:
+            self.ticks_per_sec = self._window_ticks / span
+            self.frames_per_sec = self._window_frames / span
+            self._window_start = now
+            self._window_ticks = 0
+            self._window_frames = 0
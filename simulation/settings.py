@@ -0,0 +1,66 @@
+import dataclasses
+import hashlib
+import json
+from dataclasses import dataclass
+from config import MUTATION_RATE, ENERGY_MAX, REST_ENERGY_GAIN, VISION_MIN, VISION_MAX, SPEED_MIN, SPEED_MAX
+from config import HUNGER_MAX, HUNGER_THRESHOLD, THIRST_MAX, THIRST_THRESHOLD, REPRODUCTION_COOLDOWN
+from config import FOOD_SPAWN_INTERVAL, CREATURE_COUNT, LOG_INTERVAL
+
+
+@dataclass(frozen=True)
+class SimulationConfig:
+    # Per-world copy of the tunable config.py values, so worlds with different
+    # settings can run side by side in one process. Field names are the
+    # lower-cased config constants.
+    mutation_rate: float = MUTATION_RATE
+    energy_max: float = ENERGY_MAX
+    rest_energy_gain: float = REST_ENERGY_GAIN
+    vision_min: float = VISION_MIN
+    vision_max: float = VISION_MAX
+    speed_min: float = SPEED_MIN
+    speed_max: float = SPEED_MAX
+    hunger_max: float = HUNGER_MAX
+    hunger_threshold: float = HUNGER_THRESHOLD
+    thirst_max: float = THIRST_MAX
+    thirst_threshold: float = THIRST_THRESHOLD
+    reproduction_cooldown: int = REPRODUCTION_COOLDOWN
+    food_spawn_interval: int = FOOD_SPAWN_INTERVAL
+    creature_count: int = CREATURE_COUNT
+    log_interval: int = LOG_INTERVAL
+
+    @classmethod
+    def from_dict(cls, values):
+        names = {field.name for field in dataclasses.fields(cls)}
+        unknown = set(values) - names
+        if unknown:
+            raise ValueError(f"unknown settings: {', '.join(sorted(unknown))}")
+        return cls(**values)
+
+    @classmethod
+    def cast(cls, name, value):
+        # A value (or string) as the declared type of setting `name`, so equal
+        # settings such as 3 and 3.0 hash the same
+        fields = {field.name: field for field in dataclasses.fields(cls)}
+        if name not in fields:
+            raise ValueError(f"unknown setting: {name}")
+        kind = fields[name].type
+        if kind is int:
+            number = float(value)
+            if number != int(number):
+                raise ValueError(f"{name} must be a whole number, not {value}")
+            return int(number)
+        return kind(value)
+
+    def replace(self, **changes):
+        return dataclasses.replace(self, **changes)
+
+    def to_dict(self):
+        return dataclasses.asdict(self)
+
+    def digest(self):
+        # Stable hash of the values, used to key cached sweep results
+        return hashlib.sha256(json.dumps(self.to_dict(), sort_keys=True).encode()).hexdigest()
+
+
+# Settings used by worlds and creatures created without their own config
+DEFAULT_CONFIG = SimulationConfig()
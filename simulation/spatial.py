@@ -0,0 +1,83 @@
+class SpatialGrid:
+    # Uniform grid index over objects with fixed x/y positions (e.g. food).
+    # Cells are dicts so iteration order follows insertion and stays deterministic.
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.keys = {}  # item -> cell key it was inserted under
+
+    def _key(self, x, y):
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def insert(self, item):
+        key = self._key(item.x, item.y)
+        self.cells.setdefault(key, {})[item] = None
+        self.keys[item] = key
+
+    def remove(self, item):
+        key = self.keys.pop(item, None)
+        if key is None:
+            return
+        cell = self.cells[key]
+        del cell[item]
+        if not cell:
+            del self.cells[key]
+
+    def __contains__(self, item):
+        return item in self.keys
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __iter__(self):
+        return iter(list(self.keys))
+
+    def query(self, x, y, radius):
+        # Yield every item in a cell overlapping the square around (x, y).
+        # Callers still do the exact distance test, and must not insert or
+        # remove while iterating.
+        kx0, ky0 = self._key(x - radius, y - radius)
+        kx1, ky1 = self._key(x + radius, y + radius)
+        if len(self.cells) < (kx1 - kx0 + 1) * (ky1 - ky0 + 1):
+            # Sparse grid: cheaper to walk the occupied cells than the whole square
+            for (kx, ky), cell in self.cells.items():
+                if kx0 <= kx <= kx1 and ky0 <= ky <= ky1:
+                    yield from cell
+            return
+        for kx in range(kx0, kx1 + 1):
+            for ky in range(ky0, ky1 + 1):
+                cell = self.cells.get((kx, ky))
+                if cell:
+                    yield from cell
+
+
+def find_overlapping_pairs(firsts, seconds, size=40):
+    # Broad-phase for size x size boxes at (x, y): pair each item of `firsts`,
+    # in order, with the earliest item of `seconds` not already taken whose box
+    # overlaps its own. Buckets of `size` pixels mean only the 3x3 neighbouring
+    # buckets can hold an overlapping box.
+    buckets = {}
+    for index, item in enumerate(seconds):
+        key = (int(item.x) // size, int(item.y) // size)
+        buckets.setdefault(key, []).append(index)
+    taken = set()
+    pairs = []
+    for first in firsts:
+        fx, fy = int(first.x), int(first.y)
+        kx, ky = fx // size, fy // size
+        best = None
+        for bx in (kx - 1, kx, kx + 1):
+            for by in (ky - 1, ky, ky + 1):
+                for index in buckets.get((bx, by), ()):
+                    if best is not None and index >= best:
+                        break  # bucket lists are in ascending index order
+                    if index in taken:
+                        continue
+                    other = seconds[index]
+                    if abs(int(other.x) - fx) < size and abs(int(other.y) - fy) < size:
+                        best = index
+                        break
+        if best is not None:
+            taken.add(best)
+            pairs.append((first, seconds[best]))
+    return pairs
@@ -0,0 +1,163 @@
+import heapq
+import math
+from collections import Counter
+from simulation.genes import GENE_INDEX
+from config import VISION_MIN, VISION_MAX, SPEED_MIN, SPEED_MAX
+
+TRACKED_GENES = ('vision', 'speed', 'metabolism')
+# Histogram bin widths: 20 bins across each gene's starting range
+BIN_WIDTHS = {
+    'vision': (VISION_MAX - VISION_MIN) / 20,
+    'speed': (SPEED_MAX - SPEED_MIN) / 20,
+    'metabolism': (0.2 - 0.02) / 20,
+}
+
+
+class RunningStat:
+    # Count, sum and sum of squares for O(1) mean/variance, plus lazy-deletion
+    # heaps so min/max survive removals without rescanning the population
+    __slots__ = ('count', 'total', 'total_sq', '_low', '_high', '_gone_low', '_gone_high')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self._low = []
+        self._high = []
+        self._gone_low = Counter()
+        self._gone_high = Counter()
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        self.total_sq += value * value
+        heapq.heappush(self._low, value)
+        heapq.heappush(self._high, -value)
+
+    def remove(self, value):
+        self.count -= 1
+        if self.count == 0:
+            # Reset exactly so float error can't pile up across extinctions
+            self.__init__()
+            return
+        self.total -= value
+        self.total_sq -= value * value
+        self._gone_low[value] += 1
+        self._gone_high[-value] += 1
+        if len(self._low) > 2 * self.count + 32:
+            self._low = self._compact(self._low, self._gone_low)
+            self._high = self._compact(self._high, self._gone_high)
+
+    @staticmethod
+    def _compact(heap, gone):
+        live = list((Counter(heap) - gone).elements())
+        gone.clear()
+        heapq.heapify(live)
+        return live
+
+    @staticmethod
+    def _top(heap, gone):
+        while gone[heap[0]]:
+            gone[heap[0]] -= 1
+            heapq.heappop(heap)
+        return heap[0]
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+    @property
+    def variance(self):
+        if not self.count:
+            return 0
+        return max(0.0, self.total_sq / self.count - self.mean ** 2)
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+    @property
+    def min(self):
+        return self._top(self._low, self._gone_low) if self.count else None
+
+    @property
+    def max(self):
+        return -self._top(self._high, self._gone_high) if self.count else None
+
+
+class PopulationStats:
+    # Per-gene running aggregates for the whole population and for each sex,
+    # updated on birth and death so queries never scan the creatures.
+    # The values counted for each creature are kept so removal subtracts
+    # exactly those, even if its genes or sex changed in between.
+    def __init__(self, genes=TRACKED_GENES, bin_widths=BIN_WIDTHS):
+        self.genes = tuple(genes)
+        self.bin_widths = dict(bin_widths)
+        self.groups = {}
+        self.histograms = {name: Counter() for name in self.genes}
+        self.added = {}
+
+    def _group(self, key):
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = {name: RunningStat() for name in self.genes}
+        return group
+
+    def _bin(self, name, value):
+        return math.floor(value / self.bin_widths[name])
+
+    def add(self, creature):
+        values = creature.genes.values
+        counted = tuple(values[GENE_INDEX[name]] for name in self.genes)
+        self.added[creature] = (creature.sex, counted)
+        everyone, by_sex = self._group(None), self._group(creature.sex)
+        for name, value in zip(self.genes, counted):
+            everyone[name].add(value)
+            by_sex[name].add(value)
+            self.histograms[name][self._bin(name, value)] += 1
+
+    def remove(self, creature):
+        sex, counted = self.added.pop(creature)
+        everyone, by_sex = self._group(None), self._group(sex)
+        for name, value in zip(self.genes, counted):
+            everyone[name].remove(value)
+            by_sex[name].remove(value)
+            histogram = self.histograms[name]
+            b = self._bin(name, value)
+            histogram[b] -= 1
+            if not histogram[b]:
+                del histogram[b]
+
+    def reset(self, creatures):
+        self.__init__(self.genes, self.bin_widths)
+        for c in creatures:
+            self.add(c)
+
+    def stat(self, gene, sex=None):
+        return self._group(sex)[gene]
+
+    def count(self, sex=None):
+        return self._group(sex)[self.genes[0]].count
+
+    def mean(self, gene, sex=None):
+        return self.stat(gene, sex).mean
+
+    def variance(self, gene, sex=None):
+        return self.stat(gene, sex).variance
+
+    def min(self, gene, sex=None):
+        return self.stat(gene, sex).min
+
+    def max(self, gene, sex=None):
+        return self.stat(gene, sex).max
+
+    def histogram(self, gene):
+        # [(bin lower edge, count)] for occupied bins, in ascending order
+        width = self.bin_widths[gene]
+        return [(b * width, n) for b, n in sorted(self.histograms[gene].items())]
+
+    def summary(self, sex=None):
+        return {
+            name: {'mean': s.mean, 'std': s.std, 'min': s.min, 'max': s.max}
+            for name, s in self._group(sex).items()
+        } | {'count': self.count(sex)}
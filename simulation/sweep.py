@@ -0,0 +1,130 @@
+import hashlib
+import itertools
+import json
+import os
+import random
+from multiprocessing import Pool
+from simulation.runner import run_headless, survivor_data
+from simulation.settings import DEFAULT_CONFIG, SimulationConfig
+from simulation.writer import write_json
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def code_version():
+    # Hash of the simulation sources and config.py, so cached results are
+    # recomputed whenever the code that produced them changes
+    digest = hashlib.sha256()
+    paths = [os.path.join(ROOT, 'config.py')]
+    simulation = os.path.join(ROOT, 'simulation')
+    paths += sorted(os.path.join(simulation, name) for name in os.listdir(simulation) if name.endswith('.py'))
+    for path in paths:
+        digest.update(os.path.relpath(path, ROOT).encode())
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def grid(space):
+    # Every combination of {setting: [values]}, in sorted setting order
+    names = sorted(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[name] for name in names))]
+
+
+def random_points(space, count, seed=0):
+    # `count` points drawn from {setting: (low, high) or [choices]}
+    rng = random.Random(seed)
+    points = []
+    for _ in range(count):
+        point = {}
+        for name in sorted(space):
+            values = space[name]
+            if isinstance(values, tuple):
+                low, high = values
+                point[name] = rng.randint(low, high) if isinstance(low, int) and isinstance(high, int) else rng.uniform(low, high)
+            else:
+                point[name] = rng.choice(values)
+        points.append(point)
+    return points
+
+
+class ResultCache:
+    # One JSON file per result, named by the hash of everything that decides
+    # the result: the full config, the seed, the run length and the code version
+    def __init__(self, directory, version=None):
+        self.directory = directory
+        self.version = version if version is not None else code_version()
+
+    def key(self, config, seed, max_frames):
+        payload = json.dumps([config.digest(), seed, max_frames, self.version])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key[:2], key + '.json')
+
+    def get(self, key):
+        try:
+            with open(self.path(key)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key, result):
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_json(path, result)
+
+
+def run_point(spec):
+    # One world for one (settings, seed); spec is a plain dict so it can go to a worker process
+    from simulation.world import World
+    config = SimulationConfig.from_dict(spec['config'])
+    world = World(seed=spec['seed'], config=config)
+    result = run_headless(world, max_frames=spec.get('max_frames'))
+    return {
+        'frames': result['frames'],
+        'population': result['population'],
+        'death_causes': result['death_causes'],
+        'history': [list(row) for row in world.history],
+        'survivors': survivor_data(world),
+    }
+
+
+def run_sweep(points, seeds=(0,), max_frames=None, base=None, processes=None, cache_dir=None):
+    # Run every point (a dict of settings overrides on `base`) for every seed.
+    # Results already in the cache are reused and only the missing ones run.
+    base = base if base is not None else DEFAULT_CONFIG
+    cache = ResultCache(cache_dir) if cache_dir else None
+    rows, missing, pending = [], [], {}
+    for overrides in points:
+        overrides = {name: SimulationConfig.cast(name, value) for name, value in overrides.items()}
+        config = base.replace(**overrides)
+        for seed in seeds:
+            row = {'overrides': overrides, 'seed': seed, 'config': config.to_dict()}
+            key = cache.key(config, seed, max_frames) if cache else None
+            cached = cache.get(key) if cache else None
+            row['cached'] = cached is not None
+            row['result'] = cached
+            rows.append(row)
+            if cached is None:
+                if key in pending:
+                    # The same point repeats within this sweep; run it once
+                    pending[key].append(row)
+                    continue
+                missing.append((row, key))
+                if key is not None:
+                    pending[key] = [row]
+
+    specs = [{'config': row['config'], 'seed': row['seed'], 'max_frames': max_frames} for row, _ in missing]
+    if processes == 1 or len(specs) <= 1:
+        results = [run_point(spec) for spec in specs]
+    else:
+        with Pool(processes) as pool:
+            results = pool.map(run_point, specs)
+    for (row, key), result in zip(missing, results):
+        row['result'] = result
+        if cache:
+            cache.put(key, result)
+            for repeat in pending[key]:
+                repeat['result'] = result
+    return rows
@@ -0,0 +1,35 @@
+class TargetRegistry:
+    # Reservation table of food -> creature that claimed it. The claim is
+    # mirrored on Food.targeted_by and Creature.target so checking whether a
+    # food item is taken is O(1) instead of scanning every creature.
+    def __init__(self):
+        self.claimants = {}
+
+    def __len__(self):
+        return len(self.claimants)
+
+    def claimant(self, food):
+        return self.claimants.get(food)
+
+    def claim(self, creature, food):
+        if creature.target is not food:
+            self.release(creature)
+            creature.target = food
+        # Food already reserved by someone else keeps its first claimant
+        if food is not None and food not in self.claimants:
+            self.claimants[food] = creature
+            food.targeted_by = creature
+
+    def release(self, creature):
+        food = creature.target
+        creature.target = None
+        if food is not None and self.claimants.get(food) is creature:
+            del self.claimants[food]
+            food.targeted_by = None
+
+    def release_food(self, food):
+        # Food was eaten: drop its reservation and clear the claimant's target
+        creature = self.claimants.pop(food, None)
+        food.targeted_by = None
+        if creature is not None and creature.target is food:
+            creature.target = None
@@ -0,0 +1,168 @@
+import math
+from collections import deque
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, LAKE_X, LAKE_Y, LAKE_WIDTH, LAKE_HEIGHT
+
+
+class Terrain:
+    # Water occupancy raster at world resolution (one byte per pixel), so
+    # "is this point in a lake" is a table lookup instead of ellipse math.
+    # Lakes are (x, y, width, height) ellipses; any other shape can be painted
+    # into `water` directly with set_water().
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, lakes=((LAKE_X, LAKE_Y, LAKE_WIDTH, LAKE_HEIGHT),)):
+        self.width = width
+        self.height = height
+        self.lakes = tuple(tuple(lake) for lake in lakes)
+        self.water = bytearray(width * height)
+        for lake in self.lakes:
+            self._fill_ellipse(*lake)
+        self._flow_fields = {}
+
+    def _fill_ellipse(self, x, y, w, h):
+        cx, cy = x + w / 2, y + h / 2
+        rx, ry = w / 2, h / 2
+
+        def inside(px, py):
+            # Same formula the per-frame checks used
+            return ((px - cx) / rx) ** 2 + ((py - cy) / ry) ** 2 <= 1
+
+        for py in range(max(0, int(cy - ry) - 1), min(self.height, int(cy + ry) + 2)):
+            half = rx * math.sqrt(max(0.0, 1 - ((py - cy) / ry) ** 2))
+            # Start from the analytic span and trim it with the exact test
+            left = max(0, int(cx - half) - 1)
+            right = min(self.width - 1, int(cx + half) + 1)
+            while left <= right and not inside(left, py):
+                left += 1
+            while right >= left and not inside(right, py):
+                right -= 1
+            if left <= right:
+                row = py * self.width
+                self.water[row + left:row + right + 1] = b'\x01' * (right - left + 1)
+
+    def set_water(self, px, py, wet=True):
+        self.water[py * self.width + px] = 1 if wet else 0
+        self._flow_fields.clear()  # layout changed
+
+    def flow_field(self, size=40, cell=4):
+        # Built once per terrain layout and creature size, then shared
+        key = (size, cell)
+        field = self._flow_fields.get(key)
+        if field is None:
+            field = self._flow_fields[key] = FlowField(self, size, cell)
+        return field
+
+    def __reduce__(self):
+        # Snapshots refer to the shared default terrain by name and never
+        # carry the flow-field cache; it is rebuilt on first use
+        if self is DEFAULT_TERRAIN:
+            return (_default_terrain, ())
+        return (_restore_terrain, (self.width, self.height, self.lakes, bytes(self.water)))
+
+    def is_water(self, px, py):
+        # Float positions fall in the pixel they are inside
+        return 0 <= px < self.width and 0 <= py < self.height and self.water[int(py) * self.width + int(px)] == 1
+
+    def rect_touches_lake(self, x, y, w, h):
+        # Bounding-box test used when placing bushes
+        for lx, ly, lw, lh in self.lakes:
+            if x < lx + lw and lx < x + w and y < ly + lh and ly < y + h:
+                return True
+        return False
+
+
+class FlowField:
+    # Distance transform toward the nearest spot where a size x size creature
+    # can drink (center or a corner in water), over a grid of `cell`-pixel
+    # cells of top-left positions. Each cell stores the waypoint to head for
+    # next, so a thirsty creature's step is one lookup and two sign() calls.
+    def __init__(self, terrain, size=40, cell=4):
+        self.size = size
+        self.cell = cell
+        self.max_x = terrain.width - size
+        self.max_y = terrain.height - size
+        self.cols = self.max_x // cell + 1
+        self.rows = self.max_y // cell + 1
+        self.distance, self.waypoints = self._build(terrain)
+
+    def _position(self, index):
+        # Top-left position a cell stands for
+        return (min((index % self.cols) * self.cell, self.max_x),
+                min((index // self.cols) * self.cell, self.max_y))
+
+    def _build(self, terrain):
+        is_water = terrain.is_water
+        half, edge = self.size // 2, self.size - 1
+        count = self.cols * self.rows
+        passable = [False] * count
+        distance = [-1] * count
+        queue = deque()
+        for i in range(count):
+            x, y = self._position(i)
+            if is_water(x + half, y + half):
+                continue  # the creature can't stand here
+            passable[i] = True
+            if (is_water(x, y) or is_water(x + edge, y) or is_water(x, y + edge)
+                    or is_water(x + edge, y + edge)):
+                distance[i] = 0
+                queue.append(i)
+
+        # Breadth-first search outward from every drinkable cell (8-connected,
+        # matching the sign() steps creatures take)
+        cols, rows = self.cols, self.rows
+        neighbours = [(dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy]
+        while queue:
+            i = queue.popleft()
+            cx, cy = i % cols, i // cols
+            d = distance[i] + 1
+            for dx, dy in neighbours:
+                nx, ny = cx + dx, cy + dy
+                if 0 <= nx < cols and 0 <= ny < rows:
+                    j = ny * cols + nx
+                    if passable[j] and distance[j] < 0:
+                        distance[j] = d
+                        queue.append(j)
+
+        # Waypoint: the drinkable spot itself, or a neighbour one step closer
+        waypoints = [None] * count
+        for i in range(count):
+            d = distance[i]
+            if d == 0:
+                waypoints[i] = self._position(i)
+            elif d > 0:
+                cx, cy = i % cols, i // cols
+                for dx, dy in neighbours:
+                    nx, ny = cx + dx, cy + dy
+                    if 0 <= nx < cols and 0 <= ny < rows and distance[ny * cols + nx] == d - 1:
+                        waypoints[i] = self._position(ny * cols + nx)
+                        break
+        return distance, waypoints
+
+    def index(self, x, y):
+        cx = min(max(int(x) // self.cell, 0), self.cols - 1)
+        cy = min(max(int(y) // self.cell, 0), self.rows - 1)
+        return cy * self.cols + cx
+
+    def direction(self, x, y):
+        # Step toward water from top-left position (x, y); None if no water is reachable
+        waypoint = self.waypoints[self.index(x, y)]
+        if waypoint is None:
+            return None
+        tx, ty = waypoint
+        return ((tx > x) - (tx < x), (ty > y) - (ty < y))
+
+
+def _default_terrain():
+    return DEFAULT_TERRAIN
+
+
+def _restore_terrain(width, height, lakes, water):
+    terrain = Terrain.__new__(Terrain)
+    terrain.width = width
+    terrain.height = height
+    terrain.lakes = lakes
+    terrain.water = bytearray(water)
+    terrain._flow_fields = {}
+    return terrain
+
+
+# Shared terrain for the default single centered lake
+DEFAULT_TERRAIN = Terrain()
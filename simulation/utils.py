@@ -2,4 +2,8 @@ def clamp(value, min_value, max_value):
     return max(min_value, min(value, max_value))
 
 def sign(n):
-    return (n > 0) - (n < 0)
\ No newline at end of file
+    return (n > 0) - (n < 0)
+
+def rects_collide(ax, ay, aw, ah, bx, by, bw, bh):
+    # Same test as pygame.Rect.colliderect for integer rects
+    return ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah
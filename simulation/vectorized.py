@@ -0,0 +1,474 @@
+import numpy as np
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, CREATURE_COUNT, FOOD_SPAWN_INTERVAL, LOG_INTERVAL
+from config import MUTATION_RATE, ENERGY_MAX, VISION_MIN, VISION_MAX, SPEED_MIN, SPEED_MAX, HUNGER_MAX, HUNGER_THRESHOLD
+from config import THIRST_MAX, THIRST_THRESHOLD, REST_ENERGY_GAIN, REPRODUCTION_COOLDOWN
+from config import LAKE_X, LAKE_Y, LAKE_WIDTH, LAKE_HEIGHT
+from simulation.settings import SimulationConfig
+from simulation.terrain import DEFAULT_TERRAIN
+
+# Structure-of-arrays version of World/Creature/Bush. It follows the same rules
+# as the object engine, but every creature acts on the state at the start of
+# the tick instead of seeing the moves of creatures earlier in the list. Eating
+# and mating, where two creatures can compete for the same thing, are still
+# resolved in list order.
+
+CREATURE_SIZE = 40
+BUSH_SIZE = 64
+FOOD_PER_BUSH = 3
+FOOD_RADIUS = 4
+
+# Same odds as Creature._wander: 1 in 9 to stand still
+WANDER_DIRECTIONS = np.array([(0, 0)] + [(1, 0), (0, 1), (-1, 0), (0, -1)] * 2)
+
+# Death cause codes stored per creature
+ALIVE, STARVATION, DEHYDRATION, EXHAUSTION = 0, 1, 2, 3
+CAUSE_NAMES = {STARVATION: 'starvation', DEHYDRATION: 'dehydration', EXHAUSTION: 'exhaustion'}
+
+# Per-creature arrays, kept in this order when compacting or appending
+CREATURE_FIELDS = (
+    'x', 'y', 'energy', 'age', 'hunger', 'thirst', 'cooldown', 'resting',
+    'wander_dx', 'wander_dy', 'wander_timer', 'target',
+    'vision', 'speed', 'metabolism', 'color', 'male',
+)
+
+# Bound on the size of the creature x food distance matrix built at once
+MAX_PAIRWISE = 1 << 22
+
+
+def water_mask(terrain):
+    # Terrain's water raster as a (height, width) boolean array
+    return np.frombuffer(bytes(terrain.water), dtype=np.uint8).reshape(terrain.height, terrain.width) == 1
+
+
+DEFAULT_WATER = water_mask(DEFAULT_TERRAIN)
+
+
+def in_lake(px, py, water=DEFAULT_WATER):
+    # Points must be on the map, which clamped creature positions always are
+    return water[py, px]
+
+
+def flow_waypoints(field):
+    # FlowField waypoints as two flat arrays; -1 where no water is reachable
+    wx = np.array([w[0] if w is not None else -1 for w in field.waypoints], dtype=np.int64)
+    wy = np.array([w[1] if w is not None else -1 for w in field.waypoints], dtype=np.int64)
+    return wx, wy
+
+
+def rects_overlap(ax, ay, bx, by, size):
+    # pygame.Rect.colliderect for two size x size squares
+    return (np.abs(ax - bx) < size) & (np.abs(ay - by) < size)
+
+
+class VectorWorld:
+    def __init__(self, creature_count=CREATURE_COUNT, bush_count=4, seed=None, terrain=None, recorder=None,
+                 log_interval=LOG_INTERVAL):
+        self.rng = np.random.default_rng(seed)
+        self.terrain = terrain if terrain is not None else DEFAULT_TERRAIN
+        self.water = DEFAULT_WATER if self.terrain is DEFAULT_TERRAIN else water_mask(self.terrain)
+        self.flow = self.terrain.flow_field(CREATURE_SIZE)
+        self.flow_x, self.flow_y = flow_waypoints(self.flow)
+        self.frame_count = 0
+        self.frame = 0
+        self.history = []
+        self.recorder = recorder
+        self.recorded_rows = None  # rows recorded when last checkpointed
+        self.log_interval = log_interval
+        self.death_causes = {'starvation': 0, 'dehydration': 0, 'exhaustion': 0}
+        self.last_population = None
+
+        x, y = self._spawn_positions(creature_count)
+        self._set_creatures(
+            x, y,
+            vision=self.rng.uniform(VISION_MIN, VISION_MAX, creature_count),
+            speed=self.rng.uniform(SPEED_MIN, SPEED_MAX, creature_count),
+            metabolism=self.rng.uniform(0.02, 0.2, creature_count),
+            color=np.full((creature_count, 3), 128, dtype=np.int64),
+            male=self.rng.random(creature_count) < 0.5,
+        )
+
+        self.bush_x, self.bush_y = self._spawn_bushes(bush_count)
+        shape = (len(self.bush_x), FOOD_PER_BUSH)
+        self.food_x = np.zeros(shape)
+        self.food_y = np.zeros(shape)
+        self.food_alive = np.zeros(shape, dtype=bool)
+        for bush in range(len(self.bush_x)):
+            for _ in range(self.rng.integers(1, 4)):
+                self._grow_food(np.array([bush]))
+
+    def __getstate__(self):
+        # The recorder owns open output; a resumed world gets a new one
+        state = self.__dict__.copy()
+        state['recorder'] = None
+        state['recorded_rows'] = len(self.recorder) if self.recorder is not None else None
+        return state
+
+    @classmethod
+    def from_world(cls, world, seed=None):
+        # Copy the state of an object-based World into arrays. VectorWorld runs
+        # on the config.py constants, so a world with other settings can't be
+        # converted (its population and log interval carry over as state)
+        config = getattr(world, 'config', None)
+        state = dict(creature_count=0, log_interval=0)
+        if config is not None and config.replace(**state) != SimulationConfig(**state):
+            raise ValueError("VectorWorld only runs with the default settings; this world has its own config")
+        self = cls(creature_count=0, bush_count=0, seed=seed, terrain=world.terrain,
+                   recorder=getattr(world, 'recorder', None), log_interval=getattr(world, 'log_interval', LOG_INTERVAL))
+        self.frame_count = world.frame_count
+        self.frame = world.frame
+        self.history = list(world.history)
+        self.death_causes = dict(world.death_causes)
+        creatures = world.creatures
+        self._set_creatures(
+            np.array([c.x for c in creatures], dtype=np.int64),
+            np.array([c.y for c in creatures], dtype=np.int64),
+            vision=np.array([c.genes.vision for c in creatures], dtype=float),
+            speed=np.array([c.genes.speed for c in creatures], dtype=float),
+            metabolism=np.array([c.genes.metabolism for c in creatures], dtype=float),
+            color=np.array([c.genes.color for c in creatures], dtype=np.int64).reshape(-1, 3),
+            male=np.array([c.sex == 'male' for c in creatures], dtype=bool),
+        )
+        self.energy[:] = [c.energy for c in creatures]
+        self.age[:] = [c.age for c in creatures]
+        self.hunger[:] = [c.hunger for c in creatures]
+        self.thirst[:] = [c.thirst for c in creatures]
+        # World clears cooldowns by event rather than counting them down
+        left = world.cooldowns_left()
+        self.cooldown[:] = [left.get(id(c), 0) for c in creatures]
+        self.resting[:] = [c.resting for c in creatures]
+        self.wander_dx[:] = [c.wander_direction[0] for c in creatures]
+        self.wander_dy[:] = [c.wander_direction[1] for c in creatures]
+        self.wander_timer[:] = [c.wander_timer for c in creatures]
+
+        self.bush_x = np.array([b.x for b in world.bushes], dtype=np.int64)
+        self.bush_y = np.array([b.y for b in world.bushes], dtype=np.int64)
+        shape = (len(world.bushes), FOOD_PER_BUSH)
+        self.food_x = np.zeros(shape)
+        self.food_y = np.zeros(shape)
+        self.food_alive = np.zeros(shape, dtype=bool)
+        food_slots = {}
+        for b, bush in enumerate(world.bushes):
+            for slot, food in enumerate(bush.food[:FOOD_PER_BUSH]):
+                self.food_x[b, slot] = food.x
+                self.food_y[b, slot] = food.y
+                self.food_alive[b, slot] = True
+                food_slots[food] = b * FOOD_PER_BUSH + slot
+        self.target[:] = [food_slots.get(c.target, -1) for c in creatures]
+        return self
+
+    def _set_creatures(self, x, y, vision, speed, metabolism, color, male):
+        n = len(x)
+        self.x = x
+        self.y = y
+        self.energy = np.full(n, float(ENERGY_MAX))
+        self.age = np.zeros(n, dtype=np.int64)
+        self.hunger = np.zeros(n)
+        self.thirst = np.zeros(n)
+        self.cooldown = np.zeros(n, dtype=np.int64)
+        self.resting = np.zeros(n, dtype=bool)
+        self.wander_dx = np.zeros(n, dtype=np.int64)
+        self.wander_dy = np.zeros(n, dtype=np.int64)
+        self.wander_timer = np.zeros(n, dtype=np.int64)
+        self.target = np.full(n, -1, dtype=np.int64)  # flat food slot index, -1 for none
+        self.vision = vision
+        self.speed = speed
+        self.metabolism = metabolism
+        self.color = color
+        self.male = male
+
+    def _spawn_positions(self, n):
+        # Rejection-sample top-left corners whose center is outside the lake
+        x = np.empty(n, dtype=np.int64)
+        y = np.empty(n, dtype=np.int64)
+        todo = np.arange(n)
+        while todo.size:
+            x[todo] = self.rng.integers(0, SCREEN_WIDTH - CREATURE_SIZE + 1, todo.size)
+            y[todo] = self.rng.integers(0, SCREEN_HEIGHT - CREATURE_SIZE + 1, todo.size)
+            todo = todo[in_lake(x[todo] + CREATURE_SIZE // 2, y[todo] + CREATURE_SIZE // 2, self.water)]
+        return x, y
+
+    def _spawn_bushes(self, count, max_attempts=1000):
+        xs, ys = [], []
+        attempts = 0
+        while len(xs) < count and attempts < max_attempts:
+            attempts += 1
+            bx = int(self.rng.integers(0, SCREEN_WIDTH - BUSH_SIZE + 1))
+            by = int(self.rng.integers(0, SCREEN_HEIGHT - BUSH_SIZE + 1))
+            if self.terrain.rect_touches_lake(bx, by, BUSH_SIZE, BUSH_SIZE):
+                continue
+            if any(abs(bx - ox) < BUSH_SIZE and abs(by - oy) < BUSH_SIZE for ox, oy in zip(xs, ys)):
+                continue
+            xs.append(bx)
+            ys.append(by)
+        return np.array(xs, dtype=np.int64), np.array(ys, dtype=np.int64)
+
+    @property
+    def population(self):
+        return len(self.x)
+
+    @property
+    def food_count(self):
+        return int(self.food_alive.sum())
+
+    def update(self):
+        self.frame_count += 1
+        total_food = self.food_count
+        n = self.population
+
+        self.age += 1
+        self.hunger += .5
+        self.thirst += .5
+        np.maximum(self.cooldown - 1, 0, out=self.cooldown)
+
+        cause = np.zeros(n, dtype=np.int8)
+        cause[self.hunger > HUNGER_MAX] = STARVATION
+        cause[(cause == ALIVE) & (self.thirst > THIRST_MAX)] = DEHYDRATION
+        self.energy[cause != ALIVE] = 0
+        active = cause == ALIVE
+
+        dx, dy = self._think(active)
+        # Standing still regains energy
+        still = active & (dx == 0) & (dy == 0)
+        self.energy[still] = np.minimum(ENERGY_MAX, self.energy[still] + REST_ENERGY_GAIN)
+        self._move(active, dx, dy)
+        self._drink(active)
+        cause[active & (self.energy <= 0)] = EXHAUSTION
+        self._eat()
+
+        # Remove dead creatures and count causes
+        dead = self.energy <= 0
+        if dead.any():
+            for code, name in CAUSE_NAMES.items():
+                self.death_causes[name] += int(np.count_nonzero(cause[dead] == code))
+            if dead.all():
+                # Remember the final population for survivor export
+                self.last_population = self._select(np.ones(n, dtype=bool))
+            self._compact(~dead)
+
+        self._reproduce()
+
+        if self.frame_count % FOOD_SPAWN_INTERVAL == 0:
+            self._grow_food(np.arange(len(self.bush_x)))
+
+        if self.frame_count % self.log_interval == 0:
+            self.record(self.stats_row(total_food))
+        self.frame += 1
+
+    def record(self, row):
+        if self.recorder is not None:
+            self.recorder.append(row)
+        else:
+            self.history.append(row)
+
+    def stats_row(self, total_food=None):
+        total_food = self.food_count if total_food is None else total_food
+        if self.population:
+            avg_vision = float(self.vision.mean())
+            avg_speed = float(self.speed.mean())
+            avg_metabolism = float(self.metabolism.mean())
+        else:
+            avg_vision = avg_speed = avg_metabolism = 0
+        return (self.frame_count, avg_vision, avg_speed, avg_metabolism, total_food, self.population)
+
+    def _think(self, active):
+        n = self.population
+        dx = np.zeros(n, dtype=np.int64)
+        dy = np.zeros(n, dtype=np.int64)
+
+        # Resting creatures keep resting until energy is high or needs kick in
+        resting = active & self.resting
+        wake = resting & ((self.hunger >= HUNGER_THRESHOLD) | (self.thirst >= THIRST_THRESHOLD)
+                          | (self.energy >= ENERGY_MAX * 0.8))
+        self.resting[wake] = False
+        deciding = active & ~(resting & ~wake)
+
+        # Seek food if hungry; drop claims once no longer hungry
+        hungry = deciding & (self.hunger >= HUNGER_THRESHOLD)
+        self.target[deciding & ~hungry] = -1
+        seeking = np.zeros(n, dtype=bool)
+        idx = np.flatnonzero(hungry)
+        if idx.size:
+            target = self._find_food(idx)
+            self.target[idx] = target
+            found = idx[target >= 0]
+            slots = target[target >= 0]
+            dx[found] = np.sign(self.food_x.ravel()[slots] - self.x[found])
+            dy[found] = np.sign(self.food_y.ravel()[slots] - self.y[found])
+            seeking[found] = True
+
+        # Seek water if thirsty, following the terrain's flow field
+        thirsty = deciding & ~seeking & (self.thirst >= THIRST_THRESHOLD)
+        idx = np.flatnonzero(thirsty)
+        if idx.size:
+            flow = self.flow
+            cx = np.clip(self.x[idx].astype(np.int64) // flow.cell, 0, flow.cols - 1)
+            cy = np.clip(self.y[idx].astype(np.int64) // flow.cell, 0, flow.rows - 1)
+            wx = self.flow_x[cy * flow.cols + cx]
+            wy = self.flow_y[cy * flow.cols + cx]
+            # No reachable shore: head for the default lake as before
+            lost = wx < 0
+            wx = np.where(lost, LAKE_X + LAKE_WIDTH // 2 - CREATURE_SIZE // 2, wx)
+            wy = np.where(lost, LAKE_Y + LAKE_HEIGHT // 2 - CREATURE_SIZE // 2, wy)
+            dx[idx] = np.sign(wx - self.x[idx])
+            dy[idx] = np.sign(wy - self.y[idx])
+
+        # Rest if energy is low
+        tired = deciding & ~seeking & ~thirsty & (self.energy < 40)
+        self.resting[tired] = True
+
+        # Otherwise wander
+        wander = deciding & ~seeking & ~thirsty & ~tired
+        expired = np.flatnonzero(wander & (self.wander_timer <= 0))
+        if expired.size:
+            picks = WANDER_DIRECTIONS[self.rng.integers(0, len(WANDER_DIRECTIONS), expired.size)]
+            self.wander_dx[expired] = picks[:, 0]
+            self.wander_dy[expired] = picks[:, 1]
+            self.wander_timer[expired] = self.rng.integers(30, 61, expired.size)
+        self.wander_timer[wander] -= 1
+        dx[wander] = self.wander_dx[wander]
+        dy[wander] = self.wander_dy[wander]
+        return dx, dy
+
+    def _find_food(self, idx):
+        # Nearest visible food per creature, preferring food no other creature targets
+        fx = self.food_x.ravel()
+        fy = self.food_y.ravel()
+        alive = self.food_alive.ravel()
+        slots = np.arange(fx.size)
+        claims = np.bincount(self.target[self.target >= 0], minlength=fx.size)
+        result = np.full(idx.size, -1, dtype=np.int64)
+        if not alive.any():
+            return result
+        chunk = max(1, MAX_PAIRWISE // fx.size)
+        for start in range(0, idx.size, chunk):
+            rows = idx[start:start + chunk]
+            dist = np.hypot(fx[None, :] - self.x[rows, None], fy[None, :] - self.y[rows, None])
+            visible = alive[None, :] & (dist <= self.vision[rows, None])
+            mine = self.target[rows, None] == slots[None, :]
+            untargeted = visible & (claims[None, :] - mine <= 0)
+            best_any = np.where(visible, dist, np.inf).argmin(axis=1)
+            best_free = np.where(untargeted, dist, np.inf).argmin(axis=1)
+            pick = np.where(untargeted.any(axis=1), best_free, np.where(visible.any(axis=1), best_any, -1))
+            result[start:start + chunk] = pick
+        return result
+
+    def _move(self, active, dx, dy):
+        self.energy[active] -= np.sqrt(dx[active] ** 2 + dy[active] ** 2) * self.metabolism[active]
+        new_x = np.clip(self.x + dx, 0, SCREEN_WIDTH - CREATURE_SIZE)
+        new_y = np.clip(self.y + dy, 0, SCREEN_HEIGHT - CREATURE_SIZE)
+        # Block moves that would put the center in the lake
+        ok = active & ~in_lake(new_x + CREATURE_SIZE // 2, new_y + CREATURE_SIZE // 2, self.water)
+        self.x[ok] = new_x[ok]
+        self.y[ok] = new_y[ok]
+
+    def _drink(self, active):
+        # Center or any corner in the lake resets thirst
+        x, y = self.x, self.y
+        water = self.water
+        edge = CREATURE_SIZE - 1
+        wet = (water[y + CREATURE_SIZE // 2, x + CREATURE_SIZE // 2] | water[y, x] | water[y, x + edge]
+               | water[y + edge, x] | water[y + edge, x + edge])
+        self.thirst[active & wet] = 0
+
+    def _eat(self):
+        fx = self.food_x.ravel()
+        fy = self.food_y.ravel()
+        alive = self.food_alive.ravel()
+        if not alive.any() or not self.population:
+            return
+        chunk = max(1, MAX_PAIRWISE // fx.size)
+        for start in range(0, self.population, chunk):
+            stop = start + chunk
+            hit = alive[None, :] & (
+                (self.x[start:stop, None] - fx[None, :]) ** 2 + (self.y[start:stop, None] - fy[None, :]) ** 2 < 100)
+            # Few creatures touch food on any tick, so resolve them in order like World does
+            for row in np.flatnonzero(hit.any(axis=1)):
+                choices = np.flatnonzero(hit[row] & alive)
+                if not choices.size:
+                    continue
+                slot = choices[0]
+                self.hunger[start + row] = 0
+                alive[slot] = False
+                self.target[self.target == slot] = -1
+
+    def _reproduce(self):
+        eligible = ((self.energy > 80) & (self.hunger < HUNGER_THRESHOLD) & (self.thirst < THIRST_THRESHOLD)
+                    & (self.age > 600) & (self.cooldown == 0))
+        females = np.flatnonzero(eligible & ~self.male)
+        males = np.flatnonzero(eligible & self.male)
+        if not females.size or not males.size:
+            return
+        touching = rects_overlap(self.x[females, None], self.y[females, None],
+                                 self.x[None, males], self.y[None, males], CREATURE_SIZE)
+        used = np.zeros(males.size, dtype=bool)
+        mothers, fathers = [], []
+        for row in np.flatnonzero(touching.any(axis=1)):
+            free = np.flatnonzero(touching[row] & ~used)
+            if free.size:
+                used[free[0]] = True
+                mothers.append(females[row])
+                fathers.append(males[free[0]])
+        if not mothers:
+            return
+        mothers = np.array(mothers)
+        fathers = np.array(fathers)
+        parents = np.concatenate([mothers, fathers])
+        self.energy[parents] /= 2
+        self.cooldown[parents] = REPRODUCTION_COOLDOWN
+        self._add_children(mothers, fathers)
+
+    def _add_children(self, mothers, fathers):
+        k = mothers.size
+        genes = []
+        for name, floor in (('vision', 0.1), ('speed', 0.1), ('metabolism', 0.001)):
+            values = (getattr(self, name)[mothers] + getattr(self, name)[fathers]) / 2
+            mutate = self.rng.random(k) < MUTATION_RATE
+            values[mutate] *= self.rng.uniform(0.9, 1.1, mutate.sum())
+            values[mutate] = np.maximum(floor, values[mutate])
+            genes.append(values)
+        color = ((self.color[mothers] + self.color[fathers]) / 2).astype(np.int64)
+        mutate = self.rng.random((k, 3)) < MUTATION_RATE * 2
+        color[mutate] = np.clip(color[mutate] + self.rng.integers(-20, 21, mutate.sum()), 0, 255)
+
+        old = {name: getattr(self, name) for name in CREATURE_FIELDS}
+        self._set_creatures(self.x[mothers].copy(), self.y[mothers].copy(), *genes, color,
+                            male=self.rng.random(k) < 0.5)
+        for name in CREATURE_FIELDS:
+            setattr(self, name, np.concatenate([old[name], getattr(self, name)]))
+
+    def _grow_food(self, bushes):
+        # Each bush below capacity grows one food item in its first free slot
+        bushes = bushes[self.food_alive[bushes].sum(axis=1) < FOOD_PER_BUSH]
+        if not bushes.size:
+            return
+        slots = np.argmin(self.food_alive[bushes], axis=1)
+        fx = self.bush_x[bushes] + 24 + self.rng.integers(-16, 17, bushes.size)
+        fy = self.bush_y[bushes] + 24 + self.rng.integers(-16, 17, bushes.size)
+        self.food_x[bushes, slots] = np.clip(fx, FOOD_RADIUS, SCREEN_WIDTH - FOOD_RADIUS)
+        self.food_y[bushes, slots] = np.clip(fy, FOOD_RADIUS, SCREEN_HEIGHT - FOOD_RADIUS)
+        self.food_alive[bushes, slots] = True
+
+    def _select(self, mask):
+        return {name: getattr(self, name)[mask] for name in CREATURE_FIELDS}
+
+    def _compact(self, keep):
+        for name, values in self._select(keep).items():
+            setattr(self, name, values)
+
+    def survivor_data(self, count=2):
+        # Oldest creatures in the same format main.py writes to best_survivor.json
+        pop = self._select(np.ones(self.population, dtype=bool)) if self.population else self.last_population
+        if not pop or not len(pop['age']):
+            return []
+        data = []
+        for i in np.argsort(-pop['age'], kind='stable')[:count]:
+            data.append({
+                'genes': {
+                    'vision': float(pop['vision'][i]),
+                    'speed': float(pop['speed'][i]),
+                    'metabolism': float(pop['metabolism'][i]),
+                    'color': dict(zip('RGB', (int(v) for v in pop['color'][i]))),
+                },
+                'sex': 'male' if pop['male'][i] else 'female',
+            })
+        return data
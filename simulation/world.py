@@ -1,92 +1,150 @@
 import random
-import pygame
-import matplotlib as plt
-import copy, numpy as np
+import copy
 from simulation.creature import Creature
 from simulation.food import Food
 from simulation.bush import Bush
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, CREATURE_COUNT, FOOD_COUNT, FOOD_SPAWN_INTERVAL, LOG_INTERVAL
-from config import LAKE_X, LAKE_Y, LAKE_WIDTH, LAKE_HEIGHT
+from simulation.events import EventQueue
+from simulation.stats import PopulationStats
+from simulation.profiler import CountingGrid
+from simulation.registry import FoodRegistry
+from simulation.spatial import find_overlapping_pairs
+from simulation.targets import TargetRegistry
+from simulation.terrain import DEFAULT_TERRAIN
+from simulation.utils import rects_collide
+from simulation.settings import DEFAULT_CONFIG
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+def end_cooldown(creature):
+    creature.cooling_down = False
+
 
 class World:
-    def __init__(self, best_survivors_data=None):
+    def __init__(self, best_survivors_data=None, seed=None, rng=None, terrain=None, recorder=None,
+                 log_interval=None, creature_count=None, bush_count=4, config=None):
+        # Settings for this world and everything in it; without a config the
+        # config.py defaults are used
+        self.config = config if config is not None else DEFAULT_CONFIG
+        if creature_count is None:
+            creature_count = self.config.creature_count
+        # Every random choice in this world (and its creatures and bushes) comes
+        # from this stream, so a run is reproducible from its seed
+        self.seed = seed
+        self.rng = rng if rng is not None else random.Random(seed)
+        # Precomputed water raster shared by every creature for lake tests
+        self.terrain = terrain if terrain is not None else DEFAULT_TERRAIN
         self.frame_count = 0
         self.frame = 0
         self.history = []
+        # With a recorder, history rows stream to disk instead of self.history
+        self.recorder = recorder
+        # Rows the recorder had taken when this world was checkpointed, so a
+        # resumed run can continue the same recording
+        self.recorded_rows = None
+        self.log_interval = log_interval if log_interval is not None else self.config.log_interval
+        # Optional PhaseProfiler; None keeps update() free of timing work
+        self.profiler = None
         self.death_causes = {'starvation': 0, 'dehydration': 0, 'exhaustion': 0}
         self.last_population = []
         if best_survivors_data and isinstance(best_survivors_data, list) and len(best_survivors_data) > 0:
             self.creatures = []
-            for _ in range(CREATURE_COUNT):
-                parent_data = random.choice(best_survivors_data)
+            for _ in range(creature_count):
+                parent_data = self.rng.choice(best_survivors_data)
                 genes = copy.deepcopy(parent_data['genes'])
                 for k, v in genes.items():
                     if isinstance(v, dict):
                         for ck in v:
-                            genes[k][ck] = max(0, min(255, int(v[ck] + random.randint(-20, 20))))
+                            genes[k][ck] = max(0, min(255, int(v[ck] + self.rng.randint(-20, 20))))
                     elif isinstance(v, (int, float)):
-                        genes[k] = v * random.uniform(0.9, 1.1)
-                sex = random.choice(['male','female'])
-                self.creatures.append(Creature(random.randint(0, SCREEN_WIDTH-40), random.randint(0, SCREEN_HEIGHT-40), genes=genes, sex=sex))
+                        genes[k] = v * self.rng.uniform(0.9, 1.1)
+                sex = self.rng.choice(['male','female'])
+                self.creatures.append(Creature(self.rng.randint(0, SCREEN_WIDTH-40), self.rng.randint(0, SCREEN_HEIGHT-40), genes=genes, sex=sex, rng=self.rng, terrain=self.terrain, config=self.config))
         else:
-            self.creatures = [self.spawn_creature() for _ in range(CREATURE_COUNT)]
+            self.creatures = [self.spawn_creature() for _ in range(creature_count)]
         self.last_population = []
+        # Gene aggregates kept up to date on every birth and death
+        self.stats = PopulationStats()
+        self.stats.reset(self.creatures)
         self.bushes = []
-        bush_count = 4
         attempts = 0
         max_attempts = 1000
         bush_width = 64
         bush_height = 64
         while len(self.bushes) < bush_count and attempts < max_attempts:
             bush = self.spawn_bush()
-            bush_rect = pygame.Rect(bush.x, bush.y, bush_width, bush_height)
-            if all(not bush_rect.colliderect(pygame.Rect(b.x, b.y, bush_width, bush_height)) for b in self.bushes):
+            if all(not rects_collide(bush.x, bush.y, bush_width, bush_height, b.x, b.y, bush_width, bush_height) for b in self.bushes):
                 self.bushes.append(bush)
             attempts += 1
-        self.food = []
+        # All food on all bushes by id, with a spatial index; bushes keep it up to date
+        self.food = FoodRegistry(cell_size=64)
+        self.food_grid = self.food
         for bush in self.bushes:
-            for _ in range(random.randint(1, 3)):
+            bush.food_grid = self.food
+        self.food_claims = TargetRegistry()
+        for bush in self.bushes:
+            for _ in range(self.rng.randint(1, 3)):
                 bush.grow_food(Food)
-                self.food.extend(bush.food)
+        # Timers (food regrowth, reproduction cooldowns) fire from here when due
+        # instead of being counted down every frame. Events run at the end of
+        # the frame they are due on.
+        self.events = EventQueue()
+        for bush in self.bushes:
+            self.events.schedule(bush.regrow_interval, self.regrow, bush)
+
+    @classmethod
+    def resume(cls, path, seed=None, recorder=None):
+        from simulation.checkpoint import resume_world
+        world = resume_world(path, seed=seed, recorder=recorder)
+        if not isinstance(world, cls):
+            raise TypeError(f"{path} holds a {type(world).__name__}, not a {cls.__name__}")
+        return world
+
+    def __getstate__(self):
+        # The recorder owns open output and profiles describe this process;
+        # a resumed world starts without either
+        state = self.__dict__.copy()
+        state['recorder'] = None
+        state['recorded_rows'] = len(self.recorder) if self.recorder is not None else None
+        state['profiler'] = None
+        return state
 
     def spawn_creature(self):
         # Clamp so creature is always fully visible (40x40 sprite)
         while True:
-            x = random.randint(0, SCREEN_WIDTH - 40)
-            y = random.randint(0, SCREEN_HEIGHT - 40)
-            # Check if center would be in the lake ellipse
-            cx = x + 20
-            cy = y + 20
-            lx = LAKE_X + LAKE_WIDTH / 2
-            ly = LAKE_Y + LAKE_HEIGHT / 2
-            rx = LAKE_WIDTH / 2
-            ry = LAKE_HEIGHT / 2
-            in_lake = ((cx - lx) / rx) ** 2 + ((cy - ly) / ry) ** 2 <= 1
-            if not in_lake:
-                return Creature(x, y)
+            x = self.rng.randint(0, SCREEN_WIDTH - 40)
+            y = self.rng.randint(0, SCREEN_HEIGHT - 40)
+            # Check if center would be in the lake
+            if not self.terrain.is_water(x + 20, y + 20):
+                return Creature(x, y, rng=self.rng, terrain=self.terrain, config=self.config)
     
+    @property
+    def population(self):
+        return len(self.creatures)
+
     def spawn_bush(self):
-        return Bush()
+        return Bush(rng=self.rng, terrain=self.terrain, regrow_interval=self.config.food_spawn_interval)
     
     def update(self):
+        prof = self.profiler
+        if prof is not None:
+            prof.begin()
         self.frame_count += 1
-        # Update food list from all bushes
-        self.food = []
-        for bush in self.bushes:
-            self.food.extend(bush.food)
+        total_food = len(self.food)  # logged as food on the map at the start of the tick
+        food_grid = self.food if prof is None else CountingGrid(self.food, prof)
 
-        for creature in self.creatures:
-            creature.update(self.food, (SCREEN_WIDTH, SCREEN_HEIGHT), self.creatures)
-            # Track last population for survivor saving
+        # Track last population for survivor saving
+        if self.creatures:
             self.last_population = self.creatures.copy()
-            for bush in self.bushes:
-                for f in list(bush.food):
-                    if creature.collides_with(f):
-                        # Eating only resets hunger; no energy gain
-                        bush.remove_food(f)
-                        if f.targeted_by:
-                            f.targeted_by.target = None
-                        break
+        for creature in self.creatures:
+            creature.update(self.food, (SCREEN_WIDTH, SCREEN_HEIGHT), self.creatures, food_grid, self.food_claims)
+            if prof is not None:
+                prof.lap('think_move')
+            touching = self.food.contacts(creature.x, creature.y, 10)
+            if touching:
+                self.eat(creature, touching)
+            if prof is not None:
+                prof.count('food_contacts', len(touching))
+                prof.lap('eat')
 
         # Remove dead creatures and count causes
         survivors = []
@@ -94,61 +152,95 @@ class World:
             if c.energy > 0:
                 survivors.append(c)
             else:
+                self.food_claims.release(c)
+                self.stats.remove(c)
                 cause = getattr(c, 'death_cause', None)
                 if cause in self.death_causes:
                     self.death_causes[cause] += 1
         self.creatures = survivors
+        if prof is not None:
+            prof.lap('deaths')
 
         # Reproduce if energy is sufficient and a male and female intersect
-        from config import HUNGER_THRESHOLD, THIRST_THRESHOLD, REPRODUCTION_COOLDOWN
-        eligible_males = [c for c in self.creatures if getattr(c, 'sex', None) == "male" and c.energy > 80 and c.hunger < HUNGER_THRESHOLD and c.thirst < THIRST_THRESHOLD and c.age > 600 and c.reproduction_cooldown == 0]
-        eligible_females = [c for c in self.creatures if getattr(c, 'sex', None) == "female" and c.energy > 80 and c.hunger < HUNGER_THRESHOLD and c.thirst < THIRST_THRESHOLD and c.age > 600 and c.reproduction_cooldown == 0]
-        used_males = set()
-        used_females = set()
+        hunger_threshold, thirst_threshold = self.config.hunger_threshold, self.config.thirst_threshold
+        eligible_males = [c for c in self.creatures if getattr(c, 'sex', None) == "male" and c.energy > 80 and c.hunger < hunger_threshold and c.thirst < thirst_threshold and c.age > 600 and not c.cooling_down]
+        eligible_females = [c for c in self.creatures if getattr(c, 'sex', None) == "female" and c.energy > 80 and c.hunger < hunger_threshold and c.thirst < thirst_threshold and c.age > 600 and not c.cooling_down]
         new_creatures = []
-        for female in eligible_females:
-            female_rect = pygame.Rect(female.x, female.y, 40, 40)
-            for male in eligible_males:
-                if male in used_males:
-                    continue
-                male_rect = pygame.Rect(male.x, male.y, 40, 40)
-                if female_rect.colliderect(male_rect):
-                    # Both parents pay energy cost and get cooldown
-                    female.energy /= 2
-                    male.energy /= 2
-                    female.reproduction_cooldown = REPRODUCTION_COOLDOWN
-                    male.reproduction_cooldown = REPRODUCTION_COOLDOWN
-                    child = Creature.create_child(female, male)
-                    new_creatures.append(child)
-                    used_males.add(male)
-                    used_females.add(female)
-                    break
+        # Each female pairs with the first free male whose 40x40 box overlaps hers
+        for female, male in find_overlapping_pairs(eligible_females, eligible_males, 40):
+            # Both parents pay energy cost and get cooldown
+            female.energy /= 2
+            male.energy /= 2
+            self.start_cooldown(female)
+            self.start_cooldown(male)
+            child = Creature.create_child(female, male)
+            new_creatures.append(child)
+            self.stats.add(child)
         self.creatures.extend(new_creatures)
+        if prof is not None:
+            prof.count('mating_candidates', len(eligible_males) + len(eligible_females))
+            prof.count('births', len(new_creatures))
+            prof.lap('reproduction')
 
-        # Grow food on bushes at a fixed interval
-        if self.frame_count % FOOD_SPAWN_INTERVAL == 0:
-            for bush in self.bushes:
-                bush.grow_food(Food)
+        # Food regrowth and expiring cooldowns
+        fired = self.events.run_due(self.frame_count)
+        if prof is not None:
+            prof.count('events', fired)
+            prof.lap('events')
 
-        # Track average vision, speed, and metabolism every frame
-        if self.creatures:
-            avg_vision = sum(c.genes['vision'] for c in self.creatures) / len(self.creatures)
-            avg_speed = sum(c.genes['speed'] for c in self.creatures) / len(self.creatures)
-            avg_metabolism = sum(c.genes.get('metabolism', 0.2) for c in self.creatures) / len(self.creatures)
-        else:
-            avg_vision = 0
-            avg_speed = 0
-            avg_metabolism = 0
-        # Track total food and total population
-        total_food = len(self.food)
-        total_population = len(self.creatures)
-        if self.frame_count % LOG_INTERVAL == 0:
-            self.history.append((self.frame_count, avg_vision, avg_speed, avg_metabolism, total_food, total_population))
+        # Log average vision, speed and metabolism from the running aggregates
+        if self.frame_count % self.log_interval == 0:
+            stats = self.stats
+            self.record((self.frame_count, stats.mean('vision'), stats.mean('speed'), stats.mean('metabolism'),
+                         total_food, len(self.creatures)))
         self.frame += 1
+        if prof is not None:
+            prof.lap('stats')
+
+    def start_cooldown(self, creature, frames=None):
+        # Cleared at the end of the frame before the creature may mate again
+        if frames is None:
+            frames = self.config.reproduction_cooldown
+        creature.cooling_down = True
+        self.events.schedule(self.frame_count + frames - 1, end_cooldown, creature)
+
+    def cooldowns_left(self):
+        # {id(creature): frames until it may mate again} for creatures cooling down
+        left = {}
+        for event in self.events.heap:
+            if event.fn is end_cooldown and not event.cancelled:
+                left[id(event.args[0])] = event.due + 1 - self.frame_count
+        return left
+
+    def regrow(self, bush):
+        # Each bush regrows on its own interval
+        bush.grow_food(Food)
+        self.events.schedule(self.frame_count + bush.regrow_interval, self.regrow, bush)
+
+    def eat(self, creature, touching):
+        # The creature eats the first touching food of each bush, in bush
+        # order then growth order; eating only resets hunger, no energy gain
+        touching.sort(key=lambda f: self.bushes.index(f.bush))
+        seen = []
+        for f in touching:
+            if f.bush in seen:
+                continue
+            seen.append(f.bush)
+            if creature.collides_with(f):
+                f.bush.remove_food(f)
+                self.food_claims.release_food(f)
+
+    def record(self, row):
+        if self.recorder is not None:
+            self.recorder.append(row)
+        else:
+            self.history.append(row)
 
     def draw(self, screen):
-        # Draw lake first (blue ellipse)
-        pygame.draw.ellipse(screen, (0, 100, 200), (LAKE_X, LAKE_Y, LAKE_WIDTH, LAKE_HEIGHT))
+        import pygame
+        # Draw lakes first (blue ellipses)
+        for lake in self.terrain.lakes:
+            pygame.draw.ellipse(screen, (0, 100, 200), lake)
         for bush in self.bushes:
             bush.draw(screen)
         for creature in self.creatures:
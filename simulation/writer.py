@@ -0,0 +1,87 @@
+import atexit
+import json
+import os
+import queue
+import threading
+
+_STOP = object()
+
+
+class BackgroundWriter:
+    # One worker thread that runs disk writes handed to it through a bounded
+    # queue, so the tick loop never waits on the disk. When the queue is full
+    # submit() blocks until the worker catches up (backpressure) instead of
+    # buffering without limit. Pending writes are finished on close(), and
+    # close() runs at interpreter exit for writers that are never closed.
+    # Jobs should only hold immutable data (bytes, tuples, copied dicts).
+    def __init__(self, maxsize=64, name='background-writer'):
+        self.queue = queue.Queue(maxsize)
+        self.error = None
+        self.written = 0
+        self.closed = False
+        self.thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def _run(self):
+        while True:
+            job = self.queue.get()
+            try:
+                if job is _STOP:
+                    return
+                fn, args = job
+                fn(*args)
+                self.written += 1
+            except Exception as e:
+                # Keep the first failure and report it to the producer
+                if self.error is None:
+                    self.error = e
+            finally:
+                self.queue.task_done()
+
+    def _raise(self):
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def submit(self, fn, *args):
+        if self.closed:
+            raise RuntimeError("writer is closed")
+        self._raise()
+        self.queue.put((fn, args))
+
+    @property
+    def pending(self):
+        return self.queue.unfinished_tasks
+
+    def flush(self):
+        # Wait until everything submitted so far is on disk
+        self.queue.join()
+        self._raise()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.put(_STOP)
+        self.thread.join()
+        atexit.unregister(self.close)
+        self._raise()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_bytes(path, data):
+    # Temp file + rename so readers never see a half-written file
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def write_json(path, data):
+    write_bytes(path, json.dumps(data).encode())
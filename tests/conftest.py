@@ -0,0 +1,10 @@
+# test_creature.py replaces sys.modules['config'] with a Mock at import time.
+# Import the simulation modules first so they bind the real config values no
+# matter which test module pytest collects next.
+import importlib
+import pkgutil
+
+import simulation
+
+for _module in pkgutil.iter_modules(simulation.__path__):
+    importlib.import_module(f"simulation.{_module.name}")
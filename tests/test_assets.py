@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+import unittest
+from simulation.assets import get_sprite, TintCache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class TestAssets(unittest.TestCase):
+    def test_sprites_are_cached(self):
+        first = get_sprite('food.png', (20, 20))
+        self.assertIs(get_sprite('food.png', (20, 20)), first)
+        self.assertEqual(first.get_size(), (20, 20))
+
+    def test_simulation_import_skips_pygame_and_matplotlib(self):
+        code = (
+            "import sys; import simulation.world, simulation.runner; "
+            "print(' '.join(m for m in ('pygame', 'matplotlib', 'numpy') if m in sys.modules))"
+        )
+        out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), '')
+
+class TestTintCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = TintCache(maxsize=2, quantize=4)
+
+    def test_hits_share_surfaces(self):
+        first = self.cache.get(100, 50, 25)
+        # Same quantized color reuses the surface
+        self.assertIs(self.cache.get(101, 51, 26), first)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(first.get_size(), (40, 40))
+
+    def test_evicts_least_recently_used(self):
+        red = self.cache.get(255, 0, 0)
+        self.cache.get(0, 255, 0)
+        self.cache.get(255, 0, 0)  # red is now most recent
+        self.cache.get(0, 0, 255)  # evicts green
+        self.assertEqual(len(self.cache.sprites), 2)
+        self.assertIn(self.cache.key(255, 0, 0), self.cache.sprites)
+        self.assertNotIn(self.cache.key(0, 255, 0), self.cache.sprites)
+        self.assertIs(self.cache.get(255, 0, 0), red)
+
+    def test_tint_multiplies_color(self):
+        sprite = self.cache.get(0, 0, 0)
+        w, h = sprite.get_size()
+        r, g, b, _ = sprite.get_at((w // 2, h // 2))
+        self.assertEqual((r, g, b), (0, 0, 0))
+
+if __name__ == '__main__':
+    unittest.main()
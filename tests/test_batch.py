@@ -0,0 +1,44 @@
+import unittest
+from unittest.mock import patch
+from simulation.batch import make_world, run_batch, run_trial, aggregate
+
+class TestBatch(unittest.TestCase):
+    def test_run_trial_is_reproducible(self):
+        a = run_trial({'seed': 3, 'max_frames': 700})
+        b = run_trial({'seed': 3, 'max_frames': 700})
+        self.assertEqual(a['history'], b['history'])
+        self.assertEqual(a['death_causes'], b['death_causes'])
+        self.assertEqual(a['frames'], 700)
+
+    def test_run_batch_in_pool(self):
+        result = run_batch([1, 2], max_frames=50, processes=2)
+        self.assertEqual([run['seed'] for run in result['runs']], [1, 2])
+        self.assertEqual(result['mean_frames'], 50)
+        self.assertEqual(len(result['survivors']), 4)
+
+    def test_vector_engine(self):
+        result = run_batch([1], max_frames=20, processes=1, engine='vector', creature_count=50)
+        self.assertEqual(result['runs'][0]['population'], 50)
+
+    def test_spec_counts_are_passed_through(self):
+        with patch('simulation.batch.make_world', wraps=make_world) as made:
+            result = run_trial({'seed': 3, 'max_frames': 10, 'bush_count': 2, 'creature_count': 0})
+        self.assertEqual(made.call_args.args[-1], 2)
+        self.assertEqual(len(make_world(3, bush_count=2).bushes), 2)
+        # An explicit zero is not replaced by the default population
+        self.assertEqual(result['population'], 0)
+        self.assertEqual(make_world(3, 'vector', creature_count=0).population, 0)
+
+    def test_aggregate_sums_death_causes(self):
+        runs = [
+            {'death_causes': {'starvation': 2}, 'frames': 10, 'population': 0, 'survivors': []},
+            {'death_causes': {'starvation': 1, 'exhaustion': 4}, 'frames': 30, 'population': 5, 'survivors': [{}]},
+        ]
+        result = aggregate(runs)
+        self.assertEqual(result['death_causes'], {'starvation': 3, 'exhaustion': 4})
+        self.assertEqual(result['extinct'], 1)
+        self.assertEqual(result['mean_frames'], 20)
+        self.assertEqual(result['survivors'], [{}])
+
+if __name__ == '__main__':
+    unittest.main()
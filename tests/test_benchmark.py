@@ -0,0 +1,28 @@
+import unittest
+from simulation.benchmark import bench_scale, compare, percentile, run_suite
+
+class TestBenchmark(unittest.TestCase):
+    def test_percentile(self):
+        samples = list(range(1, 101))
+        self.assertEqual(percentile(samples, 50), 51)
+        self.assertEqual(percentile(samples, 99), 100)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    def test_bench_scale_reports_update_draw_and_memory(self):
+        result = bench_scale(30, bushes=2, seed=1, ticks=5, warmup=1, draws=2)
+        self.assertEqual(result['creatures'], 30)
+        self.assertEqual(result['update']['count'], 5)
+        self.assertEqual(result['draw']['count'], 2)
+        self.assertGreater(result['ticks_per_sec'], 0)
+        self.assertLessEqual(result['update']['p50_ms'], result['update']['p99_ms'])
+        self.assertGreater(result['peak_memory_bytes'], 0)
+
+    def test_vector_engine_and_compare(self):
+        report = run_suite({50: 2}, engine='vector', ticks=3, warmup=0, memory_ticks=None)
+        self.assertIsNone(report['results'][0]['draw'])
+        self.assertIsNone(report['results'][0]['peak_memory_bytes'])
+        [(creatures, engine, old, new, ratio)] = compare(report, report)
+        self.assertEqual((creatures, engine, ratio), (50, 'vector', 1.0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import os
+import tempfile
+import unittest
+from simulation.checkpoint import Checkpointer, save_checkpoint, load_checkpoint
+from simulation.recorder import HistoryRecorder, load_history
+from simulation.terrain import DEFAULT_TERRAIN, Terrain
+from simulation.world import World
+
+def state(world):
+    return (
+        world.frame_count, world.history, dict(world.death_causes),
+        [(c.x, c.y, c.energy, c.hunger, c.thirst, c.genes.to_dict()) for c in world.creatures],
+        [[(f.x, f.y) for f in b.food] for b in world.bushes],
+    )
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'world.ckpt')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_resumed_world_continues_identically(self):
+        world = World(seed=6, log_interval=100)
+        for _ in range(700):
+            world.update()
+        save_checkpoint(world, self.path)
+        resumed = World.resume(self.path)
+        self.assertIs(resumed.terrain, DEFAULT_TERRAIN)
+        self.assertIs(resumed.creatures[0].rng, resumed.rng)
+        for _ in range(1500):
+            world.update()
+            resumed.update()
+        self.assertEqual(state(resumed), state(world))
+
+    def test_branch_seed_diverges(self):
+        world = World(seed=6)
+        for _ in range(300):
+            world.update()
+        save_checkpoint(world, self.path)
+        a, b = World.resume(self.path), World.resume(self.path, seed=99)
+        self.assertEqual(b.seed, 99)
+        for _ in range(500):
+            a.update()
+            b.update()
+        self.assertNotEqual(state(a)[3], state(b)[3])
+
+    def test_resumed_recording_continues_history(self):
+        history = os.path.join(self.tmp.name, 'history')
+        checkpoints = os.path.join(self.tmp.name, 'checkpoints')
+        with HistoryRecorder(history) as recorder:
+            world = World(seed=6, recorder=recorder, log_interval=100)
+            checkpointer = Checkpointer(checkpoints, every=1000)
+            for _ in range(1500):
+                world.update()
+                checkpointer.step(world)
+            checkpointer.close()
+        full = load_history(history, mmap=False)['frame'].tolist()
+        self.assertEqual(len(full), 15)
+
+        resumed = World.resume(checkpointer.latest())
+        self.assertEqual(resumed.recorded_rows, 10)
+        with HistoryRecorder(history, resume_rows=resumed.recorded_rows) as recorder:
+            resumed.recorder = recorder
+            for _ in range(500):
+                resumed.update()
+        self.assertEqual(load_history(history)['frame'].tolist(), full)
+
+    def test_custom_terrain_and_bad_file(self):
+        t = Terrain(lakes=[(0, 0, 100, 100)])
+        t.flow_field()
+        save_checkpoint(World(seed=1, terrain=t), self.path)
+        resumed = load_checkpoint(self.path)
+        self.assertEqual(resumed.terrain.water, t.water)
+        self.assertEqual(resumed.terrain._flow_fields, {})
+        with open(self.path, 'wb') as f:
+            f.write(b'not a checkpoint')
+        with self.assertRaises(ValueError):
+            load_checkpoint(self.path)
+
+    def test_checkpointer_keeps_newest(self):
+        checkpointer = Checkpointer(self.tmp.name, every=10, keep=2)
+        world = World(seed=3)
+        for _ in range(40):
+            world.update()
+            checkpointer.step(world)
+        checkpointer.close()
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ['checkpoint_0000000030.ckpt', 'checkpoint_0000000040.ckpt'])
+        self.assertEqual(load_checkpoint(checkpointer.latest()).frame_count, 40)
+
+        # A checkpointer reusing the directory prunes the files already there
+        again = Checkpointer(self.tmp.name, every=10, keep=2)
+        self.assertEqual(again.latest(), checkpointer.latest())
+        for _ in range(10):
+            world.update()
+            again.step(world)
+        again.close()
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ['checkpoint_0000000040.ckpt', 'checkpoint_0000000050.ckpt'])
+
+    def test_resumed_checkpointer_leaves_later_checkpoints_alone(self):
+        original = Checkpointer(self.tmp.name, every=10, keep=2)
+        world = World(seed=3)
+        for _ in range(40):
+            world.update()
+            original.step(world)
+        original.close()
+
+        resumed = World.resume(os.path.join(self.tmp.name, 'checkpoint_0000000030.ckpt'), seed=9)
+        branch = Checkpointer(self.tmp.name, every=5, keep=1, start_frame=resumed.frame_count)
+        self.assertEqual(branch.latest(), os.path.join(self.tmp.name, 'checkpoint_0000000030.ckpt'))
+        for _ in range(5):
+            resumed.update()
+            branch.step(resumed)
+        branch.wait()
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ['checkpoint_0000000035.ckpt', 'checkpoint_0000000040.ckpt'])
+        for _ in range(5):
+            resumed.update()
+        with self.assertRaises(FileExistsError):
+            branch.save(resumed)
+        branch.close()
+        self.assertEqual(load_checkpoint(os.path.join(self.tmp.name, 'checkpoint_0000000040.ckpt')).seed, 3)
+
+if __name__ == '__main__':
+    unittest.main()
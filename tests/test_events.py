@@ -0,0 +1,71 @@
+import unittest
+from simulation.events import EventQueue
+from simulation.world import World
+
+class TestEventQueue(unittest.TestCase):
+    def test_runs_due_events_in_order(self):
+        queue, fired = EventQueue(), []
+        queue.schedule(5, fired.append, 'b')
+        queue.schedule(2, fired.append, 'a')
+        later = queue.schedule(5, fired.append, 'c')
+        queue.schedule(9, fired.append, 'd')
+        self.assertEqual(queue.run_due(1), 0)
+        self.assertEqual(queue.run_due(5), 3)
+        self.assertEqual(fired, ['a', 'b', 'c'])
+        self.assertEqual(queue.next_due(), 9)
+        self.assertEqual(len(queue), 1)
+        self.assertEqual(later.args, ('c',))
+
+    def test_cancel_and_reschedule_from_callback(self):
+        queue, fired = EventQueue(), []
+        dropped = queue.schedule(1, fired.append, 'x')
+        dropped.cancel()
+
+        def tick(n):
+            fired.append(n)
+            if n < 3:
+                queue.schedule(n + 1, tick, n + 1)
+        queue.schedule(1, tick, 1)
+        queue.run_due(10)
+        self.assertEqual(fired, [1, 2, 3])
+        self.assertIsNone(queue.next_due())
+
+class TestWorldEvents(unittest.TestCase):
+    def test_bushes_regrow_on_their_own_interval(self):
+        world = World(seed=2, creature_count=0)
+        fast, slow = world.bushes[0], world.bushes[1]
+        world.events = EventQueue()
+        fast.regrow_interval, slow.regrow_interval = 10, 50
+        for bush in (fast, slow):
+            bush.food = []
+            world.events.schedule(bush.regrow_interval, world.regrow, bush)
+        for _ in range(30):
+            world.update()
+        self.assertEqual((len(fast.food), len(slow.food)), (3, 0))
+
+    def test_cooldown_ends_after_reproduction_cooldown_frames(self):
+        world = World(seed=2)
+        a = world.creatures[0]
+        world.update()
+        world.start_cooldown(a, 300)  # mated on frame 1, may mate again on frame 301
+        for _ in range(298):
+            world.update()
+            self.assertTrue(a.cooling_down)
+            self.assertEqual(world.cooldowns_left()[id(a)], 301 - world.frame_count)
+        world.update()
+        self.assertEqual(world.frame_count, 300)
+        self.assertFalse(a.cooling_down)
+        self.assertEqual(world.cooldowns_left(), {})
+
+    def test_vector_world_gets_remaining_cooldown(self):
+        from simulation.vectorized import VectorWorld
+        world = World(seed=2)
+        world.update()
+        world.start_cooldown(world.creatures[0], 300)
+        for _ in range(100):
+            world.update()
+        self.assertEqual(world.cooldowns_left(), {id(world.creatures[0]): 200})
+        self.assertEqual(VectorWorld.from_world(world).cooldown[0], 200)
+
+if __name__ == '__main__':
+    unittest.main()
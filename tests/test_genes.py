@@ -0,0 +1,56 @@
+import random
+import unittest
+from simulation.genes import Genes, crossover, mutate
+from simulation.creature import Creature
+
+class TestGenes(unittest.TestCase):
+    def setUp(self):
+        self.genes = Genes((200.0, 1.0, 0.1, 10, 20, 30))
+
+    def test_named_and_dict_access(self):
+        self.assertEqual(self.genes.vision, 200.0)
+        self.assertEqual(self.genes['speed'], 1.0)
+        self.assertEqual(self.genes.get('metabolism', 0.2), 0.1)
+        self.assertEqual(self.genes['color'], {'R': 10, 'G': 20, 'B': 30})
+        self.assertEqual(self.genes.color, (10, 20, 30))
+        self.assertIn('vision', self.genes)
+        self.assertNotIn('brain', self.genes)
+        self.genes['color'] = {'R': 1, 'G': 2, 'B': 3}
+        self.assertEqual(self.genes.color, (1, 2, 3))
+
+    def test_dict_round_trip(self):
+        data = self.genes.to_dict()
+        self.assertEqual(Genes.from_dict(data), self.genes)
+        # Missing genes fall back to the old defaults
+        self.assertEqual(Genes.from_dict({'vision': 5}).to_dict()['metabolism'], 0.2)
+        self.assertEqual(Genes.from_dict({'vision': 5})['color'], {'R': 128, 'G': 128, 'B': 128})
+
+    def test_crossover_averages(self):
+        other = Genes((100.0, 2.0, 0.3, 11, 20, 31))
+        child = crossover(self.genes, other)
+        self.assertEqual(child.vision, 150.0)
+        self.assertAlmostEqual(child.metabolism, 0.2)
+        self.assertEqual(child.color, (10, 20, 30))
+
+    def test_mutate_respects_bounds(self):
+        rng = random.Random(0)
+        genes = Genes((0.1, 0.1, 0.001, 0, 255, 128))
+        for _ in range(200):
+            genes = mutate(genes, rng, 1.0)
+            self.assertGreaterEqual(genes.speed, 0.1)
+            self.assertGreaterEqual(genes.metabolism, 0.001)
+            self.assertTrue(all(0 <= c <= 255 for c in genes.color))
+
+    def test_mutate_returns_new_vector(self):
+        mutated = mutate(self.genes, random.Random(1), 1.0)
+        self.assertIsNot(mutated.values, self.genes.values)
+        self.assertEqual(self.genes.vision, 200.0)
+
+    def test_creature_is_slotted(self):
+        creature = Creature(10, 10, genes={'vision': 50, 'speed': 1, 'metabolism': 0.1})
+        self.assertFalse(hasattr(creature, '__dict__'))
+        self.assertIsInstance(creature.genes, Genes)
+        self.assertFalse(hasattr(creature, 'death_cause'))
+
+if __name__ == '__main__':
+    unittest.main()
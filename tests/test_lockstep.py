@@ -0,0 +1,79 @@
+import unittest
+import numpy as np
+from simulation.batch import run_batch
+from simulation.lockstep import LockstepWorlds
+from simulation.settings import SimulationConfig
+from simulation.vectorized import in_lake
+
+class TestLockstepWorlds(unittest.TestCase):
+    def setUp(self):
+        self.worlds = LockstepWorlds(3, creature_count=4, bush_count=2, seed=5)
+
+    def test_initial_state(self):
+        self.assertEqual(self.worlds.population.tolist(), [4, 4, 4])
+        self.assertFalse(in_lake(self.worlds.x + 20, self.worlds.y + 20).any())
+        food = self.worlds.food_alive.sum(axis=2)
+        self.assertTrue(1 <= food.min() and food.max() <= 3)
+
+    def test_worlds_eat_independently(self):
+        # The same food spot in two worlds, with two creatures on it in each
+        w = self.worlds
+        w.food_alive[:] = False
+        w.food_alive[:2, 0, 0] = True
+        w.food_x[:2, 0, 0] = w.food_y[:2, 0, 0] = 200
+        w.x[:2, :2] = w.y[:2, :2] = 200
+        w.hunger[:2, :2] = 50
+        w._eat()
+        # One food per world: the first creature in each world eats it
+        self.assertEqual(w.hunger[:2, 0].tolist(), [0, 0])
+        self.assertEqual(w.hunger[:2, 1].tolist(), [50, 50])
+        self.assertFalse(w.food_alive.any())
+
+    def test_children_reuse_free_slots_and_grow(self):
+        w = self.worlds
+        w.alive[0, 1] = False
+        worlds = np.array([0, 0, 2])
+        mothers = np.array([0, 2, 0])
+        fathers = np.array([3, 3, 1])
+        w._add_children(worlds, mothers, fathers)
+        self.assertTrue(w.alive[0, 1])
+        self.assertEqual(w.population.tolist(), [5, 4, 5])
+        self.assertGreaterEqual(w.x.shape[1], 5)
+        self.assertEqual(w.births.tolist(), [2, 0, 1])
+        self.assertEqual(w.color.shape[:2], w.x.shape)
+
+    def test_extinct_worlds_stop_and_keep_survivors(self):
+        w = self.worlds
+        w.hunger[1] = SimulationConfig().hunger_max
+        w.run(max_frames=5)
+        results = w.results()
+        self.assertEqual([r['frames'] for r in results], [5, 1, 5])
+        self.assertEqual(results[1]['death_causes']['starvation'], 4)
+        self.assertEqual(len(results[1]['survivors']), 2)
+
+    def test_history_and_deaths_split_per_world(self):
+        worlds = LockstepWorlds(4, creature_count=6, seed=3, log_interval=50)
+        worlds.run(max_frames=800)
+        for world, result in enumerate(worlds.results()):
+            self.assertEqual(len(result['history']), result['frames'] // 50)
+            if result['history']:
+                self.assertEqual(result['history'][-1][5], result['population'])
+            deaths = sum(result['death_causes'].values())
+            self.assertEqual(result['population'], 6 + worlds.births[world] - deaths)
+
+    def test_reproducible_from_seed(self):
+        a = LockstepWorlds(2, creature_count=4, seed=9)
+        b = LockstepWorlds(2, creature_count=4, seed=9)
+        a.run(max_frames=300)
+        b.run(max_frames=300)
+        self.assertEqual(a.results(), b.results())
+
+    def test_batch_engine(self):
+        result = run_batch(range(5, 8), max_frames=200, engine='lockstep', creature_count=4)
+        self.assertEqual(len(result['runs']), 3)
+        self.assertEqual([(run['batch_seed'], run['world']) for run in result['runs']], [(5, 0), (5, 1), (5, 2)])
+        self.assertNotIn('seed', result['runs'][0])
+        self.assertEqual(result['mean_frames'], 200)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from simulation.profiler import PhaseProfiler
+from simulation.world import World
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 0.5
+        return self.now
+
+class TestPhaseProfiler(unittest.TestCase):
+    def test_laps_charge_time_since_previous_lap(self):
+        prof = PhaseProfiler(clock=FakeClock())
+        prof.begin()
+        prof.lap('a')
+        prof.lap('b')
+        prof.lap('b')
+        prof.count('checks', 3)
+        report = prof.report()
+        self.assertEqual(report['ticks'], 1)
+        self.assertEqual(report['phases']['b'], {'seconds': 1.0, 'calls': 2, 'ms_per_tick': 1000.0, 'share': 2 / 3})
+        self.assertEqual(list(report['phases']), ['b', 'a'])
+        self.assertEqual(report['counters']['checks'], {'total': 3, 'per_tick': 3.0})
+        self.assertEqual(prof.lines()[0], "b: 1000.00 ms/tick (67%)")
+        prof.reset()
+        self.assertEqual(prof.report()['phases'], {})
+
+    def test_world_phases_and_counters(self):
+        plain, profiled = World(seed=5), World(seed=5)
+        profiled.profiler = PhaseProfiler()
+        for _ in range(800):
+            plain.update()
+            profiled.update()
+        report = profiled.profiler.report()
+        self.assertEqual(report['ticks'], 800)
+        self.assertEqual(set(report['phases']), {'think_move', 'eat', 'deaths', 'reproduction', 'events', 'stats'})
+        self.assertGreater(report['counters']['food_contacts']['total'], 0)
+        self.assertGreater(report['counters']['food_candidates']['total'], 0)
+        # Profiling only observes
+        self.assertEqual([(c.x, c.y, c.hunger) for c in profiled.creatures], [(c.x, c.y, c.hunger) for c in plain.creatures])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from simulation.recorder import HistoryRecorder, load_history, COLUMNS
+from simulation.world import World
+
+class TestHistoryRecorder(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'history')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_chunks_are_flushed_and_loaded(self):
+        recorder = HistoryRecorder(self.path, columns=('a', 'b'), chunk_rows=3)
+        for i in range(7):
+            recorder.append((i, i * 0.5))
+        self.assertEqual(recorder.rows, 6)          # two full chunks on disk
+        self.assertEqual(len(recorder.buffers[0]), 1)
+        self.assertEqual(len(load_history(self.path)['a']), 6)
+        recorder.close()
+        history = load_history(self.path)
+        self.assertIsInstance(history['a'], np.memmap)
+        np.testing.assert_array_equal(history['a'], np.arange(7))
+        np.testing.assert_array_equal(history['b'], np.arange(7) * 0.5)
+        np.testing.assert_array_equal(load_history(self.path, mmap=False)['b'], history['b'])
+
+    def test_reused_directory_starts_empty(self):
+        with HistoryRecorder(self.path, columns=('a',)) as recorder:
+            recorder.append((1,))
+        with HistoryRecorder(self.path, columns=('a',)):
+            pass
+        self.assertEqual(len(load_history(self.path)['a']), 0)
+
+    def test_resume_cuts_back_and_appends(self):
+        with HistoryRecorder(self.path, columns=('a',)) as recorder:
+            for i in range(5):
+                recorder.append((i,))
+        with HistoryRecorder(self.path, columns=('a',), resume_rows=3) as recorder:
+            self.assertEqual(len(recorder), 3)
+            recorder.append((30,))
+        np.testing.assert_array_equal(load_history(self.path)['a'], [0, 1, 2, 30])
+        with self.assertRaises(ValueError):
+            HistoryRecorder(self.path, columns=('a',), resume_rows=10)
+
+    def test_world_streams_history_to_recorder(self):
+        plain = World(seed=2, log_interval=5)
+        with HistoryRecorder(self.path, chunk_rows=4) as recorder:
+            recorded = World(seed=2, recorder=recorder, log_interval=5)
+            for _ in range(50):
+                plain.update()
+                recorded.update()
+        self.assertEqual(recorded.history, [])
+        self.assertEqual(len(plain.history), 10)
+        history = load_history(self.path)
+        for i, name in enumerate(COLUMNS):
+            np.testing.assert_allclose(history[name], [row[i] for row in plain.history])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+from simulation.bush import Bush
+from simulation.creature import Creature
+from simulation.food import Food
+from simulation.registry import FoodRegistry
+from simulation.world import World
+
+class TestFoodRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = FoodRegistry(cell_size=32)
+
+    def test_ids_are_stable_and_never_reused(self):
+        a, b = Food(10, 10), Food(200, 200)
+        self.assertEqual((self.registry.insert(a), self.registry.insert(b)), (0, 1))
+        self.registry.remove(a)
+        self.registry.remove(a)  # already gone
+        c = Food(30, 30)
+        self.assertEqual(self.registry.insert(c), 2)
+        self.assertNotIn(a, self.registry)
+        self.assertIs(self.registry.get(1), b)
+        self.assertEqual(list(self.registry), [b, c])
+        self.assertEqual(len(self.registry.grid), 2)
+
+    def test_contacts_are_strict_and_in_id_order(self):
+        far, edge, near, closer = Food(80, 80), Food(60, 50), Food(55, 52), Food(50, 51)
+        for f in (far, edge, near, closer):
+            self.registry.insert(f)
+        self.assertEqual(self.registry.contacts(50, 50, 10), [near, closer])
+
+    def test_bushes_register_their_food(self):
+        bush = Bush(0, 0)
+        bush.food_grid = self.registry
+        bush.grow_food(Food)
+        food = bush.food[0]
+        self.assertIs(food.bush, bush)
+        self.assertIn(food, self.registry)
+        bush.remove_food(food)
+        self.assertEqual(len(self.registry), 0)
+
+class TestWorldFood(unittest.TestCase):
+    def test_registry_matches_bushes_without_rebuild(self):
+        world = World(seed=8)
+        for _ in range(2000):
+            world.update()
+            if world.frame_count % 100 == 0:
+                on_bushes = [f for b in world.bushes for f in b.food]
+                self.assertEqual(sorted(f.id for f in on_bushes), [f.id for f in world.food])
+
+    def test_creature_eats_one_food_per_bush(self):
+        world = World(seed=8)
+        bush = world.bushes[0]
+        while len(bush.food) < 3:
+            bush.grow_food(Food)
+        first, second = bush.food[0], bush.food[1]
+        creature = Creature(first.x, first.y)
+        # Move the second item onto the first so both are touching
+        world.food.grid.remove(second)
+        second.x, second.y = first.x + 1, first.y
+        world.food.grid.insert(second)
+        creature.hunger = 300
+        world.eat(creature, world.food.contacts(creature.x, creature.y, 10))
+        self.assertEqual(creature.hunger, 0)
+        self.assertNotIn(first, world.food)
+        self.assertIn(second, world.food)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+import pygame
+from simulation.render import Renderer
+from simulation.world import World
+
+class TestRenderer(unittest.TestCase):
+    def setUp(self):
+        self.world = World(seed=5)
+        self.screen = pygame.Surface((800, 600))
+        self.renderer = Renderer(self.screen)
+
+    def test_background_built_once(self):
+        self.renderer.draw(self.world)
+        background = self.renderer.background
+        self.assertEqual(self.renderer.updated, [self.screen.get_rect()])
+        self.renderer.draw(self.world)
+        self.assertIs(self.renderer.background, background)
+
+    def test_background_rebuilt_when_bushes_change(self):
+        self.renderer.draw(self.world)
+        background = self.renderer.background
+        self.world.bushes.pop()
+        self.renderer.draw(self.world)
+        self.assertIsNot(self.renderer.background, background)
+
+    def test_dirty_rects_cover_sprites_and_restore_background(self):
+        creature = self.world.creatures[0]
+        creature.x, creature.y = 0, 0
+        self.world.creatures = [creature]
+        self.renderer.draw(self.world)
+        food_count = sum(len(b.food) for b in self.world.bushes)
+        self.assertEqual(len(self.renderer.dirty), food_count + 1)
+        self.assertIn(pygame.Rect(0, 0, 40, 40), self.renderer.dirty)
+
+        # Move the creature away: its old spot is repainted from the background
+        creature.x, creature.y = 100, 0
+        self.renderer.draw(self.world)
+        self.assertIn(pygame.Rect(0, 0, 40, 40), self.renderer.updated)
+        self.assertEqual(self.screen.get_at((20, 20)), self.renderer.background.get_at((20, 20)))
+
+    def test_overlay_rects_are_tracked(self):
+        self.renderer.draw(self.world)
+        self.renderer.mark_dirty((5, 5, 200, 100))
+        self.assertIn(pygame.Rect(5, 5, 200, 100), self.renderer.dirty)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from unittest.mock import MagicMock
+from simulation.runner import run_headless, survivor_data
+from simulation.creature import Creature
+
+class CountdownWorld:
+    # Minimal stand-in: goes extinct after a fixed number of updates
+    def __init__(self, lifetime):
+        self.lifetime = lifetime
+        self.updates = 0
+        self.death_causes = {'starvation': 0}
+
+    @property
+    def population(self):
+        return 1 if self.updates < self.lifetime else 0
+
+    def update(self):
+        self.updates += 1
+
+class TestRunHeadless(unittest.TestCase):
+    def test_stops_at_max_frames(self):
+        world = CountdownWorld(100)
+        result = run_headless(world, max_frames=10)
+        self.assertEqual(result['frames'], 10)
+        self.assertEqual(world.updates, 10)
+
+    def test_stops_at_extinction(self):
+        result = run_headless(CountdownWorld(7))
+        self.assertEqual(result['frames'], 7)
+        self.assertEqual(result['population'], 0)
+
+    def test_renders_every_k_frames(self):
+        render = MagicMock(return_value=True)
+        run_headless(CountdownWorld(100), max_frames=20, render_every=5, render=render)
+        self.assertEqual(render.call_count, 4)
+
+    def test_render_can_stop_run(self):
+        result = run_headless(CountdownWorld(100), render_every=1, render=lambda world: False)
+        self.assertEqual(result['frames'], 1)
+
+    def test_survivor_data_picks_oldest(self):
+        young = Creature(0, 0, genes={'vision': 1}, sex='male')
+        old = Creature(0, 0, genes={'vision': 2}, sex='female')
+        young.age, old.age = 1, 9
+        world = MagicMock(spec=['creatures', 'last_population'], creatures=[], last_population=[young, old])
+        data = survivor_data(world, count=1)
+        self.assertEqual(data, [{'genes': old.genes.to_dict(), 'sex': 'female'}])
+        self.assertEqual(data[0]['genes']['vision'], 2)
+
+if __name__ == '__main__':
+    unittest.main()
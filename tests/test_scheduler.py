@@ -0,0 +1,68 @@
+import unittest
+from simulation.scheduler import TickScheduler
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TimedWorld:
+    # Each update advances the fake clock by a fixed tick cost
+    def __init__(self, clock, tick_cost, lifetime=None):
+        self.clock = clock
+        self.tick_cost = tick_cost
+        self.lifetime = lifetime
+        self.updates = 0
+
+    @property
+    def population(self):
+        return 1 if self.lifetime is None or self.updates < self.lifetime else 0
+
+    def update(self):
+        self.updates += 1
+        self.clock.now += self.tick_cost
+
+class TestTickScheduler(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_fixed_ticks_per_frame(self):
+        world = TimedWorld(self.clock, 0.001)
+        scheduler = TickScheduler(ticks_per_frame=5, adaptive=False, clock=self.clock)
+        self.assertEqual(scheduler.step(world), 5)
+        self.assertEqual(world.updates, 5)
+        self.assertEqual(scheduler.ticks_per_frame, 5)
+
+    def test_adapts_to_budget(self):
+        world = TimedWorld(self.clock, 0.001)
+        scheduler = TickScheduler(ticks_per_frame=1, budget=0.01, clock=self.clock)
+        for _ in range(20):
+            scheduler.step(world)
+        self.assertEqual(scheduler.ticks_per_frame, 10)
+
+    def test_respects_limits(self):
+        world = TimedWorld(self.clock, 0.0)
+        scheduler = TickScheduler(ticks_per_frame=1, budget=0.01, max_ticks=50, clock=self.clock)
+        for _ in range(10):
+            scheduler.step(world)
+        self.assertEqual(scheduler.ticks_per_frame, 50)
+
+    def test_stops_when_population_dies(self):
+        world = TimedWorld(self.clock, 0.001, lifetime=3)
+        scheduler = TickScheduler(ticks_per_frame=10, adaptive=False, clock=self.clock)
+        self.assertEqual(scheduler.step(world), 3)
+
+    def test_measures_rates(self):
+        world = TimedWorld(self.clock, 0.002)
+        scheduler = TickScheduler(ticks_per_frame=5, adaptive=False, window=1.0, clock=self.clock)
+        for _ in range(100):
+            scheduler.step(world)
+        # 5 ticks x 2 ms = 10 ms per frame
+        self.assertAlmostEqual(scheduler.frames_per_sec, 100, delta=1)
+        self.assertAlmostEqual(scheduler.ticks_per_sec, 500, delta=5)
+        self.assertEqual(scheduler.total_ticks, 500)
+
+if __name__ == '__main__':
+    unittest.main()
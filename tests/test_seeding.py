@@ -0,0 +1,32 @@
+import random
+import unittest
+from simulation.world import World
+
+def run(world, frames):
+    for _ in range(frames):
+        world.update()
+    return [(c.x, c.y, c.energy, c.hunger, c.thirst, c.sex) for c in world.creatures]
+
+class TestSeeding(unittest.TestCase):
+    def test_same_seed_same_run(self):
+        self.assertEqual(run(World(seed=11), 1500), run(World(seed=11), 1500))
+
+    def test_interleaved_worlds_do_not_interfere(self):
+        expected = run(World(seed=4), 300)
+        a, b = World(seed=4), World(seed=5)
+        for _ in range(300):
+            a.update()
+            b.update()
+            random.random()  # the global stream is not used by worlds
+        self.assertEqual(run(a, 0), expected)
+
+    def test_different_seeds_differ(self):
+        self.assertNotEqual(run(World(seed=1), 0), run(World(seed=2), 0))
+
+    def test_stream_is_shared_with_creatures_and_bushes(self):
+        world = World(seed=1)
+        self.assertTrue(all(c.rng is world.rng for c in world.creatures))
+        self.assertTrue(all(b.rng is world.rng for b in world.bushes))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import random
+import unittest
+from simulation.spatial import SpatialGrid, find_overlapping_pairs
+from simulation.utils import rects_collide
+from simulation.creature import Creature
+from simulation.bush import Bush
+
+class DummyFood:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.targeted_by = None
+
+class TestSpatialGrid(unittest.TestCase):
+    def setUp(self):
+        self.grid = SpatialGrid(cell_size=32)
+
+    def test_insert_and_remove(self):
+        food = DummyFood(10, 10)
+        self.grid.insert(food)
+        self.assertIn(food, self.grid)
+        self.assertEqual(len(self.grid), 1)
+        self.grid.remove(food)
+        self.assertNotIn(food, self.grid)
+        self.assertEqual(self.grid.cells, {})
+        # Removing twice is a no-op
+        self.grid.remove(food)
+
+    def test_query_only_returns_nearby_cells(self):
+        near = DummyFood(40, 40)
+        far = DummyFood(700, 500)
+        self.grid.insert(near)
+        self.grid.insert(far)
+        self.assertEqual(list(self.grid.query(50, 50, 20)), [near])
+
+    def test_query_covers_radius_dense_and_sparse(self):
+        items = [DummyFood(x, y) for x in range(0, 320, 16) for y in range(0, 320, 16)]
+        for item in items:
+            self.grid.insert(item)
+        # Dense grid walks the square of cells, sparse grid walks occupied cells
+        sparse_grid = SpatialGrid(cell_size=32)
+        for item in items[::50]:
+            sparse_grid.insert(item)
+        for grid, members in ((self.grid, items), (sparse_grid, items[::50])):
+            found = set(grid.query(160, 160, 60))
+            expected = {f for f in members if abs(f.x - 160) <= 60 and abs(f.y - 160) <= 60}
+            self.assertTrue(expected <= found)
+
+    def test_bush_keeps_grid_in_sync(self):
+        bush = Bush(0, 0)
+        bush.food_grid = self.grid
+        bush.grow_food(DummyFood)
+        food = bush.food[0]
+        self.assertIn(food, self.grid)
+        bush.remove_food(food)
+        self.assertNotIn(food, self.grid)
+
+    def test_find_nearest_food_uses_grid(self):
+        creature = Creature(50, 50)
+        creature.genes['vision'] = 20
+        food1 = DummyFood(60, 50)
+        food2 = DummyFood(80, 50)
+        for f in (food1, food2):
+            self.grid.insert(f)
+        self.assertIs(creature.find_nearest_food([], [], self.grid), food1)
+
+class TestFindOverlappingPairs(unittest.TestCase):
+    def brute_force(self, firsts, seconds, size):
+        # The nested loop World.update used before the broad-phase
+        used = set()
+        pairs = []
+        for a in firsts:
+            for i, b in enumerate(seconds):
+                if i not in used and rects_collide(a.x, a.y, size, size, b.x, b.y, size, size):
+                    used.add(i)
+                    pairs.append((a, b))
+                    break
+        return pairs
+
+    def test_matches_brute_force(self):
+        rng = random.Random(2)
+        for _ in range(20):
+            firsts = [DummyFood(rng.randint(0, 300), rng.randint(0, 300)) for _ in range(40)]
+            seconds = [DummyFood(rng.randint(0, 300), rng.randint(0, 300)) for _ in range(40)]
+            self.assertEqual(find_overlapping_pairs(firsts, seconds, 40), self.brute_force(firsts, seconds, 40))
+
+    def test_touching_edges_do_not_overlap(self):
+        self.assertEqual(find_overlapping_pairs([DummyFood(0, 0)], [DummyFood(40, 0)], 40), [])
+
+    def test_one_partner_each(self):
+        a, b = DummyFood(0, 0), DummyFood(5, 5)
+        m = DummyFood(10, 10)
+        self.assertEqual(find_overlapping_pairs([a, b], [m], 40), [(a, m)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import random
+import statistics
+import unittest
+from simulation.creature import Creature
+from simulation.stats import PopulationStats, RunningStat
+from simulation.world import World
+
+class TestRunningStat(unittest.TestCase):
+    def test_matches_full_scan_after_removals(self):
+        rng = random.Random(3)
+        stat, live = RunningStat(), []
+        for _ in range(500):
+            if live and rng.random() < 0.4:
+                value = live.pop(rng.randrange(len(live)))
+                stat.remove(value)
+            else:
+                value = rng.uniform(0, 10)
+                live.append(value)
+                stat.add(value)
+            self.assertEqual(stat.count, len(live))
+            if live:
+                self.assertAlmostEqual(stat.mean, statistics.fmean(live))
+                self.assertAlmostEqual(stat.variance, statistics.pvariance(live))
+                self.assertEqual(stat.min, min(live))
+                self.assertEqual(stat.max, max(live))
+        # Stale heap entries are compacted away
+        self.assertLessEqual(len(stat._low), 2 * stat.count + 33)
+
+    def test_empty(self):
+        stat = RunningStat()
+        stat.add(4.0)
+        stat.remove(4.0)
+        self.assertEqual((stat.mean, stat.variance, stat.min, stat.max), (0, 0, None, None))
+
+class TestPopulationStats(unittest.TestCase):
+    def test_per_sex_and_histogram(self):
+        stats = PopulationStats()
+        a = Creature(0, 0, genes={'vision': 180, 'speed': 1.0, 'metabolism': 0.1}, sex='male')
+        b = Creature(0, 0, genes={'vision': 220, 'speed': 0.6, 'metabolism': 0.05}, sex='female')
+        c = Creature(0, 0, genes={'vision': 181, 'speed': 1.4, 'metabolism': 0.15}, sex='female')
+        for creature in (a, b, c):
+            stats.add(creature)
+        self.assertEqual(stats.count(), 3)
+        self.assertEqual(stats.count('female'), 2)
+        self.assertAlmostEqual(stats.mean('vision', 'female'), 200.5)
+        self.assertEqual(stats.max('speed', 'female'), 1.4)
+        self.assertEqual(stats.histogram('vision'), [(180.0, 2), (220.0, 1)])
+        stats.remove(b)
+        self.assertEqual(stats.count('female'), 1)
+        self.assertEqual(stats.histogram('vision'), [(180.0, 2)])
+        self.assertEqual(stats.summary('male')['vision']['min'], 180)
+
+        # Genes changed after the creature was counted don't skew its removal
+        c.genes['vision'] = 500
+        stats.remove(c)
+        self.assertEqual(stats.count('female'), 0)
+        self.assertEqual(stats.histogram('vision'), [(180.0, 1)])
+        self.assertEqual(stats.max('vision'), 180)
+
+    def test_world_history_matches_full_scan(self):
+        world = World(seed=4, log_interval=50)
+        for _ in range(1500):
+            world.update()
+            if world.frame_count % 50 == 0 and world.creatures:
+                row = world.history[-1]
+                n = len(world.creatures)
+                self.assertAlmostEqual(row[1], sum(c.genes.vision for c in world.creatures) / n)
+                self.assertAlmostEqual(row[2], sum(c.genes.speed for c in world.creatures) / n)
+                self.assertAlmostEqual(row[3], sum(c.genes.metabolism for c in world.creatures) / n)
+                self.assertEqual(world.stats.count(), n)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+from simulation import settings
+from simulation.creature import Creature
+from simulation.settings import DEFAULT_CONFIG, SimulationConfig
+from simulation.sweep import ResultCache, grid, random_points, run_sweep
+from simulation.world import World
+
+class TestSettings(unittest.TestCase):
+    def test_defaults_come_from_config(self):
+        self.assertEqual(DEFAULT_CONFIG.mutation_rate, settings.MUTATION_RATE)
+        self.assertIs(World(seed=1, creature_count=2).config, DEFAULT_CONFIG)
+        self.assertIs(Creature(0, 0).config, DEFAULT_CONFIG)
+        with self.assertRaises(ValueError):
+            SimulationConfig.from_dict({'no_such_setting': 1})
+
+    def test_world_passes_its_config_to_creatures(self):
+        world = World(seed=1, creature_count=2, config=SimulationConfig(mutation_rate=1))
+        self.assertTrue(all(c.config.mutation_rate == 1 for c in world.creatures))
+
+    def test_digest_is_stable(self):
+        config = SimulationConfig(mutation_rate=0.3)
+        self.assertEqual(config.digest(), SimulationConfig.from_dict(config.to_dict()).digest())
+        self.assertNotEqual(config.digest(), SimulationConfig().digest())
+
+    def test_worlds_keep_their_own_settings(self):
+        # Two worlds with different settings in one process don't leak into each other
+        hungry = World(seed=2, creature_count=4, config=SimulationConfig(hunger_threshold=0))
+        default = World(seed=2, creature_count=4)
+        self.assertEqual(hungry.config.hunger_threshold, 0)
+        self.assertEqual(default.config, SimulationConfig())
+        self.assertTrue(all(c.config is hungry.config for c in hungry.creatures))
+        for _ in range(50):
+            hungry.update()
+            default.update()
+        self.assertEqual(default.death_causes, World(seed=2, creature_count=4).death_causes)
+
+class TestSweep(unittest.TestCase):
+    def test_points(self):
+        points = grid({'speed_max': [3, 4], 'mutation_rate': [0.1, 0.2]})
+        self.assertEqual(len(points), 4)
+        self.assertEqual(points[0], {'mutation_rate': 0.1, 'speed_max': 3})
+        sampled = random_points({'mutation_rate': (0.0, 1.0), 'creature_count': (2, 8)}, 5, seed=1)
+        self.assertEqual(sampled, random_points({'mutation_rate': (0.0, 1.0), 'creature_count': (2, 8)}, 5, seed=1))
+        self.assertTrue(all(2 <= p['creature_count'] <= 8 for p in sampled))
+
+    def test_cache_key(self):
+        cache = ResultCache('unused', version='v1')
+        config = SimulationConfig()
+        key = cache.key(config, 0, 100)
+        self.assertEqual(key, cache.key(SimulationConfig(), 0, 100))
+        self.assertNotEqual(key, cache.key(config, 1, 100))
+        self.assertNotEqual(key, cache.key(config, 0, 200))
+        self.assertNotEqual(key, ResultCache('unused', version='v2').key(config, 0, 100))
+
+    def test_overrides_take_the_declared_type(self):
+        self.assertEqual(SimulationConfig.cast('speed_max', 3), 3.0)
+        self.assertEqual(SimulationConfig.cast('creature_count', '4'), 4)
+        with self.assertRaises(ValueError):
+            SimulationConfig.cast('creature_count', 4.5)
+        with self.assertRaises(ValueError):
+            SimulationConfig.cast('no_such_setting', 1)
+        with tempfile.TemporaryDirectory() as tmp:
+            rows = run_sweep([{'creature_count': 2.0}, {'creature_count': 2}], max_frames=10, processes=1, cache_dir=tmp)
+            self.assertEqual(rows[0]['config'], rows[1]['config'])
+            self.assertEqual(rows[0]['result'], rows[1]['result'])
+            self.assertEqual(len(os.listdir(tmp)), 1)
+
+    def test_rerun_only_computes_missing_points(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            options = dict(seeds=[0], max_frames=200, processes=1, cache_dir=tmp,
+                           base=SimulationConfig(creature_count=4))
+            first = run_sweep([{'mutation_rate': 0.1}], **options)
+            self.assertEqual([row['cached'] for row in first], [False])
+            self.assertEqual(len(os.listdir(tmp)), 1)
+
+            second = run_sweep([{'mutation_rate': 0.1}, {'mutation_rate': 0.2}], **options)
+            self.assertEqual([row['cached'] for row in second], [True, False])
+            self.assertEqual(second[0]['result'], first[0]['result'])
+            self.assertEqual(second[0]['result']['frames'], 200)
+
+if __name__ == '__main__':
+    unittest.main()
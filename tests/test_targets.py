@@ -0,0 +1,53 @@
+import unittest
+from simulation.targets import TargetRegistry
+from simulation.creature import Creature
+
+class DummyFood:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.targeted_by = None
+
+class TestTargetRegistry(unittest.TestCase):
+    def setUp(self):
+        self.claims = TargetRegistry()
+        self.a = Creature(50, 50)
+        self.b = Creature(60, 50)
+        self.food = DummyFood(55, 50)
+
+    def test_claim_and_release(self):
+        self.claims.claim(self.a, self.food)
+        self.assertIs(self.a.target, self.food)
+        self.assertIs(self.food.targeted_by, self.a)
+        self.assertIs(self.claims.claimant(self.food), self.a)
+        self.claims.release(self.a)
+        self.assertIsNone(self.a.target)
+        self.assertIsNone(self.food.targeted_by)
+        self.assertEqual(len(self.claims), 0)
+
+    def test_first_claimant_keeps_food(self):
+        self.claims.claim(self.a, self.food)
+        self.claims.claim(self.b, self.food)
+        self.assertIs(self.food.targeted_by, self.a)
+        # Once the first claimant lets go the other can take it over
+        self.claims.release(self.a)
+        self.claims.claim(self.b, self.food)
+        self.assertIs(self.food.targeted_by, self.b)
+
+    def test_release_food_clears_claimant_target(self):
+        self.claims.claim(self.a, self.food)
+        self.claims.release_food(self.food)
+        self.assertIsNone(self.a.target)
+        self.assertIsNone(self.food.targeted_by)
+
+    def test_find_nearest_food_skips_claimed(self):
+        food2 = DummyFood(70, 50)
+        self.a.genes['vision'] = 30
+        self.claims.claim(self.b, self.food)
+        nearest = self.a.find_nearest_food([self.food, food2], [], claims=self.claims)
+        self.assertIs(nearest, food2)
+        # Falls back to claimed food when nothing else is visible
+        self.assertIs(self.a.find_nearest_food([self.food], [], claims=self.claims), self.food)
+
+if __name__ == '__main__':
+    unittest.main()
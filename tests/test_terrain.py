@@ -0,0 +1,93 @@
+import unittest
+from simulation.terrain import Terrain, DEFAULT_TERRAIN
+from simulation.creature import Creature
+from simulation.world import World
+from simulation.terrain import LAKE_X, LAKE_Y, LAKE_WIDTH, LAKE_HEIGHT
+
+def ellipse_formula(px, py, x, y, w, h):
+    return ((px - (x + w / 2)) / (w / 2)) ** 2 + ((py - (y + h / 2)) / (h / 2)) ** 2 <= 1
+
+class TestTerrain(unittest.TestCase):
+    def test_default_mask_matches_ellipse_formula(self):
+        t = DEFAULT_TERRAIN
+        for py in range(LAKE_Y - 2, LAKE_Y + LAKE_HEIGHT + 3):
+            for px in range(LAKE_X - 2, LAKE_X + LAKE_WIDTH + 3):
+                self.assertEqual(t.is_water(px, py), ellipse_formula(px, py, LAKE_X, LAKE_Y, LAKE_WIDTH, LAKE_HEIGHT), (px, py))
+        self.assertEqual(sum(t.water), sum(
+            ellipse_formula(px, py, LAKE_X, LAKE_Y, LAKE_WIDTH, LAKE_HEIGHT)
+            for py in range(LAKE_Y, LAKE_Y + LAKE_HEIGHT + 1) for px in range(LAKE_X, LAKE_X + LAKE_WIDTH + 1)))
+
+    def test_multiple_lakes_and_bounds(self):
+        t = Terrain(100, 100, lakes=[(0, 0, 20, 20), (60, 60, 30, 10)])
+        self.assertTrue(t.is_water(10, 10))
+        self.assertTrue(t.is_water(75, 65))
+        self.assertFalse(t.is_water(50, 50))
+        self.assertFalse(t.is_water(-1, 10))
+        self.assertTrue(t.is_water(10.7, 10.2))
+        self.assertFalse(t.is_water(-0.5, 10))
+        self.assertFalse(t.is_water(10, 100))
+        self.assertTrue(t.rect_touches_lake(15, 15, 10, 10))
+        self.assertFalse(t.rect_touches_lake(30, 30, 10, 10))
+
+    def test_painted_water_blocks_moves_and_quenches(self):
+        t = Terrain(200, 200, lakes=[])
+        for px in range(100, 200):
+            for py in range(200):
+                t.set_water(px, py)
+        creature = Creature(41, 50, terrain=t)
+        creature.thirst = 100
+        creature.move((1, 0), (200, 200))
+        self.assertEqual(creature.x, 42)
+        creature.x = 79
+        creature.move((1, 0), (200, 200))   # center would reach x=100
+        self.assertEqual(creature.x, 79)
+        creature.try_drink()                # right corners are in the water
+        self.assertEqual(creature.thirst, 0)
+
+    def test_world_uses_custom_terrain(self):
+        t = Terrain(lakes=[(0, 0, 300, 300)])
+        world = World(seed=1, terrain=t)
+        self.assertTrue(all(c.terrain is t for c in world.creatures))
+        self.assertFalse(any(t.is_water(c.x + 20, c.y + 20) for c in world.creatures))
+        self.assertFalse(any(t.rect_touches_lake(b.x, b.y, 64, 64) for b in world.bushes))
+
+class TestFlowField(unittest.TestCase):
+    def walk_to_water(self, creature, limit=2000):
+        steps = 0
+        while not creature._in_lake() and steps < limit:
+            creature.move(creature.think([], []), (creature.terrain.width, creature.terrain.height))
+            steps += 1
+        return steps
+
+    def test_thirsty_creature_heads_for_nearest_lake(self):
+        # The default steering aimed at the config lake; the field finds the closest shore
+        t = Terrain(400, 300, lakes=[(0, 0, 60, 60), (300, 200, 100, 100)])
+        creature = Creature(100, 80, terrain=t)
+        creature.thirst = 1000
+        steps = self.walk_to_water(creature)
+        self.assertLess(steps, 2000)
+        self.assertLess(creature.x, 100)
+        self.assertLess(creature.y, 80)
+
+    def test_every_reachable_cell_leads_to_water(self):
+        t = Terrain(200, 160, lakes=[(120, 40, 60, 80)])
+        field = t.flow_field()
+        for i, distance in enumerate(field.distance):
+            if distance < 0:
+                continue
+            x, y = field._position(i)
+            creature = Creature(x, y, terrain=t)
+            creature.thirst = 1000
+            self.assertLess(self.walk_to_water(creature, 400), 400, (x, y))
+
+    def test_no_water_falls_back_and_cache_invalidates(self):
+        t = Terrain(200, 200, lakes=[])
+        field = t.flow_field()
+        self.assertIs(t.flow_field(), field)
+        self.assertIsNone(field.direction(50, 50))
+        t.set_water(199, 100)
+        self.assertIsNot(t.flow_field(), field)
+        self.assertEqual(t.flow_field().direction(50, 50)[0], 1)
+
+if __name__ == '__main__':
+    unittest.main()
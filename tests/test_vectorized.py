@@ -0,0 +1,98 @@
+import unittest
+import numpy as np
+from simulation.vectorized import VectorWorld, in_lake
+from simulation.vectorized import HUNGER_MAX, THIRST_MAX, THIRST_THRESHOLD, LAKE_X, LAKE_Y, LAKE_WIDTH, LAKE_HEIGHT
+from simulation.settings import SimulationConfig
+from simulation.world import World
+
+class TestVectorWorld(unittest.TestCase):
+    def setUp(self):
+        self.world = VectorWorld(creature_count=4, bush_count=4, seed=7)
+
+    def test_initial_state(self):
+        self.assertEqual(self.world.population, 4)
+        self.assertFalse(in_lake(self.world.x + 20, self.world.y + 20).any())
+        self.assertTrue(1 <= self.world.food_alive.sum(axis=1).min())
+        self.assertTrue(self.world.food_alive.sum(axis=1).max() <= 3)
+
+    def test_deaths_are_classified(self):
+        self.world.hunger[0] = HUNGER_MAX
+        self.world.thirst[1] = THIRST_MAX
+        self.world.energy[2] = 0.001
+        self.world.metabolism[2] = 1.0
+        self.world.thirst[2] = THIRST_THRESHOLD  # keep it moving rather than resting
+        self.world.update()
+        causes = self.world.death_causes
+        self.assertEqual(causes['starvation'], 1)
+        self.assertEqual(causes['dehydration'], 1)
+        self.assertEqual(causes['exhaustion'], 1)
+        self.assertEqual(self.world.population, 1)
+
+    def test_eating_resets_hunger_and_removes_food(self):
+        slot = np.flatnonzero(self.world.food_alive.ravel())[0]
+        self.world.x[0] = int(self.world.food_x.ravel()[slot])
+        self.world.y[0] = int(self.world.food_y.ravel()[slot])
+        self.world.hunger[0] = 50
+        self.world.resting[0] = True
+        self.world.energy[0] = 50  # keep resting so it stays on the food
+        self.world.update()
+        self.assertEqual(self.world.hunger[0], 0)
+        self.assertFalse(self.world.food_alive.ravel()[slot])
+
+    def test_lake_blocks_movement_and_drinking(self):
+        # Just above the lake, heading straight down to it
+        self.world.x[0] = LAKE_X + LAKE_WIDTH // 2 - 20
+        self.world.y[0] = LAKE_Y - 21
+        self.world.thirst[0] = THIRST_THRESHOLD
+        for _ in range(10):
+            self.world.update()
+        self.assertFalse(in_lake(self.world.x[0] + 20, self.world.y[0] + 20))
+        self.assertLess(self.world.thirst[0], THIRST_THRESHOLD)
+
+    def test_reproduction(self):
+        self.world.male[:] = [True, False, True, False]
+        self.world.x[:2] = 10
+        self.world.y[:2] = 10
+        self.world.x[2:] = 700
+        self.world.y[2:] = 10
+        self.world.age[:] = 601
+        self.world.update()
+        self.assertEqual(self.world.population, 6)
+        self.assertTrue((self.world.cooldown[:4] > 0).all())
+        self.assertTrue((self.world.age[4:] == 0).all())
+
+    def test_from_world_rejects_custom_settings(self):
+        VectorWorld.from_world(World(seed=3, creature_count=5, config=SimulationConfig(creature_count=5)))
+        with self.assertRaises(ValueError):
+            VectorWorld.from_world(World(seed=3, config=SimulationConfig(mutation_rate=0.5)))
+
+    def test_matches_object_engine_for_thirsty_creatures(self):
+        world = World(seed=3)
+        for c in world.creatures:
+            # Start along the top and bottom edges, well away from the lake
+            c.y = 0 if c.y < 300 else 560
+            c.thirst = THIRST_THRESHOLD
+            c.energy = 100
+        vec = VectorWorld.from_world(world)
+        for _ in range(30):
+            world.update()
+            vec.update()
+            # Once a creature drinks it starts wandering with its own random draws
+            if any(c.thirst < THIRST_THRESHOLD for c in world.creatures):
+                break
+        self.assertEqual([c.x for c in world.creatures], list(vec.x))
+        self.assertEqual([c.y for c in world.creatures], list(vec.y))
+        self.assertEqual([c.thirst for c in world.creatures], list(vec.thirst))
+        self.assertTrue(np.allclose([c.energy for c in world.creatures], vec.energy))
+
+    def test_seed_is_reproducible(self):
+        a = VectorWorld(creature_count=20, seed=1)
+        b = VectorWorld(creature_count=20, seed=1)
+        for _ in range(200):
+            a.update()
+            b.update()
+        self.assertTrue((a.x == b.x).all())
+        self.assertEqual(a.death_causes, b.death_causes)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import tempfile
+import threading
+import unittest
+import numpy as np
+from simulation.recorder import HistoryRecorder, load_history
+from simulation.writer import BackgroundWriter, write_json
+
+class TestBackgroundWriter(unittest.TestCase):
+    def test_jobs_run_in_order_and_close_drains(self):
+        done = []
+        writer = BackgroundWriter(maxsize=4)
+        for i in range(20):
+            writer.submit(done.append, i)
+        writer.close()
+        self.assertEqual(done, list(range(20)))
+        self.assertEqual(writer.written, 20)
+        with self.assertRaises(RuntimeError):
+            writer.submit(done.append, 99)
+
+    def test_full_queue_blocks_producer(self):
+        gate = threading.Event()
+        writer = BackgroundWriter(maxsize=1)
+        writer.submit(gate.wait)        # worker is stuck on this
+        writer.submit(lambda: None)     # fills the queue
+        blocked = threading.Thread(target=writer.submit, args=(lambda: None,))
+        blocked.start()
+        blocked.join(0.2)
+        self.assertTrue(blocked.is_alive())
+        gate.set()
+        blocked.join(2)
+        self.assertFalse(blocked.is_alive())
+        writer.close()
+        self.assertEqual(writer.pending, 0)
+
+    def test_errors_reach_the_producer(self):
+        writer = BackgroundWriter()
+        writer.submit(write_json, '/nonexistent-dir/x.json', {})
+        with self.assertRaises(OSError):
+            writer.flush()
+        writer.close()
+
+    def test_recorder_hands_chunks_to_writer(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with BackgroundWriter() as writer:
+                recorder = HistoryRecorder(os.path.join(tmp, 'h'), columns=('a',), chunk_rows=2, writer=writer)
+                for i in range(5):
+                    recorder.append((i,))
+                recorder.close()
+                np.testing.assert_array_equal(load_history(os.path.join(tmp, 'h'))['a'], np.arange(5))
+                self.assertEqual(writer.written, 3)
+
+if __name__ == '__main__':
+    unittest.main()